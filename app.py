@@ -4,7 +4,8 @@ Main entry point for the Streamlit application.
 """
 import streamlit as st
 
-from backend.data_handler import DataHandler
+from backend.data_handler import DatasetCatalog
+from ui.dataset_selector import render_dataset_selector
 from ui.sidebar import render_sidebar
 from ui.upload_page import render_upload_page
 from ui.ml_page import render_ml_page
@@ -18,6 +19,10 @@ def initialize_session_state() -> None:
         st.session_state.analysis_type = None
     if "profile_report_html" not in st.session_state:
         st.session_state.profile_report_html = None
+    if "training_job_id" not in st.session_state:
+        st.session_state.training_job_id = None
+    if "dataset" not in st.session_state:
+        st.session_state.dataset = None
 
 
 def main() -> None:
@@ -25,13 +30,15 @@ def main() -> None:
     # Initialize session state
     initialize_session_state()
 
-    # Load existing data if available
-    data_handler = DataHandler()
-    df = data_handler.load_source_data()
+    # Data stored before the dataset catalog existed becomes its first dataset
+    DatasetCatalog().import_source_data()
 
     # Render sidebar and get navigation choice
     choice = render_sidebar()
 
+    # Only the selected dataset version is loaded, and only on pages using it
+    df = render_dataset_selector() if choice in ("Upload", "ML") else None
+
     # Route to appropriate page based on user choice
     if choice == "Upload":
         df = render_upload_page(df)
@@ -0,0 +1,311 @@
+"""
+Command-line interface for AutoLearn.
+Runs profiling, training and batch scoring on headless workers with the same
+backend modules as the Streamlit app, without importing Streamlit.
+
+Usage:
+    autolearn profile data.csv --output report.html
+    autolearn train data.csv --analysis-type Classification --target label --preset fast
+    autolearn predict a.csv b.parquet --analysis-type Classification --workers 4
+    autolearn predict a.csv --version 20240101-120000-1a2b3c4d
+    autolearn export --dataset sales --output sales.csv
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from backend.data_handler import DataHandler, DatasetCatalog
+from backend.instrumentation import RunReport
+from backend.ml_predictor import MLPredictor
+from backend.ml_trainer import MLTrainer
+from backend.model_registry import ModelRegistry
+from backend.profiling import DataProfiler
+from config import (
+    ANALYSIS_TYPES,
+    DATA_DIR,
+    INFERENCE_CHUNK_SIZE,
+    PROFILE_MODES,
+    TRAINING_PRESETS,
+    TUNING_STRATEGIES,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _load_input(
+    path: Optional[str], dataset: Optional[str] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Read an input dataset.
+
+    Falls back to the named catalog dataset, then to the most recently
+    updated catalog dataset, then to the stored source data.
+    """
+    if path is None:
+        catalog = DatasetCatalog()
+        if dataset is None:
+            datasets = catalog.list_datasets()
+            if not datasets:
+                return DataHandler.load_source_data()
+            dataset = datasets[0]["name"]
+        logger.info(f"Using dataset {dataset}")
+        return catalog.load(dataset)
+    try:
+        df, _ = DataHandler.optimize_dtypes(DataHandler.read_dataset(path))
+        return df
+    except Exception as e:
+        logger.error(f"Error reading {path}: {e}")
+        return None
+
+
+def _profile(args: argparse.Namespace) -> int:
+    df = _load_input(args.input, args.dataset)
+    if df is None:
+        return 1
+
+    report = RunReport("profiling", input=args.input)
+    html = DataProfiler.get_profile_html(df, mode=args.mode, report=report)
+    if html is None:
+        return 1
+
+    Path(args.output).write_text(html, encoding="utf-8")
+    print(f"Profile report written to {args.output}")
+    if args.report:
+        report.save(Path(args.report))
+    return 0
+
+
+def _train(args: argparse.Namespace) -> int:
+    if args.analysis_type != "Clustering" and not args.target:
+        logger.error(f"--target is required for {args.analysis_type.lower()}")
+        return 2
+
+    df = _load_input(args.input, args.dataset)
+    if not DataHandler.validate_dataframe(df):
+        return 1
+
+    options = {
+        "preset": args.preset,
+        "fold": args.fold,
+        "budget_time": args.budget_time,
+        "n_jobs": args.n_jobs,
+        "tune": args.tune,
+        "tune_n_iter": args.tune_iter,
+        "tune_budget_time": args.tune_budget_time,
+        "sample_rows": args.sample_rows,
+        "refit_full": False if args.no_refit else None,
+        "export_onnx": True if args.export_onnx else None,
+    }
+    model, setup_df, compare_df, version = MLTrainer.train(
+        args.analysis_type, df, args.target, options, use_cache=not args.no_cache
+    )
+    if model is None:
+        return 1
+
+    print(compare_df.to_string())
+    print(f"Saved as model version {version}")
+    if args.report:
+        run_report = ModelRegistry().get(version).get("run_report", {})
+        Path(args.report).write_text(json.dumps(run_report, indent=2), encoding="utf-8")
+        print(f"Run report written to {args.report}")
+    return 0
+
+
+def _score_file(
+    version: str,
+    input_path: str,
+    output_path: str,
+    chunk_size: int,
+    write_report: bool = False,
+) -> Optional[Dict[str, float]]:
+    """Stream one input file through the model. Runs in a worker process."""
+    report = RunReport("inference", input=input_path, version=version)
+    stats = MLPredictor.predict_stream(
+        None,
+        DataHandler.iter_dataset_chunks(input_path, chunk_size),
+        output_path=Path(output_path),
+        version=version,
+        report=report if write_report else None,
+    )
+    if stats is not None and write_report:
+        report.save(Path(output_path).with_name(f"{Path(input_path).stem}_report.json"))
+    return stats
+
+
+def _predict(args: argparse.Namespace) -> int:
+    if args.version is None and args.analysis_type is None:
+        logger.error("Either --version or --analysis-type is required")
+        return 2
+
+    # Pin the version up front so every worker scores with the same model
+    metadata = MLPredictor.resolve_version(args.analysis_type, args.version)
+    if metadata is None:
+        return 1
+    version = metadata["version"]
+    print(f"Scoring with model version {version}")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = [
+        str(output_dir / f"{Path(path).stem}_predictions.csv") for path in args.inputs
+    ]
+    workers = max(1, min(args.workers, len(args.inputs)))
+
+    if workers == 1:
+        results = [
+            _score_file(version, path, output, args.chunk_size, args.report)
+            for path, output in zip(args.inputs, outputs)
+        ]
+    else:
+        # Each worker process loads the model once and scores whole files
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _score_file,
+                    [version] * len(args.inputs),
+                    args.inputs,
+                    outputs,
+                    [args.chunk_size] * len(args.inputs),
+                    [args.report] * len(args.inputs),
+                )
+            )
+
+    failed = 0
+    for path, output, stats in zip(args.inputs, outputs, results):
+        if stats is None:
+            failed += 1
+            print(f"{path}: failed")
+        else:
+            print(
+                f"{path}: {stats['rows']:,} rows -> {output} "
+                f"({stats['rows_per_sec']:,.0f} rows/sec)"
+            )
+    return 1 if failed else 0
+
+
+def _export(args: argparse.Namespace) -> int:
+    if args.version is not None and args.dataset is None:
+        logger.error("--version requires --dataset")
+        return 2
+
+    if args.version is not None:
+        df = DatasetCatalog().load(args.dataset, args.version)
+    else:
+        df = _load_input(None, args.dataset)
+    if df is None or not DataHandler.export_csv(df, args.output):
+        return 1
+    print(f"Exported {len(df):,} rows to {args.output}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="autolearn",
+        description="AutoLearn batch profiling, training, scoring and export",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    profile = subparsers.add_parser("profile", help="Generate a profile report")
+    profile.add_argument(
+        "input", nargs="?", help="CSV or Parquet file (default: latest catalog dataset)"
+    )
+    profile.add_argument("--dataset", help="Catalog dataset to use instead of a file")
+    profile.add_argument("--output", default="profile_report.html")
+    profile.add_argument("--mode", choices=PROFILE_MODES, default="auto")
+    profile.add_argument("--report", help="Write a JSON timing report to this path")
+    profile.set_defaults(handler=_profile)
+
+    train = subparsers.add_parser("train", help="Train and save the best model")
+    train.add_argument(
+        "input", nargs="?", help="CSV or Parquet file (default: latest catalog dataset)"
+    )
+    train.add_argument("--dataset", help="Catalog dataset to use instead of a file")
+    train.add_argument("--analysis-type", choices=ANALYSIS_TYPES, required=True)
+    train.add_argument("--target", help="Target column (regression/classification)")
+    train.add_argument("--preset", choices=list(TRAINING_PRESETS))
+    train.add_argument("--fold", type=int)
+    train.add_argument("--budget-time", type=float, help="Minutes, 0 = unlimited")
+    train.add_argument("--n-jobs", type=int)
+    train.add_argument("--tune", choices=list(TUNING_STRATEGIES), help="Search strategy")
+    train.add_argument("--tune-iter", type=int, help="Tuning iterations")
+    train.add_argument(
+        "--tune-budget-time", type=float, help="Tuning minutes, 0 = unlimited"
+    )
+    train.add_argument(
+        "--sample-rows",
+        type=int,
+        help="Select models on a sample above this many rows, 0 = all rows",
+    )
+    train.add_argument(
+        "--no-refit",
+        action="store_true",
+        help="Keep the model fitted on the sample instead of refitting on all rows",
+    )
+    train.add_argument(
+        "--export-onnx",
+        action="store_true",
+        help="Also export the model to ONNX (needs skl2onnx and onnxruntime)",
+    )
+    train.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Retrain even if an identical experiment was run before",
+    )
+    train.add_argument("--report", help="Write the JSON run report to this path")
+    train.set_defaults(handler=_train)
+
+    predict = subparsers.add_parser("predict", help="Score files with the saved model")
+    predict.add_argument("inputs", nargs="+", help="CSV or Parquet files to score")
+    predict.add_argument(
+        "--analysis-type",
+        choices=ANALYSIS_TYPES,
+        help="Score with the newest model of this type",
+    )
+    predict.add_argument("--version", help="Model registry version to score with")
+    predict.add_argument("--output-dir", default=str(DATA_DIR))
+    predict.add_argument("--chunk-size", type=int, default=INFERENCE_CHUNK_SIZE)
+    predict.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    predict.add_argument(
+        "--report",
+        action="store_true",
+        help="Write a JSON timing report next to each predictions file",
+    )
+    predict.set_defaults(handler=_predict)
+
+    export = subparsers.add_parser("export", help="Export a dataset as CSV")
+    export.add_argument(
+        "--dataset", help="Catalog dataset to export (default: latest catalog dataset)"
+    )
+    export.add_argument("--version", help="Dataset version (default: newest)")
+    export.add_argument("--output", default="dataset.csv")
+    export.set_defaults(handler=_export)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the AutoLearn command line.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv.
+
+    Returns:
+        Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
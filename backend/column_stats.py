@@ -0,0 +1,418 @@
+"""
+Column statistics module for AutoLearn.
+Mergeable per-column summary statistics for incremental profiling.
+
+Statistics of two row sets can be merged without revisiting either, so a
+dataset that grows by appended rows is summarized in time proportional to
+the new rows. Counts, missing values, min/max and moments are exact (moments
+are merged with the pairwise update of Chan et al. and Pébay); histograms
+and distinct counts are sketches.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    PROFILE_STATS_HISTOGRAM_BINS,
+    PROFILE_STATS_HLL_PRECISION,
+    PROFILE_STATS_MAX_CATEGORIES,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Histogram bins are kept within this many bits of the values' magnitude, so
+# bin indices always fit in an int64
+_HISTOGRAM_RELATIVE_BITS = 40
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Number of significant bits of each uint64 value, computed exactly."""
+    values = values.copy()
+    bits = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        bits[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    return bits + (values > 0)
+
+
+@dataclass
+class HyperLogLog:
+    """HyperLogLog sketch of the number of distinct values."""
+
+    precision: int = PROFILE_STATS_HLL_PRECISION
+    registers: np.ndarray = None
+
+    def __post_init__(self):
+        if self.registers is None:
+            self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    def add(self, values: pd.Series) -> None:
+        """Add the non-missing values of a Series."""
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        remainder = hashes << np.uint64(self.precision)
+        # Position of the first set bit in the remaining 64 - precision bits
+        rank = np.minimum(64 - _bit_length(remainder) + 1, 64 - self.precision + 1)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Return the sketch of the union of both value sets."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        return HyperLogLog(self.precision, np.maximum(self.registers, other.registers))
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+@dataclass
+class Histogram:
+    """
+    Histogram with power-of-two bin widths anchored at zero.
+
+    Any two such histograms can be aligned by widening the narrower one, so
+    merging is exact at the coarser resolution. Bins are widened whenever
+    the values span more than max_bins of them.
+    """
+
+    max_bins: int = PROFILE_STATS_HISTOGRAM_BINS
+    exponent: Optional[int] = None
+    counts: Dict[int, int] = field(default_factory=dict)
+
+    def _required_exponent(self, low: float, high: float) -> int:
+        width = max(
+            (high - low) / self.max_bins,
+            max(abs(low), abs(high)) * 2.0**-_HISTOGRAM_RELATIVE_BITS,
+            np.finfo(np.float64).tiny,
+        )
+        return int(np.ceil(np.log2(width)))
+
+    def _coarsen(self, exponent: int) -> None:
+        if self.exponent is None or exponent <= self.exponent:
+            return
+        factor = 1 << (exponent - self.exponent)
+        counts: Dict[int, int] = {}
+        for index, count in self.counts.items():
+            counts[index // factor] = counts.get(index // factor, 0) + count
+        self.counts, self.exponent = counts, exponent
+
+    def _fit(self) -> None:
+        while self.counts and max(self.counts) - min(self.counts) + 1 > self.max_bins:
+            self._coarsen(self.exponent + 1)
+
+    def _range(self) -> Tuple[float, float]:
+        width = 2.0**self.exponent
+        return min(self.counts) * width, (max(self.counts) + 1) * width
+
+    def add(self, values: np.ndarray) -> None:
+        """Add finite float values."""
+        if len(values) == 0:
+            return
+        low, high = float(values.min()), float(values.max())
+        if self.counts:
+            current_low, current_high = self._range()
+            low, high = min(low, current_low), max(high, current_high)
+        exponent = self._required_exponent(low, high)
+        if self.exponent is None:
+            self.exponent = exponent
+        self._coarsen(exponent)
+
+        index, counts = np.unique(
+            np.floor(values / 2.0**self.exponent).astype(np.int64), return_counts=True
+        )
+        for i, count in zip(index.tolist(), counts.tolist()):
+            self.counts[i] = self.counts.get(i, 0) + count
+        self._fit()
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Return the histogram of both value sets."""
+        if not other.counts:
+            return Histogram(self.max_bins, self.exponent, dict(self.counts))
+        if not self.counts:
+            return Histogram(self.max_bins, other.exponent, dict(other.counts))
+        merged = Histogram(self.max_bins, self.exponent, dict(self.counts))
+        aligned = Histogram(other.max_bins, other.exponent, dict(other.counts))
+        exponent = max(merged.exponent, aligned.exponent)
+        merged._coarsen(exponent)
+        aligned._coarsen(exponent)
+        for index, count in aligned.counts.items():
+            merged.counts[index] = merged.counts.get(index, 0) + count
+        merged._fit()
+        return merged
+
+    def bins(self) -> List[Tuple[float, float, int]]:
+        """Return (left edge, right edge, count) for every non-empty bin."""
+        width = 2.0**self.exponent if self.exponent is not None else 0.0
+        return [
+            (index * width, (index + 1) * width, self.counts[index])
+            for index in sorted(self.counts)
+        ]
+
+
+@dataclass
+class NumericStats:
+    """Count, extremes and central moments of the non-missing values."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    m3: float = 0.0
+    m4: float = 0.0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    histogram: Histogram = field(default_factory=Histogram)
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "NumericStats":
+        """Compute the statistics of a float array without missing values."""
+        if len(values) == 0:
+            return cls()
+        mean = float(values.mean())
+        deviations = values - mean
+        squared = deviations * deviations
+        histogram = Histogram()
+        histogram.add(values[np.isfinite(values)])
+        return cls(
+            count=len(values),
+            mean=mean,
+            m2=float(squared.sum()),
+            m3=float((squared * deviations).sum()),
+            m4=float((squared * squared).sum()),
+            minimum=float(values.min()),
+            maximum=float(values.max()),
+            histogram=histogram,
+        )
+
+    def merge(self, other: "NumericStats") -> "NumericStats":
+        """Return the statistics of both value sets."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta**2 * na * nb / n
+        m3 = (
+            self.m3
+            + other.m3
+            + delta**3 * na * nb * (na - nb) / n**2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / n
+        )
+        m4 = (
+            self.m4
+            + other.m4
+            + delta**4 * na * nb * (na * na - na * nb + nb * nb) / n**3
+            + 6 * delta**2 * (na * na * other.m2 + nb * nb * self.m2) / n**2
+            + 4 * delta * (na * other.m3 - nb * self.m3) / n
+        )
+        return NumericStats(
+            count=n,
+            mean=self.mean + delta * nb / n,
+            m2=m2,
+            m3=m3,
+            m4=m4,
+            minimum=min(self.minimum, other.minimum),
+            maximum=max(self.maximum, other.maximum),
+            histogram=self.histogram.merge(other.histogram),
+        )
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    @property
+    def skewness(self) -> float:
+        """Population skewness."""
+        if self.count < 2 or self.m2 == 0:
+            return np.nan
+        return float(np.sqrt(self.count) * self.m3 / self.m2**1.5)
+
+    @property
+    def kurtosis(self) -> float:
+        """Population excess kurtosis."""
+        if self.count < 2 or self.m2 == 0:
+            return np.nan
+        return float(self.count * self.m4 / self.m2**2 - 3)
+
+
+@dataclass
+class ColumnStats:
+    """Mergeable summary of one column."""
+
+    dtype: str
+    rows: int = 0
+    missing: int = 0
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+    numeric: Optional[NumericStats] = None
+    # Exact value counts of non-numeric columns, dropped (None) once there
+    # are more than PROFILE_STATS_MAX_CATEGORIES distinct values
+    value_counts: Optional[Dict[Any, int]] = None
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ColumnStats":
+        """Compute the statistics of a column."""
+        present = series.dropna()
+        stats = cls(
+            dtype=str(series.dtype),
+            rows=len(series),
+            missing=len(series) - len(present),
+        )
+        stats.distinct.add(present)
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = present.astype("int64").to_numpy(dtype=np.float64)
+            stats.numeric = NumericStats.from_values(values)
+        elif pd.api.types.is_numeric_dtype(series):
+            stats.numeric = NumericStats.from_values(present.to_numpy(dtype=np.float64))
+        else:
+            counts = present.value_counts(sort=False)
+            if len(counts) <= PROFILE_STATS_MAX_CATEGORIES:
+                stats.value_counts = {
+                    key: int(count) for key, count in counts.items() if count > 0
+                }
+        return stats
+
+    def merge(self, other: "ColumnStats") -> "ColumnStats":
+        """Return the statistics of both row sets."""
+        value_counts = None
+        if self.value_counts is not None and other.value_counts is not None:
+            value_counts = dict(self.value_counts)
+            for key, count in other.value_counts.items():
+                value_counts[key] = value_counts.get(key, 0) + count
+            if len(value_counts) > PROFILE_STATS_MAX_CATEGORIES:
+                value_counts = None
+
+        numeric = None
+        if self.numeric is not None and other.numeric is not None:
+            numeric = self.numeric.merge(other.numeric)
+        return ColumnStats(
+            dtype=self.dtype,
+            rows=self.rows + other.rows,
+            missing=self.missing + other.missing,
+            distinct=self.distinct.merge(other.distinct),
+            numeric=numeric,
+            value_counts=value_counts,
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Describe the column as a flat dictionary for display."""
+        summary: Dict[str, Any] = {
+            "dtype": self.dtype,
+            "count": self.rows - self.missing,
+            "missing": self.missing,
+            "missing %": 100.0 * self.missing / self.rows if self.rows else 0.0,
+            "distinct (approx.)": self.distinct.estimate(),
+        }
+        if self.numeric is not None and self.numeric.count:
+            numeric = self.numeric
+            if self.dtype.startswith("datetime64"):
+                to_time = pd.Timestamp
+                summary.update(
+                    min=to_time(int(numeric.minimum)),
+                    max=to_time(int(numeric.maximum)),
+                    mean=to_time(int(numeric.mean)),
+                )
+            else:
+                summary.update(
+                    mean=numeric.mean,
+                    std=numeric.std,
+                    min=numeric.minimum,
+                    max=numeric.maximum,
+                    skewness=numeric.skewness,
+                    kurtosis=numeric.kurtosis,
+                )
+        if self.value_counts:
+            top, freq = max(self.value_counts.items(), key=lambda item: item[1])
+            summary.update(top=top, freq=freq)
+        return summary
+
+
+@dataclass
+class DatasetStats:
+    """Mergeable summary of every column of a dataset."""
+
+    rows: int = 0
+    columns: Dict[str, ColumnStats] = field(default_factory=dict)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "DatasetStats":
+        """
+        Compute the statistics of a DataFrame.
+
+        Args:
+            df: DataFrame to summarize.
+
+        Returns:
+            The dataset statistics.
+        """
+        return cls(
+            rows=len(df),
+            columns={
+                str(column): ColumnStats.from_series(df[column])
+                for column in df.columns
+            },
+        )
+
+    def merge(self, other: "DatasetStats") -> "DatasetStats":
+        """
+        Combine with the statistics of rows from a dataset with the same columns.
+
+        Args:
+            other: Statistics of the other rows.
+
+        Returns:
+            Statistics of all rows.
+        """
+        if list(self.columns) != list(other.columns):
+            raise ValueError(
+                "Cannot merge statistics of datasets with different columns"
+            )
+        return DatasetStats(
+            rows=self.rows + other.rows,
+            columns={
+                name: stats.merge(other.columns[name])
+                for name, stats in self.columns.items()
+            },
+        )
+
+    def update(self, new_rows: pd.DataFrame) -> "DatasetStats":
+        """
+        Add appended rows, touching only the new rows.
+
+        Args:
+            new_rows: Rows appended to the dataset.
+
+        Returns:
+            Statistics of all rows.
+        """
+        return self.merge(DatasetStats.from_dataframe(new_rows))
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Tabulate the statistics, one row per column.
+
+        Returns:
+            DataFrame indexed by column name.
+        """
+        return pd.DataFrame.from_dict(
+            {name: stats.summary() for name, stats in self.columns.items()},
+            orient="index",
+        )
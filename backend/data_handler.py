@@ -2,35 +2,171 @@
 Data handler module for AutoLearn.
 Handles all data I/O operations including loading, saving, and managing datasets.
 """
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
-from config import SOURCE_DATA_PATH, PREDICTIONS_PATH
+from config import (
+    DATASET_CACHE_MAX_BYTES,
+    DATASET_CATALOG_DIR,
+    DATASET_CATALOG_MAX_VERSIONS,
+    INGEST_CATEGORY_MAX_RATIO,
+    INGEST_DATETIME_MIN_PARSED,
+    INGEST_DATETIME_SAMPLE_ROWS,
+    INGEST_DOWNCAST_FLOATS,
+    LEGACY_SOURCE_DATA_PATH,
+    PREDICTIONS_PATH,
+    SOURCE_DATA_MEMORY_MAP,
+    SOURCE_DATA_PATH,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DATASET_FILENAME = "data.parquet"
+DATASET_METADATA_FILENAME = "metadata.json"
+DATASET_STATS_FILENAME = "stats.pkl"
+# Name of the catalog dataset that stored source data is imported as
+SOURCE_DATASET_NAME = "sourcedata"
+
+
+class DatasetCache:
+    """
+    Process-wide cache of parsed datasets.
+
+    Entries are keyed by file path and validated against the file's size and
+    mtime, so a file rewritten on disk is re-read on next use. Least recently
+    used datasets are evicted once their combined in-memory size exceeds the
+    budget. Cached frames are shared between callers and must not be mutated.
+    """
+
+    _lock = threading.Lock()
+    _entries: "OrderedDict[str, Tuple[Tuple[int, int], pd.DataFrame, int]]" = (
+        OrderedDict()
+    )
+    max_bytes = DATASET_CACHE_MAX_BYTES
+
+    @staticmethod
+    def _file_signature(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def get(cls, path: Path) -> Optional[pd.DataFrame]:
+        """
+        Return the cached dataset for a file if it is still current.
+
+        Args:
+            path: Dataset file on disk.
+
+        Returns:
+            Cached DataFrame, or None on a miss.
+        """
+        key = str(Path(path).resolve())
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            try:
+                current = cls._file_signature(Path(path))
+            except FileNotFoundError:
+                current = None
+            if entry[0] != current:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return entry[1]
+
+    @classmethod
+    def put(cls, path: Path, df: pd.DataFrame) -> None:
+        """
+        Cache the parsed contents of a dataset file.
+
+        Args:
+            path: Dataset file on disk, already containing df.
+            df: Parsed DataFrame.
+        """
+        key = str(Path(path).resolve())
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with cls._lock:
+            cls._entries.pop(key, None)
+            if nbytes > cls.max_bytes:
+                logger.info(f"Dataset {path} is larger than the cache budget")
+                return
+            cls._entries[key] = (cls._file_signature(Path(path)), df, nbytes)
+
+            total = sum(entry[2] for entry in cls._entries.values())
+            while total > cls.max_bytes:
+                evicted_key, (_, _, evicted_bytes) = cls._entries.popitem(last=False)
+                total -= evicted_bytes
+                logger.info(f"Evicted cached dataset {evicted_key}")
+
+    @classmethod
+    def invalidate(cls, path: Optional[Path] = None) -> None:
+        """
+        Drop cached datasets.
+
+        Args:
+            path: Dataset file to drop. Clears the whole cache when None.
+        """
+        with cls._lock:
+            if path is None:
+                cls._entries.clear()
+            else:
+                cls._entries.pop(str(Path(path).resolve()), None)
+
 
 class DataHandler:
     """Manages data loading, saving, and validation operations."""
 
     @staticmethod
-    def load_source_data() -> Optional[pd.DataFrame]:
+    def load_source_data(
+        memory_map: bool = SOURCE_DATA_MEMORY_MAP,
+    ) -> Optional[pd.DataFrame]:
         """
         Load source data from the configured path.
 
+        Parsed data is served from the process-wide DatasetCache until the
+        file changes, so callers must not mutate the returned DataFrame.
+        Source data saved as CSV by older versions is migrated to Parquet on
+        first load.
+
+        Args:
+            memory_map: Memory-map the Parquet file instead of reading it into
+                a buffer first.
+
         Returns:
             DataFrame if data exists, None otherwise.
         """
         try:
             if SOURCE_DATA_PATH.exists():
+                df = DatasetCache.get(SOURCE_DATA_PATH)
+                if df is not None:
+                    return df
+
                 logger.info(f"Loading data from {SOURCE_DATA_PATH}")
-                df = pd.read_csv(SOURCE_DATA_PATH, index_col=False)
+                df = pd.read_parquet(SOURCE_DATA_PATH, memory_map=memory_map)
                 logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
+                DatasetCache.put(SOURCE_DATA_PATH, df)
+                return df
+            elif LEGACY_SOURCE_DATA_PATH.exists():
+                logger.info(f"Migrating CSV source data from {LEGACY_SOURCE_DATA_PATH}")
+                df = DataHandler.import_csv(LEGACY_SOURCE_DATA_PATH)
+                df, _ = DataHandler.optimize_dtypes(df)
+                DataHandler.save_source_data(df)
                 return df
             else:
                 logger.warning(f"Source data not found at {SOURCE_DATA_PATH}")
@@ -42,7 +178,7 @@ class DataHandler:
     @staticmethod
     def save_source_data(df: pd.DataFrame) -> bool:
         """
-        Save DataFrame as source data.
+        Save DataFrame as source data in Parquet format.
 
         Args:
             df: DataFrame to save.
@@ -50,12 +186,247 @@ class DataHandler:
         Returns:
             True if successful, False otherwise.
         """
+        tmp_path = SOURCE_DATA_PATH.with_suffix(f".{uuid.uuid4().hex}.tmp")
         try:
-            df.to_csv(SOURCE_DATA_PATH, index=False)
+            written = DataHandler._write_parquet(df, tmp_path)
+            # Readers never see a partially written file
+            os.replace(tmp_path, SOURCE_DATA_PATH)
+            DatasetCache.put(SOURCE_DATA_PATH, written)
             logger.info(f"Saved source data to {SOURCE_DATA_PATH}")
             return True
         except Exception as e:
             logger.error(f"Error saving source data: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+    @staticmethod
+    def concat_rows(existing: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append rows to a DataFrame, casting them to its dtypes.
+
+        Args:
+            existing: DataFrame to append to.
+            new_rows: Rows with the same columns as existing, in any order.
+
+        Returns:
+            The combined DataFrame with a fresh RangeIndex.
+
+        Raises:
+            ValueError: If the columns differ.
+        """
+        new_rows = new_rows.rename(columns=str)
+        if set(new_rows.columns) != set(existing.columns):
+            raise ValueError(
+                "Cannot append rows with different columns: "
+                f"{sorted(set(new_rows.columns) ^ set(existing.columns))}"
+            )
+
+        new_rows = DataHandler.apply_schema(
+            new_rows[list(existing.columns)], DataHandler.get_schema(existing)
+        )
+        # Concatenating categoricals with different categories yields object
+        # columns, so both sides get the union of the categories
+        for column in existing.select_dtypes(include="category").columns:
+            if isinstance(new_rows[column].dtype, pd.CategoricalDtype):
+                union = existing[column].cat.categories.union(
+                    new_rows[column].cat.categories
+                )
+                existing = existing.assign(
+                    **{column: existing[column].cat.set_categories(union)}
+                )
+                new_rows[column] = new_rows[column].cat.set_categories(union)
+        return pd.concat([existing, new_rows], ignore_index=True)
+
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, path: Path) -> pd.DataFrame:
+        """
+        Write a DataFrame to Parquet, stringifying mixed-type object columns.
+
+        Returns:
+            The DataFrame as written, matching what reading the file returns.
+            It never shares data with df, so callers can cache it.
+        """
+        original = df
+        if not all(isinstance(column, str) for column in df.columns):
+            df = df.rename(columns=str)
+        if not isinstance(df.index, pd.RangeIndex):
+            df = df.reset_index(drop=True)
+        try:
+            df.to_parquet(path, index=False)
+        except (TypeError, ValueError) as e:
+            # pyarrow rejects object columns mixing e.g. numbers and strings
+            logger.warning(f"Storing mixed-type columns as strings: {e}")
+            object_columns = df.select_dtypes(include="object").columns
+            df = df.astype({column: str for column in object_columns})
+            df.to_parquet(path, index=False)
+        if df is original:
+            # The caller may keep editing its frame; the cache must not see that
+            df = df.copy()
+        return df
+
+    @staticmethod
+    def import_csv(source: Union[str, Path, IO]) -> pd.DataFrame:
+        """
+        Read a CSV file into a DataFrame.
+
+        Args:
+            source: Path or file-like object to read.
+
+        Returns:
+            Parsed DataFrame.
+        """
+        return pd.read_csv(source, index_col=False)
+
+    @staticmethod
+    def optimize_dtypes(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Shrink a DataFrame's memory footprint by choosing compact dtypes.
+
+        Integers are downcast to the smallest integer type holding their
+        range, floats to float32 (see INGEST_DOWNCAST_FLOATS), string columns
+        that parse as dates become datetime64, and low-cardinality string
+        columns become category.
+
+        Args:
+            df: DataFrame as parsed, e.g. by import_csv.
+
+        Returns:
+            Tuple of (optimized DataFrame, stats) where stats holds
+            bytes_before, bytes_after and the resulting schema.
+        """
+        bytes_before = int(df.memory_usage(deep=True).sum())
+        columns = {}
+        for column in df.columns:
+            try:
+                columns[column] = DataHandler._optimize_column(df[column])
+            except Exception as e:
+                logger.warning(f"Keeping dtype of column {column}: {e}")
+                columns[column] = df[column]
+        optimized = pd.DataFrame(columns, index=df.index)
+
+        bytes_after = int(optimized.memory_usage(deep=True).sum())
+        logger.info(
+            f"Optimized dtypes: {bytes_before / 1e6:.1f} MB -> {bytes_after / 1e6:.1f} MB"
+        )
+        return optimized, {
+            "bytes_before": bytes_before,
+            "bytes_after": bytes_after,
+            "schema": DataHandler.get_schema(optimized),
+        }
+
+    @staticmethod
+    def _optimize_column(series: pd.Series) -> pd.Series:
+        """Return a column converted to its most compact suitable dtype."""
+        if pd.api.types.is_bool_dtype(series) or isinstance(
+            series.dtype, pd.CategoricalDtype
+        ):
+            return series
+        if pd.api.types.is_integer_dtype(series):
+            return pd.to_numeric(series, downcast="integer")
+        if pd.api.types.is_float_dtype(series):
+            if INGEST_DOWNCAST_FLOATS:
+                return pd.to_numeric(series, downcast="float")
+            return series
+        if not pd.api.types.is_string_dtype(series) and series.dtype != object:
+            return series
+
+        non_null = series.dropna()
+        if non_null.empty:
+            return series
+
+        sample = non_null.head(INGEST_DATETIME_SAMPLE_ROWS).astype(str)
+        # Require a date separator so plain numbers or codes are never dates
+        if sample.str.contains(r"\d[-/:]\d", regex=True).all():
+            parsed = pd.to_datetime(sample, errors="coerce")
+            if parsed.notna().mean() >= INGEST_DATETIME_MIN_PARSED:
+                return pd.to_datetime(series, errors="coerce")
+
+        if non_null.nunique() <= INGEST_CATEGORY_MAX_RATIO * len(series):
+            return series.astype("category")
+        return series
+
+    @staticmethod
+    def get_schema(df: pd.DataFrame) -> Dict[str, str]:
+        """
+        Describe a DataFrame's columns as a column name to dtype mapping.
+
+        Args:
+            df: DataFrame to describe.
+
+        Returns:
+            Dictionary of column name to dtype string.
+        """
+        return {str(column): str(dtype) for column, dtype in df.dtypes.items()}
+
+    @staticmethod
+    def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+        """
+        Cast columns to the dtypes recorded in a schema.
+
+        Used on inference inputs so they match the dtypes a model was trained
+        on. Columns missing from the schema are left alone, and a column is
+        kept as read when its values cannot be represented in the recorded
+        dtype (e.g. an int8 column receiving values above 127).
+
+        Args:
+            df: DataFrame to cast.
+            schema: Column name to dtype mapping from get_schema.
+
+        Returns:
+            DataFrame with the schema's dtypes where possible.
+        """
+        columns = {}
+        for column in df.columns:
+            dtype = schema.get(str(column))
+            series = df[column]
+            if dtype is None or str(series.dtype) == dtype:
+                columns[column] = series
+                continue
+            try:
+                columns[column] = DataHandler._cast_column(series, dtype)
+            except (TypeError, ValueError, OverflowError) as e:
+                logger.warning(f"Could not cast column {column} to {dtype}: {e}")
+                columns[column] = series
+        return pd.DataFrame(columns, index=df.index)
+
+    @staticmethod
+    def _cast_column(series: pd.Series, dtype: str) -> pd.Series:
+        """Cast a column to a schema dtype, raising ValueError if unsafe."""
+        if dtype == "category":
+            return series.astype("category")
+        if dtype.startswith("datetime64"):
+            return pd.to_datetime(series, errors="coerce")
+        if dtype.startswith(("int", "uint")):
+            values = pd.to_numeric(series)
+            info = np.iinfo(dtype)
+            if values.isna().any() or (values % 1 != 0).any():
+                raise ValueError("values are missing or not integral")
+            if values.min() < info.min or values.max() > info.max:
+                raise ValueError(f"values outside the {dtype} range")
+            return values.astype(dtype)
+        if dtype.startswith("float"):
+            return pd.to_numeric(series).astype(dtype)
+        # object, string and bool columns are used as read
+        return series
+
+    @staticmethod
+    def export_csv(df: pd.DataFrame, path: Union[str, Path]) -> bool:
+        """
+        Export a dataset as CSV, for tools that cannot read Parquet.
+
+        Args:
+            df: Dataset to export.
+            path: Destination CSV path.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            df.to_csv(path, index=False)
+            logger.info(f"Exported {len(df)} rows to {path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error exporting dataset to {path}: {e}")
             return False
 
     @staticmethod
@@ -77,6 +448,174 @@ class DataHandler:
             logger.error(f"Error saving predictions: {e}")
             return False
 
+    @staticmethod
+    def read_dataset(path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read a dataset file, choosing the format from its extension.
+
+        Args:
+            path: Parquet (.parquet), Arrow IPC (.arrow, .feather) or CSV file.
+
+        Returns:
+            Parsed DataFrame.
+        """
+        suffix = Path(path).suffix.lower()
+        if suffix == ".parquet":
+            return pd.read_parquet(path)
+        if suffix in (".arrow", ".feather"):
+            return pd.read_feather(path)
+        return DataHandler.import_csv(path)
+
+    @staticmethod
+    def iter_dataset_chunks(
+        path: Union[str, Path], chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a dataset file in fixed-size chunks.
+
+        Parquet files are streamed by record batch; other formats are
+        handled as CSV.
+
+        Args:
+            path: Parquet or CSV file.
+            chunksize: Number of rows per chunk.
+
+        Returns:
+            Iterator over DataFrame chunks.
+        """
+        if Path(path).suffix.lower() != ".parquet":
+            return DataHandler.iter_csv_chunks(path, chunksize)
+
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        return (
+            batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunksize)
+        )
+
+    @staticmethod
+    def iter_csv_chunks(
+        source: Union[str, Path, IO], chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in fixed-size chunks.
+
+        Args:
+            source: Path or file-like object to read.
+            chunksize: Number of rows per chunk.
+
+        Returns:
+            Iterator over DataFrame chunks.
+        """
+        logger.info(f"Reading CSV in chunks of {chunksize} rows")
+        return iter(pd.read_csv(source, index_col=False, chunksize=chunksize))
+
+    @staticmethod
+    def predictions_path(path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Resolve a predictions output path.
+
+        Args:
+            path: Output CSV path. Defaults to the configured predictions path.
+
+        Returns:
+            The output path.
+        """
+        return Path(path or PREDICTIONS_PATH)
+
+    @staticmethod
+    def append_predictions(
+        predictions: pd.DataFrame,
+        first_chunk: bool,
+        path: Optional[Union[str, Path]] = None,
+    ) -> bool:
+        """
+        Append a chunk of predictions to the predictions file.
+
+        Args:
+            predictions: Predictions for one chunk.
+            first_chunk: Whether this is the first chunk, which truncates the
+                file and writes the header.
+            path: Output CSV path. Defaults to the configured predictions path.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            predictions.to_csv(
+                path or PREDICTIONS_PATH,
+                mode="w" if first_chunk else "a",
+                header=first_chunk,
+                index=False,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error appending predictions: {e}")
+            return False
+
+    @staticmethod
+    def hash_dataframe(df: pd.DataFrame) -> str:
+        """
+        Compute a content hash of a DataFrame.
+
+        The hash covers column names, dtypes and cell values, so two frames
+        with identical contents hash the same regardless of where they came from.
+
+        Args:
+            df: DataFrame to hash.
+
+        Returns:
+            Hex digest identifying the DataFrame contents.
+        """
+        digest = hashlib.sha256()
+        digest.update(repr(list(df.columns)).encode())
+        digest.update(repr([str(dtype) for dtype in df.dtypes]).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def sample_rows(
+        df: pd.DataFrame,
+        n_rows: int,
+        strata: Optional[pd.Series] = None,
+        random_state: int = 42,
+        min_per_stratum: int = 0,
+    ) -> pd.DataFrame:
+        """
+        Sample rows, optionally stratified, keeping the original row order.
+
+        Stratified sampling draws the same fraction from every stratum (missing
+        values form their own stratum), so rare values keep their share of the
+        sample. min_per_stratum raises small strata to at least that many rows
+        (or all of their rows), e.g. so every class survives cross-validation.
+
+        Args:
+            df: DataFrame to sample.
+            n_rows: Target number of rows.
+            strata: Optional stratum label for every row of df.
+            random_state: Random seed.
+            min_per_stratum: Minimum rows to keep from each stratum.
+
+        Returns:
+            The sampled DataFrame, or df itself when it is already small enough.
+        """
+        if len(df) <= n_rows:
+            return df
+        rng = np.random.default_rng(random_state)
+        if strata is None:
+            return df.iloc[np.sort(rng.choice(len(df), size=n_rows, replace=False))]
+
+        codes, _ = pd.factorize(strata, use_na_sentinel=False)
+        sizes = np.bincount(codes)
+        quotas = np.maximum(
+            np.round(sizes * n_rows / len(df)), np.minimum(sizes, min_per_stratum)
+        )
+        # Rank rows by a random key within their stratum and keep each
+        # stratum's first quota rows
+        keys = rng.random(len(df))
+        ranks = pd.Series(keys).groupby(codes).rank(method="first").to_numpy()
+        return df[ranks <= quotas[codes]]
+
     @staticmethod
     def validate_dataframe(df: pd.DataFrame) -> bool:
         """
@@ -98,3 +637,295 @@ class DataHandler:
 
         logger.info("DataFrame validation passed")
         return True
+
+
+class DatasetCatalog:
+    """
+    Named, versioned datasets stored as Parquet.
+
+    Each version lives in DATASET_CATALOG_DIR/<name>/<version> with its data
+    and a metadata.json (schema, row count, sizes, content hash). Names are
+    normalized with normalize_name by every method, so they always resolve
+    inside the catalog directory. Versions
+    are immutable: uploads and appends add a version, staged in a hidden
+    directory and renamed into place once complete. Data is read only when a
+    version is loaded and is then served from the shared DatasetCache, which
+    keeps parsed datasets within DATASET_CACHE_MAX_BYTES.
+    """
+
+    def __init__(
+        self,
+        catalog_dir: Path = DATASET_CATALOG_DIR,
+        max_versions: int = DATASET_CATALOG_MAX_VERSIONS,
+    ):
+        self.catalog_dir = Path(catalog_dir)
+        self.max_versions = max_versions
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Turn a free-form name (e.g. a file name stem) into a dataset name.
+
+        Args:
+            name: Name to normalize.
+
+        Returns:
+            Name made of letters, digits, "_", "-" and ".", not starting with ".".
+        """
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(name)).strip("._")
+        return name or "dataset"
+
+    def _dataset_dir(self, name: str) -> Path:
+        # Every public method takes names as typed, e.g. "My Data" for My_Data
+        return self.catalog_dir / self.normalize_name(name)
+
+    def _version_dir(self, name: str, version: str) -> Path:
+        if not re.fullmatch(r"[A-Za-z0-9_-][A-Za-z0-9_.-]*", str(version)):
+            raise ValueError(f"Invalid dataset version: {version!r}")
+        return self._dataset_dir(name) / version
+
+    def add(
+        self, name: str, df: pd.DataFrame, parent: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Store a DataFrame as the newest version of a dataset.
+
+        Nothing is written when the newest version already has the same
+        contents; its metadata is returned instead.
+
+        Args:
+            name: Dataset name, normalized with normalize_name.
+            df: Data to store.
+            parent: Version this one was derived from (e.g. appended to).
+
+        Returns:
+            Metadata of the stored version, or None on failure.
+        """
+        name = self.normalize_name(name)
+        version = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        staging_dir = self._dataset_dir(name) / f".staging-{version}"
+        try:
+            data_hash = DataHandler.hash_dataframe(df)
+            latest = self.latest(name)
+            if latest is not None and latest["data_hash"] == data_hash:
+                logger.info(f"Dataset {name} is unchanged, keeping {latest['version']}")
+                return latest
+
+            staging_dir.mkdir(parents=True)
+            written = DataHandler._write_parquet(df, staging_dir / DATASET_FILENAME)
+            metadata = {
+                "name": name,
+                "version": version,
+                "parent": parent,
+                "schema": DataHandler.get_schema(written),
+                "n_rows": len(written),
+                "n_columns": len(written.columns),
+                "size_bytes": (staging_dir / DATASET_FILENAME).stat().st_size,
+                "memory_bytes": int(written.memory_usage(deep=True).sum()),
+                "data_hash": data_hash,
+                "created_at": time.time(),
+            }
+            (staging_dir / DATASET_METADATA_FILENAME).write_text(
+                json.dumps(metadata, indent=2)
+            )
+            os.rename(staging_dir, self._version_dir(name, version))
+            DatasetCache.put(self.data_path(name, version), written)
+            logger.info(f"Stored dataset {name} version {version}")
+        except Exception as e:
+            logger.error(f"Error storing dataset {name}: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+
+        self.enforce_retention(name)
+        return metadata
+
+    def append(
+        self, name: str, new_rows: pd.DataFrame
+    ) -> Optional[Tuple[Dict[str, Any], pd.DataFrame]]:
+        """
+        Store the newest version of a dataset plus appended rows as a new version.
+
+        The new rows are cast to the dataset's dtypes (see
+        DataHandler.concat_rows). Without an existing dataset, the rows
+        become its first version.
+
+        Args:
+            name: Dataset name, normalized with normalize_name.
+            new_rows: Rows to append.
+
+        Returns:
+            Tuple of (metadata of the new version, combined data), or None if
+            the rows could not be appended.
+        """
+        name = self.normalize_name(name)
+        latest = self.latest(name)
+        parent = latest["version"] if latest is not None else None
+        existing = self.load(name, parent) if parent is not None else None
+        try:
+            combined = (
+                DataHandler.concat_rows(existing, new_rows)
+                if existing is not None
+                else new_rows
+            )
+        except Exception as e:
+            logger.error(f"Error appending to dataset {name}: {e}")
+            return None
+
+        metadata = self.add(name, combined, parent=parent)
+        if metadata is None:
+            return None
+        return metadata, self.load(metadata["name"], metadata["version"])
+
+    def list_datasets(self) -> List[Dict[str, Any]]:
+        """
+        List the newest version of every dataset, most recently updated first.
+
+        Returns:
+            List of version metadata dictionaries.
+        """
+        datasets = []
+        for dataset_dir in self.catalog_dir.iterdir():
+            if dataset_dir.name.startswith(".") or not dataset_dir.is_dir():
+                continue
+            latest = self.latest(dataset_dir.name)
+            if latest is not None:
+                datasets.append(latest)
+        return sorted(datasets, key=lambda d: d["created_at"], reverse=True)
+
+    def list_versions(self, name: str) -> List[Dict[str, Any]]:
+        """
+        List the versions of a dataset, newest first.
+
+        Args:
+            name: Dataset name.
+
+        Returns:
+            List of version metadata dictionaries, empty if there is no such dataset.
+        """
+        dataset_dir = self._dataset_dir(name)
+        if not dataset_dir.is_dir():
+            return []
+        versions = []
+        for version_dir in dataset_dir.iterdir():
+            if version_dir.name.startswith(".") or not version_dir.is_dir():
+                continue
+            try:
+                versions.append(
+                    json.loads((version_dir / DATASET_METADATA_FILENAME).read_text())
+                )
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable dataset {version_dir}: {e}")
+        return sorted(versions, key=lambda v: v["created_at"], reverse=True)
+
+    def latest(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the metadata of a dataset's newest version.
+
+        Args:
+            name: Dataset name.
+
+        Returns:
+            Metadata dictionary, or None if there is no such dataset.
+        """
+        versions = self.list_versions(name)
+        return versions[0] if versions else None
+
+    def data_path(self, name: str, version: str) -> Path:
+        """Return the Parquet file of a dataset version."""
+        return self._version_dir(name, version) / DATASET_FILENAME
+
+    def stats_path(self, name: str, version: str) -> Path:
+        """Return the column statistics file of a dataset version."""
+        return self._version_dir(name, version) / DATASET_STATS_FILENAME
+
+    def load(
+        self,
+        name: str,
+        version: Optional[str] = None,
+        memory_map: bool = SOURCE_DATA_MEMORY_MAP,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a dataset version, reading it only on a DatasetCache miss.
+
+        Callers must not mutate the returned DataFrame.
+
+        Args:
+            name: Dataset name.
+            version: Version id. Defaults to the newest version.
+            memory_map: Memory-map the Parquet file instead of reading it into
+                a buffer first.
+
+        Returns:
+            DataFrame if the version exists, None otherwise.
+        """
+        try:
+            if version is None:
+                latest = self.latest(name)
+                if latest is None:
+                    logger.warning(f"Dataset {name} not found")
+                    return None
+                version = latest["version"]
+
+            path = self.data_path(name, version)
+            df = DatasetCache.get(path)
+            if df is None:
+                logger.info(f"Loading dataset {name} version {version}")
+                df = pd.read_parquet(path, memory_map=memory_map)
+                DatasetCache.put(path, df)
+            return df
+        except Exception as e:
+            logger.error(f"Error loading dataset {name} version {version}: {e}")
+            return None
+
+    def delete(self, name: str, version: Optional[str] = None) -> None:
+        """
+        Remove a dataset version, or the whole dataset.
+
+        Args:
+            name: Dataset name.
+            version: Version id. Deletes every version when None.
+
+        Raises:
+            ValueError: If version is not a valid version id.
+        """
+        if version is None:
+            target = self._dataset_dir(name)
+            versions = [metadata["version"] for metadata in self.list_versions(name)]
+        else:
+            target = self._version_dir(name, version)
+            versions = [version]
+        for deleted in versions:
+            DatasetCache.invalidate(self.data_path(name, deleted))
+        shutil.rmtree(target, ignore_errors=True)
+        logger.info(f"Deleted dataset {name} {version or '(all versions)'}")
+
+    def enforce_retention(self, name: str) -> None:
+        """
+        Delete a dataset's oldest versions beyond max_versions.
+
+        Args:
+            name: Dataset name.
+        """
+        for metadata in self.list_versions(name)[self.max_versions:]:
+            self.delete(name, metadata["version"])
+
+    def import_source_data(self) -> Optional[Dict[str, Any]]:
+        """
+        Import the stored source data into an empty catalog.
+
+        Source data saved before the catalog existed becomes the dataset
+        SOURCE_DATASET_NAME, so it stays selectable.
+
+        Returns:
+            Metadata of the imported version, or None if nothing was imported.
+        """
+        if self.list_datasets() or not (
+            SOURCE_DATA_PATH.exists() or LEGACY_SOURCE_DATA_PATH.exists()
+        ):
+            return None
+        df = DataHandler.load_source_data()
+        if df is None:
+            return None
+        logger.info(f"Importing stored source data as dataset {SOURCE_DATASET_NAME}")
+        return self.add(SOURCE_DATASET_NAME, df)
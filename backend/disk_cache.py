@@ -0,0 +1,107 @@
+"""
+Disk cache module for AutoLearn.
+Content-addressed file cache with a size budget and least-recently-used eviction.
+"""
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Directory of cache entries, one file per key.
+
+    Reads refresh an entry's mtime, writes are atomic, and the least recently
+    used entries are evicted once the directory grows beyond max_bytes.
+    Subclasses set suffix and convert their values to and from bytes.
+    """
+
+    suffix = ".bin"
+    description = "cache"
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Return the raw contents cached under a key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Entry bytes if cached, None otherwise.
+        """
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            logger.info(f"{self.description.capitalize()} hit for {key[:12]}")
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading {self.description} entry {path}: {e}")
+            return None
+
+    def put_bytes(self, key: str, data: bytes) -> bool:
+        """
+        Store raw contents under a key and evict old entries if needed.
+
+        Args:
+            key: Cache key.
+            data: Entry bytes.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            logger.info(f"Stored {self.description} entry {key[:12]}")
+            self.evict()
+            return True
+        except Exception as e:
+            logger.error(f"Error writing {self.description} entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the entry cached under a key, if any.
+
+        Args:
+            key: Cache key.
+        """
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted {self.description} entry {path.name}")
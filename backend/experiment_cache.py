@@ -0,0 +1,111 @@
+"""
+Experiment cache module for AutoLearn.
+Persists training results so an identical training request returns at once.
+"""
+import hashlib
+import json
+import logging
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from backend.data_handler import DataHandler
+from backend.disk_cache import DiskCache
+from config import EXPERIMENT_CACHE_DIR, EXPERIMENT_CACHE_MAX_BYTES
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ExperimentCache(DiskCache):
+    """
+    Persistent cache of training results.
+
+    Entries hold the pickled (model, setup_df, comparison_df, version) tuple
+    returned by MLTrainer, keyed on a hash of the training data contents, the
+    target, the analysis type and the resolved training options. Any change
+    to those inputs produces a different key, so stale results are never
+    served; old entries simply age out of the LRU.
+    """
+
+    suffix = ".pkl"
+    description = "experiment cache"
+
+    def __init__(
+        self,
+        cache_dir: Path = EXPERIMENT_CACHE_DIR,
+        max_bytes: int = EXPERIMENT_CACHE_MAX_BYTES,
+    ):
+        super().__init__(cache_dir, max_bytes)
+
+    @staticmethod
+    def make_key(
+        df: pd.DataFrame,
+        analysis_type: str,
+        target: Optional[str],
+        options: Dict[str, Any],
+    ) -> str:
+        """
+        Build the cache key for a training request.
+
+        Args:
+            df: Training DataFrame.
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            target: Target column name (None for clustering).
+            options: Resolved training options.
+
+        Returns:
+            Hex digest identifying the experiment.
+        """
+        digest = hashlib.sha256()
+        digest.update(DataHandler.hash_dataframe(df).encode())
+        digest.update(
+            json.dumps(
+                {"analysis_type": analysis_type, "target": target, "options": options},
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the cached training result for a key.
+
+        Args:
+            key: Cache key from make_key.
+
+        Returns:
+            Training result tuple if cached and readable, None otherwise.
+        """
+        data = self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            return pickle.loads(data)
+        except Exception as e:
+            # e.g. pickled with library versions that are no longer installed
+            logger.warning(f"Discarding unreadable experiment cache entry {key[:12]}: {e}")
+            self.delete(key)
+            return None
+
+    def put(self, key: str, result: Tuple[Any, ...]) -> bool:
+        """
+        Store a training result under a key and evict old entries if needed.
+
+        Args:
+            key: Cache key from make_key.
+            result: Training result tuple.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"Error serializing training result for cache: {e}")
+            return False
+        return self.put_bytes(key, data)
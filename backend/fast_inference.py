@@ -0,0 +1,257 @@
+"""
+Fast-path inference module for AutoLearn.
+Scores data by calling a saved PyCaret pipeline directly instead of going
+through predict_model.
+
+predict_model re-validates its input, copies it, builds a throwaway
+experiment and decorates the output on every call, which dominates the cost
+of small requests. FastScorer resolves the pipeline's parts once per model
+version and then only runs the preprocessing transform and the estimator.
+Its output columns match predict_model's, and every version is checked
+against predict_model before the fast path is trusted.
+"""
+import logging
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import INFERENCE_FAST_PATH_CHECK_ROWS, MODEL_CACHE_MAX_ENTRIES
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Output columns written by PyCaret's predict_model
+LABEL_COLUMN = "prediction_label"
+SCORE_COLUMN = "prediction_score"
+CLUSTER_COLUMN = "Cluster"
+# predict_model rounds labels and scores to this many decimals by default
+ROUND_DECIMALS = 4
+# Name of the pipeline step PyCaret uses to encode classification targets
+LABEL_ENCODING_STEP = "label_encoding"
+
+
+class FastScorer:
+    """
+    Scores DataFrames with a fitted pipeline, bypassing predict_model.
+
+    Scorers are built and validated once per model version and shared by
+    all callers in the process. Like ModelCache, only the max_entries most
+    recently used versions are kept.
+    """
+
+    _lock = threading.Lock()
+    # version -> scorer, or None when the version must use predict_model
+    _scorers: "OrderedDict[str, Optional[FastScorer]]" = OrderedDict()
+    max_entries = MODEL_CACHE_MAX_ENTRIES
+
+    def __init__(self, model: Any, analysis_type: str, feature_columns: List[str]):
+        steps = getattr(model, "steps", None)
+        if not steps:
+            raise TypeError(f"{type(model).__name__} is not a pipeline")
+
+        self.analysis_type = analysis_type
+        self.feature_columns = feature_columns
+        self.preprocessor = model[:-1] if len(steps) > 1 else None
+        self.estimator = steps[-1][1]
+
+        self.classes = None
+        encoder = dict(steps).get(LABEL_ENCODING_STEP)
+        if encoder is not None:
+            self.classes = getattr(
+                getattr(encoder, "transformer", encoder), "classes_", None
+            )
+
+    @classmethod
+    def get(
+        cls,
+        metadata: Dict[str, Any],
+        model: Any,
+        reference_predict: Callable[[pd.DataFrame], pd.DataFrame],
+        df: pd.DataFrame,
+    ) -> Optional["FastScorer"]:
+        """
+        Return the validated scorer for a model version, building it on first use.
+
+        Args:
+            metadata: Registry metadata of the version.
+            model: Loaded pipeline.
+            reference_predict: predict_model for the version, used to check
+                the fast path's output.
+            df: Data about to be scored; its first rows are used for the check.
+
+        Returns:
+            The scorer, or None when the version must use predict_model.
+        """
+        version = metadata["version"]
+        with cls._lock:
+            if version in cls._scorers:
+                cls._scorers.move_to_end(version)
+                return cls._scorers[version]
+
+            scorer = None
+            try:
+                candidate = cls(
+                    model, metadata["analysis_type"], list(metadata["feature_schema"])
+                )
+                sample = df.head(INFERENCE_FAST_PATH_CHECK_ROWS)
+                if candidate.matches(reference_predict(sample), sample):
+                    scorer = candidate
+                    logger.info(f"Using fast-path inference for model version {version}")
+                else:
+                    logger.warning(
+                        f"Fast-path output differs from predict_model for version "
+                        f"{version}, using predict_model"
+                    )
+            except Exception as e:
+                logger.warning(f"Fast-path inference unavailable for {version}: {e}")
+            cls._scorers[version] = scorer
+            while len(cls._scorers) > cls.max_entries:
+                cls._scorers.popitem(last=False)
+            return scorer
+
+    @classmethod
+    def invalidate(cls, version: Optional[str] = None) -> None:
+        """
+        Drop validated scorers.
+
+        Args:
+            version: Version to drop. Clears all scorers when None.
+        """
+        with cls._lock:
+            if version is None:
+                cls._scorers.clear()
+            else:
+                cls._scorers.pop(version, None)
+
+    def _features(self, df: pd.DataFrame) -> Any:
+        """Select the training features in training order and transform them."""
+        missing = [column for column in self.feature_columns if column not in df.columns]
+        if missing:
+            raise KeyError(f"Missing feature columns: {missing}")
+
+        features = df[self.feature_columns]
+        if self.preprocessor is not None:
+            features = self.preprocessor.transform(features)
+        if isinstance(features, pd.DataFrame):
+            features = np.ascontiguousarray(features.to_numpy(dtype=np.float64))
+        return features
+
+    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score a DataFrame.
+
+        Args:
+            df: Data to score. Columns beyond the training features are
+                passed through to the output.
+
+        Returns:
+            df with predict_model's prediction columns appended.
+        """
+        features = self._features(df)
+        with warnings.catch_warnings():
+            # Estimators fitted on DataFrames warn when given plain arrays
+            warnings.filterwarnings("ignore", message="X does not have valid feature names")
+            labels = self.estimator.predict(features)
+            scores = None
+            if self.analysis_type == "Classification" and hasattr(
+                self.estimator, "predict_proba"
+            ):
+                try:
+                    scores = self.estimator.predict_proba(features).max(axis=1)
+                except Exception:
+                    # Some estimators only expose predict_proba when configured for it
+                    scores = None
+
+        return format_predictions(df, self.analysis_type, labels, scores, self.classes)
+
+    def matches(self, expected: Optional[pd.DataFrame], df: pd.DataFrame) -> bool:
+        """
+        Check this scorer against predict_model's output for the same rows.
+
+        Args:
+            expected: Output of predict_model for df.
+            df: Rows that were scored.
+
+        Returns:
+            True if the prediction columns agree.
+        """
+        return predictions_match(expected, self.predict(df), df)
+
+
+def format_predictions(
+    df: pd.DataFrame,
+    analysis_type: str,
+    labels: Any,
+    scores: Optional[np.ndarray] = None,
+    classes: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """
+    Append raw model outputs to the input the way predict_model does.
+
+    Args:
+        df: Scored data.
+        analysis_type: One of the configured ANALYSIS_TYPES.
+        labels: Predicted values, labels or cluster ids, one per row.
+        scores: Highest class probability per row (classification only).
+        classes: Original class labels indexed by encoded label, if the
+            target was label-encoded.
+
+    Returns:
+        Shallow copy of df with the prediction columns added.
+    """
+    # Shallow copy: the input's column data is shared, not duplicated
+    output = df.copy(deep=False)
+    if analysis_type == "Clustering":
+        output[CLUSTER_COLUMN] = [f"Cluster {label}" for label in labels]
+    elif analysis_type == "Classification":
+        labels = np.asarray(labels).astype(int, copy=False)
+        output[LABEL_COLUMN] = classes[labels] if classes is not None else labels
+        if scores is not None:
+            output[SCORE_COLUMN] = np.round(scores, ROUND_DECIMALS)
+    else:
+        labels = np.asarray(labels, dtype=float)
+        n_missing = int(np.isnan(labels).sum())
+        if n_missing:
+            # Kept as NaN: a 0.0 would pass for a real prediction
+            logger.warning(f"Model returned NaN for {n_missing} of {len(labels)} rows")
+        output[LABEL_COLUMN] = np.round(labels, ROUND_DECIMALS)
+    return output
+
+
+def predictions_match(
+    expected: Optional[pd.DataFrame],
+    actual: pd.DataFrame,
+    df: pd.DataFrame,
+    atol: float = 10**-ROUND_DECIMALS,
+) -> bool:
+    """
+    Compare the prediction columns two scoring paths added to the same rows.
+
+    Args:
+        expected: Reference output, normally from predict_model.
+        actual: Output of the path being checked.
+        df: Rows that were scored.
+        atol: Absolute tolerance for numeric columns.
+
+    Returns:
+        True if both added the same columns with matching values.
+    """
+    if expected is None:
+        return False
+    added = [column for column in expected.columns if column not in df.columns]
+    if sorted(added) != sorted(c for c in actual.columns if c not in df.columns):
+        return False
+
+    for column in added:
+        want, got = expected[column].to_numpy(), actual[column].to_numpy()
+        if pd.api.types.is_numeric_dtype(want) and pd.api.types.is_numeric_dtype(got):
+            if not np.allclose(want, got, atol=atol, equal_nan=True):
+                return False
+        elif list(map(str, want)) != list(map(str, got)):
+            return False
+    return True
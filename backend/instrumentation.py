@@ -0,0 +1,170 @@
+"""
+Instrumentation module for AutoLearn.
+Records per-stage wall time, CPU time and peak memory of training, profiling
+and inference runs as a machine-readable run report.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# PyCaret leaderboard column holding each candidate's mean fit time
+LEADERBOARD_TIME_COLUMN = "TT (Sec)"
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Return the peak resident set size of this process so far, in MB.
+
+    Returns:
+        Peak RSS in MB, or None where the platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+class RunReport:
+    """
+    Structured timing report for one run.
+
+    Each stage records wall time, CPU time and the process's peak RSS when
+    the stage ended. Entering a stage with the same name again accumulates
+    into it, so per-chunk stages report totals and a call count. CPU time is
+    process-wide, so it includes other threads running at the same time.
+    """
+
+    def __init__(self, name: str, **context: Any):
+        self.name = name
+        self.context = context
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._lock = threading.Lock()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.candidates: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a block of code as a named stage.
+
+        Args:
+            name: Stage name.
+        """
+        start = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.record_stage(
+                name, time.perf_counter() - start, time.process_time() - start_cpu
+            )
+
+    def record_stage(self, name: str, wall_seconds: float, cpu_seconds: float) -> None:
+        """
+        Add a measurement to a stage.
+
+        Args:
+            name: Stage name.
+            wall_seconds: Elapsed wall time.
+            cpu_seconds: Elapsed CPU time.
+        """
+        with self._lock:
+            stage = self.stages.setdefault(
+                name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "calls": 0}
+            )
+            stage["wall_seconds"] += wall_seconds
+            stage["cpu_seconds"] += cpu_seconds
+            stage["calls"] += 1
+            stage["peak_rss_mb"] = peak_rss_mb()
+
+    def add_candidate(self, model: str, fit_seconds: Optional[float], **extra: Any) -> None:
+        """
+        Record the fit time of one candidate model.
+
+        Args:
+            model: Model name or id.
+            fit_seconds: Time spent fitting the candidate.
+            **extra: Additional fields to store with the candidate.
+        """
+        with self._lock:
+            self.candidates.append({"model": model, "fit_seconds": fit_seconds, **extra})
+
+    def add_leaderboard(self, leaderboard: Optional[pd.DataFrame]) -> None:
+        """
+        Record per-candidate fit times from a PyCaret leaderboard.
+
+        Args:
+            leaderboard: compare_models leaderboard, indexed by model id.
+        """
+        if leaderboard is None or LEADERBOARD_TIME_COLUMN not in leaderboard:
+            return
+        names = leaderboard["Model"] if "Model" in leaderboard else leaderboard.index
+        for model_id, name, seconds in zip(
+            leaderboard.index, names, leaderboard[LEADERBOARD_TIME_COLUMN]
+        ):
+            self.add_candidate(str(name), float(seconds), model_id=str(model_id))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "context": dict(self.context),
+                "started_at": self.started_at,
+                "wall_seconds": time.perf_counter() - self._start,
+                "cpu_seconds": time.process_time() - self._start_cpu,
+                "peak_rss_mb": peak_rss_mb(),
+                "stages": [
+                    {"stage": name, **stage} for name, stage in self.stages.items()
+                ],
+                "candidates": list(self.candidates),
+            }
+
+    def to_json(self) -> str:
+        """Return the report as a JSON string."""
+        return json.dumps(self.to_dict(), indent=2, default=str)
+
+    def save(self, path: Path) -> bool:
+        """
+        Write the report as JSON.
+
+        Args:
+            path: Output file path.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            Path(path).write_text(self.to_json(), encoding="utf-8")
+            logger.info(f"Run report written to {path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error writing run report to {path}: {e}")
+            return False
+
+    def log(self) -> None:
+        """Log a one-line summary of the stage timings."""
+        summary = ", ".join(
+            f"{name}={stage['wall_seconds']:.2f}s" for name, stage in self.stages.items()
+        )
+        logger.info(f"{self.name} timings: {summary}")
@@ -1,52 +1,248 @@
 """
 ML Predictor module for AutoLearn.
 Handles model inference and prediction operations.
+
+PyCaret task modules are imported inside each prediction method, so importing
+this module stays cheap until a prediction is actually requested.
 """
 import logging
-from typing import Optional
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 import pandas as pd
-from pycaret.classification import (
-    load_model as classification_load_model,
-    predict_model as classification_predict_model,
-)
-from pycaret.clustering import (
-    load_model as clustering_load_model,
-    predict_model as clustering_predict_model,
-)
-from pycaret.regression import (
-    load_model as regression_load_model,
-    predict_model as regression_predict_model,
-)
-
-from config import BEST_MODEL_PATH
+
+from backend.data_handler import DataHandler
+from backend.instrumentation import RunReport
+from backend.fast_inference import FastScorer
+from backend.model_registry import ModelRegistry
+from backend.model_serialization import LEGACY_FORMAT, ModelSerializer
+from backend.onnx_export import ONNX_FILENAME, OnnxExporter, OnnxScorer
+from config import INFERENCE_FAST_PATH, INFERENCE_ONNX, MODEL_CACHE_MAX_ENTRIES
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class ModelCache:
+    """
+    Process-wide cache of deserialized models.
+
+    Entries are keyed by model file path and validated against the file's
+    mtime and size, so a model rewritten on disk (even by another process)
+    is reloaded on next use. Streamlit runs all sessions in one process, so
+    every session shares the same loaded models. The least recently used
+    models are evicted beyond max_entries. Loads take a per-path lock, so a
+    slow load only blocks callers waiting for the same model.
+    """
+
+    _lock = threading.Lock()
+    _entries: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+    _load_locks: Dict[str, threading.Lock] = {}
+    max_entries = MODEL_CACHE_MAX_ENTRIES
+
+    @staticmethod
+    def _file_signature(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _lookup(cls, key: str, signature: Tuple[int, int]) -> Tuple[bool, Any]:
+        # Callers hold the class lock
+        entry = cls._entries.get(key)
+        if entry is None or entry[0] != signature:
+            return False, None
+        cls._entries.move_to_end(key)
+        return True, entry[1]
+
+    @classmethod
+    def get(cls, path: Path, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached model for a path, loading it on a miss.
+
+        Args:
+            path: Model file on disk.
+            loader: Callable that deserializes the model.
+
+        Returns:
+            The loaded model.
+        """
+        key = str(Path(path).resolve())
+        signature = cls._file_signature(Path(path))
+        with cls._lock:
+            found, model = cls._lookup(key, signature)
+            if found:
+                logger.info(f"Using cached model for {path}")
+                return model
+            load_lock = cls._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another caller may have loaded it while this one waited
+            with cls._lock:
+                found, model = cls._lookup(key, signature)
+            if found:
+                return model
+
+            model = loader()
+            with cls._lock:
+                cls._entries[key] = (signature, model)
+                cls._entries.move_to_end(key)
+                while len(cls._entries) > cls.max_entries:
+                    evicted_key, _ = cls._entries.popitem(last=False)
+                    cls._load_locks.pop(evicted_key, None)
+                    logger.info(f"Evicted cached model {evicted_key}")
+            return model
+
+    @classmethod
+    def invalidate(cls, path: Optional[Path] = None) -> None:
+        """
+        Drop cached models.
+
+        Args:
+            path: Model file, or directory of model files, to drop. Clears
+                the whole cache when None.
+        """
+        with cls._lock:
+            if path is None:
+                cls._entries.clear()
+                cls._load_locks.clear()
+            else:
+                prefix = str(Path(path).resolve())
+                for key in list(cls._entries):
+                    if key == prefix or key.startswith(prefix + os.sep):
+                        del cls._entries[key]
+                        cls._load_locks.pop(key, None)
+        logger.info(f"Invalidated model cache for {path or 'all models'}")
+
+
 class MLPredictor:
     """Manages machine learning model inference operations."""
 
     @staticmethod
-    def predict_regression(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    def resolve_version(
+        analysis_type: Optional[str] = None, version: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the registry entry to predict with.
+
+        Args:
+            analysis_type: Use the newest version of this analysis type.
+            version: Use this exact version instead.
+
+        Returns:
+            Version metadata if found, None otherwise.
+        """
+        registry = ModelRegistry()
+        if version is not None:
+            metadata = registry.get(version)
+        else:
+            metadata = registry.latest(analysis_type)
+        if metadata is None:
+            logger.error(f"No trained model found (version={version}, type={analysis_type})")
+        return metadata
+
+    @staticmethod
+    def _load_model(
+        analysis_type: str, version: Optional[str]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Load a registered model through the process-wide model cache."""
+        metadata = MLPredictor.resolve_version(analysis_type, version)
+        if metadata is None:
+            raise FileNotFoundError(f"No trained {analysis_type.lower()} model found")
+
+        path = ModelRegistry().model_path(metadata["version"])
+        model_format = metadata.get("serialization", {}).get("format", LEGACY_FORMAT)
+
+        def loader() -> Any:
+            start = time.perf_counter()
+            model = ModelSerializer.load(path, model_format)
+            logger.info(
+                f"Loaded model version {metadata['version']} "
+                f"({model_format}, {path.stat().st_size:,} bytes) "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+            return model
+
+        return ModelCache.get(path, loader), metadata
+
+    @staticmethod
+    def _score(
+        model: Any,
+        metadata: Dict[str, Any],
+        df: pd.DataFrame,
+        predict_model: Callable[..., pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Score on the fast path when the version supports it, else with predict_model."""
+
+        def reference_predict(data: pd.DataFrame) -> pd.DataFrame:
+            return predict_model(model, data=data)
+
+        if INFERENCE_FAST_PATH:
+            scorer = FastScorer.get(metadata, model, reference_predict, df)
+            if scorer is not None:
+                try:
+                    return scorer.predict(df)
+                except Exception as e:
+                    logger.warning(f"Fast-path inference failed, using predict_model: {e}")
+        return reference_predict(df)
+
+    @staticmethod
+    def _predict_onnx(
+        analysis_type: str, df: pd.DataFrame, version: Optional[str]
+    ) -> Optional[pd.DataFrame]:
+        """Score with the version's ONNX export, if it has one, without PyCaret."""
+        if not INFERENCE_ONNX:
+            return None
+        metadata = MLPredictor.resolve_version(analysis_type, version)
+        if metadata is None:
+            return None
+        path = ModelRegistry().onnx_path(metadata["version"])
+        if path is None:
+            return None
+
+        try:
+            scorer = ModelCache.get(
+                path, lambda: OnnxScorer.from_directory(path.parent, analysis_type)
+            )
+            predictions = scorer.predict(df)
+            logger.info(f"Scored {len(df)} rows with ONNX model {metadata['version']}")
+            return predictions
+        except Exception as e:
+            logger.warning(f"ONNX scoring failed, using PyCaret: {e}")
+            return None
+
+    @staticmethod
+    def predict_regression(
+        df: pd.DataFrame, version: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Make predictions using trained regression model.
 
         Args:
             df: DataFrame to make predictions on.
+            version: Registry version to use. Defaults to the newest one.
 
         Returns:
             DataFrame with predictions if successful, None otherwise.
         """
+        predictions = MLPredictor._predict_onnx("Regression", df, version)
+        if predictions is not None:
+            return predictions
+
         try:
-            model_path = str(BEST_MODEL_PATH.with_suffix(""))
-            logger.info(f"Loading regression model from {model_path}")
-            model = regression_load_model(model_path)
+            from pycaret.regression import predict_model as regression_predict_model
+
+            model, metadata = MLPredictor._load_model("Regression", version)
 
             logger.info("Making regression predictions...")
-            predictions = regression_predict_model(model, data=df)
+            predictions = MLPredictor._score(
+                model, metadata, df, regression_predict_model
+            )
             logger.info("Regression predictions completed")
             return predictions
         except Exception as e:
@@ -54,23 +250,32 @@ class MLPredictor:
             return None
 
     @staticmethod
-    def predict_classification(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    def predict_classification(
+        df: pd.DataFrame, version: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Make predictions using trained classification model.
 
         Args:
             df: DataFrame to make predictions on.
+            version: Registry version to use. Defaults to the newest one.
 
         Returns:
             DataFrame with predictions if successful, None otherwise.
         """
+        predictions = MLPredictor._predict_onnx("Classification", df, version)
+        if predictions is not None:
+            return predictions
+
         try:
-            model_path = str(BEST_MODEL_PATH.with_suffix(""))
-            logger.info(f"Loading classification model from {model_path}")
-            model = classification_load_model(model_path)
+            from pycaret.classification import predict_model as classification_predict_model
+
+            model, metadata = MLPredictor._load_model("Classification", version)
 
             logger.info("Making classification predictions...")
-            predictions = classification_predict_model(model, data=df)
+            predictions = MLPredictor._score(
+                model, metadata, df, classification_predict_model
+            )
             logger.info("Classification predictions completed")
             return predictions
         except Exception as e:
@@ -78,25 +283,222 @@ class MLPredictor:
             return None
 
     @staticmethod
-    def predict_clustering(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    def predict_clustering(
+        df: pd.DataFrame, version: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Make predictions using trained clustering model.
 
         Args:
             df: DataFrame to make predictions on.
+            version: Registry version to use. Defaults to the newest one.
 
         Returns:
             DataFrame with predictions if successful, None otherwise.
         """
+        predictions = MLPredictor._predict_onnx("Clustering", df, version)
+        if predictions is not None:
+            return predictions
+
         try:
-            model_path = str(BEST_MODEL_PATH.with_suffix(""))
-            logger.info(f"Loading clustering model from {model_path}")
-            model = clustering_load_model(model_path)
+            from pycaret.clustering import predict_model as clustering_predict_model
+
+            model, metadata = MLPredictor._load_model("Clustering", version)
 
             logger.info("Making clustering predictions...")
-            predictions = clustering_predict_model(model=model, data=df)
+            predictions = MLPredictor._score(
+                model, metadata, df, clustering_predict_model
+            )
             logger.info("Clustering predictions completed")
             return predictions
         except Exception as e:
             logger.error(f"Error making clustering predictions: {e}")
             return None
+
+    @staticmethod
+    def predict(
+        analysis_type: Optional[str], df: pd.DataFrame, version: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Make predictions with a registered model.
+
+        Input columns are cast to the dtypes recorded for the model at
+        training time, so scoring sees the same schema as training.
+
+        Args:
+            analysis_type: One of the configured ANALYSIS_TYPES. Ignored when
+                version is given, since the version records its own type.
+            df: DataFrame to make predictions on.
+            version: Registry version to use. Defaults to the newest version
+                of analysis_type.
+
+        Returns:
+            DataFrame with predictions if successful, None otherwise.
+        """
+        predict_fns = {
+            "Regression": MLPredictor.predict_regression,
+            "Classification": MLPredictor.predict_classification,
+            "Clustering": MLPredictor.predict_clustering,
+        }
+        if version is None and analysis_type not in predict_fns:
+            logger.error(f"Unknown analysis type: {analysis_type}")
+            return None
+
+        metadata = MLPredictor.resolve_version(analysis_type, version)
+        if metadata is None:
+            return None
+
+        df = DataHandler.apply_schema(df, metadata.get("feature_schema", {}))
+        return predict_fns[metadata["analysis_type"]](df, metadata["version"])
+
+    @staticmethod
+    def preload_model(
+        analysis_type: Optional[str] = None, version: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a registered model into the model cache before the first prediction.
+
+        Args:
+            analysis_type: Preload the newest version of this analysis type.
+            version: Preload this exact version instead.
+
+        Returns:
+            Metadata of the preloaded version if successful, None otherwise.
+        """
+        metadata = MLPredictor.resolve_version(analysis_type, version)
+        if metadata is None:
+            return None
+        try:
+            MLPredictor._load_model(metadata["analysis_type"], metadata["version"])
+            logger.info(f"Preloaded model version {metadata['version']}")
+            return metadata
+        except Exception as e:
+            logger.error(f"Error preloading model version {metadata['version']}: {e}")
+            return None
+
+    @staticmethod
+    def export_onnx(version: str, features: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Export a registered model version to ONNX after the fact.
+
+        Args:
+            version: Registry version to export.
+            features: Rows with the version's feature columns, used for the
+                input signature and the parity check against PyCaret.
+
+        Returns:
+            Export status, see OnnxExporter.export.
+        """
+        metadata = MLPredictor.resolve_version(version=version)
+        if metadata is None:
+            return {"exported": False, "error": f"Unknown model version {version}"}
+        try:
+            model, metadata = MLPredictor._load_model(metadata["analysis_type"], version)
+            columns = list(metadata["feature_schema"])
+            features = DataHandler.apply_schema(features[columns], metadata["feature_schema"])
+        except Exception as e:
+            logger.error(f"Error preparing ONNX export of {version}: {e}")
+            return {"exported": False, "error": str(e)}
+
+        path = ModelRegistry().model_path(version)
+        status = OnnxExporter.export(model, features, metadata["analysis_type"], path.parent)
+        ModelCache.invalidate(path.with_name(ONNX_FILENAME))
+        return status
+
+    @staticmethod
+    def predict_stream(
+        analysis_type: str,
+        chunks: Iterable[pd.DataFrame],
+        on_chunk: Optional[Callable[[int, float, pd.DataFrame], None]] = None,
+        output_path: Optional[Path] = None,
+        version: Optional[str] = None,
+        report: Optional[RunReport] = None,
+    ) -> Optional[Dict[str, float]]:
+        """
+        Score data chunk by chunk, appending each result to the predictions file.
+
+        Only one chunk and its predictions are held in memory at a time, so
+        peak memory depends on the chunk size rather than the input size.
+        Chunks are written to a temporary file next to the output, which
+        replaces the output only once every chunk was scored, so a failed
+        run never leaves truncated predictions behind.
+
+        Args:
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            chunks: Iterable of input DataFrame chunks.
+            on_chunk: Optional callback receiving (rows scored so far, elapsed
+                seconds, predictions for the current chunk) after each chunk.
+            output_path: Output CSV path. Defaults to the predictions path.
+            version: Registry version to use. Defaults to the newest version
+                of analysis_type when the stream starts.
+            report: Run report to record model loading, read, predict and
+                write timings in.
+
+        Returns:
+            Dictionary with rows, chunks, seconds and rows_per_sec if
+            successful, None otherwise.
+        """
+        # Pin the version, so a model registered mid-stream can't score later chunks
+        metadata = MLPredictor.resolve_version(analysis_type, version)
+        if metadata is None:
+            return None
+        version = metadata["version"]
+
+        rows = 0
+        n_chunks = 0
+        start = time.perf_counter()
+        if report is not None:
+            # Load up front so the first chunk's predict time excludes loading
+            with report.stage("load_model"):
+                MLPredictor.preload_model(analysis_type, version)
+        else:
+            report = RunReport("inference")
+
+        output_path = DataHandler.predictions_path(output_path)
+        tmp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            chunk_iter = iter(chunks)
+            while True:
+                with report.stage("read"):
+                    chunk = next(chunk_iter, None)
+                if chunk is None:
+                    break
+
+                with report.stage("predict"):
+                    predictions = MLPredictor.predict(analysis_type, chunk, version)
+                if predictions is None:
+                    logger.error(f"Streaming inference failed on chunk {n_chunks}")
+                    return None
+                with report.stage("write"):
+                    written = DataHandler.append_predictions(
+                        predictions, first_chunk=n_chunks == 0, path=tmp_path
+                    )
+                if not written:
+                    return None
+
+                rows += len(chunk)
+                n_chunks += 1
+                if on_chunk is not None:
+                    on_chunk(rows, time.perf_counter() - start, predictions)
+            if n_chunks:
+                os.replace(tmp_path, output_path)
+        except Exception as e:
+            logger.error(f"Error during streaming inference: {e}")
+            return None
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        seconds = time.perf_counter() - start
+        rows_per_sec = rows / seconds if seconds > 0 else 0.0
+        logger.info(
+            f"Streamed {rows} rows in {n_chunks} chunks "
+            f"({seconds:.2f}s, {rows_per_sec:.0f} rows/sec)"
+        )
+        report.context.update(rows=rows, chunks=n_chunks)
+        report.log()
+        return {
+            "rows": rows,
+            "chunks": n_chunks,
+            "seconds": seconds,
+            "rows_per_sec": rows_per_sec,
+        }
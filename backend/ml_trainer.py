@@ -1,157 +1,687 @@
 """
 ML Trainer module for AutoLearn.
 Handles model training operations for regression, classification, and clustering.
+
+PyCaret task modules are imported inside each training method, so importing
+this module stays cheap until a model is actually trained.
 """
+import copy
+import importlib.util
 import logging
-from typing import Any, Dict, Optional, Tuple
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import pandas as pd
-from pycaret.classification import (
-    compare_models as classification_compare_models,
-    pull as classification_pull,
-    save_model as classification_save_model,
-    setup as classification_setup,
-    tune_model,
-)
-from pycaret.clustering import (
-    create_model as clustering_create_model,
-    pull as clustering_pull,
-    save_model as clustering_save_model,
-    setup as clustering_setup,
-)
-from pycaret.regression import (
-    compare_models as regression_compare_models,
-    pull as regression_pull,
-    save_model as regression_save_model,
-    setup as regression_setup,
-)
 
-from config import BEST_MODEL_PATH, CLUSTERING_MODELS
+from backend.data_handler import DataHandler
+from backend.experiment_cache import ExperimentCache
+from backend.instrumentation import RunReport
+from backend.model_registry import ModelRegistry
+from config import (
+    CLUSTERING_MODELS,
+    CLUSTERING_NUM_CLUSTERS_MODELS,
+    CLUSTERING_NUM_CLUSTERS_RANGE,
+    DEFAULT_TRAINING_PRESET,
+    TRAINING_PRESETS,
+    TRAINING_SAMPLE_RANDOM_STATE,
+    TRAINING_SAMPLE_TARGET_BINS,
+    TUNING_STRATEGIES,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Importable module of each optional tune_model search library
+SEARCH_LIBRARY_MODULES = {"scikit-optimize": "skopt", "optuna": "optuna"}
+
 
 class MLTrainer:
     """Manages machine learning model training operations."""
 
+    @staticmethod
+    def resolve_options(options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Expand training options on top of their preset.
+
+        Args:
+            options: Option overrides. A "preset" key selects the base preset
+                from TRAINING_PRESETS; keys set to None keep the preset value.
+
+        Returns:
+            Complete options dictionary including the preset name.
+        """
+        options = dict(options or {})
+        preset = options.pop("preset", None) or DEFAULT_TRAINING_PRESET
+        if preset not in TRAINING_PRESETS:
+            raise ValueError(f"Unknown training preset: {preset}")
+
+        resolved = dict(TRAINING_PRESETS[preset])
+        resolved.update({key: value for key, value in options.items() if value is not None})
+        resolved["preset"] = preset
+        return resolved
+
+    @staticmethod
+    def _compare_kwargs(options: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
+        """Build compare_models keyword arguments from resolved options."""
+
+        def for_task(value: Any) -> Any:
+            return value.get(analysis_type) if isinstance(value, dict) else value
+
+        return {
+            "include": for_task(options["include"]),
+            "exclude": for_task(options["exclude"]),
+            "fold": options["fold"],
+            # A budget of 0 means unlimited
+            "budget_time": options["budget_time"] or None,
+            "turbo": options["turbo"],
+        }
+
+    @staticmethod
+    def sample_training_data(
+        df: pd.DataFrame,
+        target: Optional[str],
+        analysis_type: str,
+        options: Dict[str, Any],
+        report: Optional[RunReport] = None,
+    ) -> pd.DataFrame:
+        """
+        Downsample a large training set for model selection.
+
+        Classification samples are stratified by class and keep at least
+        `fold` rows of every class; regression samples are stratified by
+        target quantile; clustering samples are uniform.
+
+        Args:
+            df: Training DataFrame.
+            target: Target column name (None for clustering).
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            options: Resolved training options.
+            report: Run report to record the sample size in.
+
+        Returns:
+            The sample, or df itself when it is within sample_rows.
+        """
+        n_rows = options["sample_rows"]
+        if not n_rows or len(df) <= n_rows:
+            return df
+
+        strata = None
+        if analysis_type == "Classification":
+            strata = df[target]
+        elif analysis_type == "Regression":
+            strata = pd.qcut(df[target], TRAINING_SAMPLE_TARGET_BINS, duplicates="drop")
+
+        sample = DataHandler.sample_rows(
+            df,
+            n_rows,
+            strata=strata,
+            random_state=TRAINING_SAMPLE_RANDOM_STATE,
+            min_per_stratum=options["fold"] if analysis_type == "Classification" else 0,
+        )
+        logger.info(f"Selecting models on a sample of {len(sample)} of {len(df)} rows")
+        if report is not None:
+            report.context.update(sample_rows=len(sample), total_rows=len(df))
+        return sample
+
+    @staticmethod
+    def _tune_kwargs(options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build tune_model keyword arguments from resolved options.
+
+        Args:
+            options: Resolved training options.
+
+        Returns:
+            Keyword arguments, or None when tuning is disabled.
+        """
+        strategy = options["tune"]
+        if strategy not in TUNING_STRATEGIES:
+            raise ValueError(f"Unknown tuning strategy: {strategy}")
+        if TUNING_STRATEGIES[strategy] is None:
+            return None
+
+        kwargs = dict(TUNING_STRATEGIES[strategy])
+        module = SEARCH_LIBRARY_MODULES.get(kwargs["search_library"])
+        if module is not None and importlib.util.find_spec(module) is None:
+            logger.warning(
+                f"{kwargs['search_library']} is not installed, "
+                f"falling back from {strategy} to random search"
+            )
+            kwargs = dict(TUNING_STRATEGIES["random"])
+
+        kwargs["n_iter"] = options["tune_n_iter"]
+        # Keep the untuned model unless tuning beats it
+        kwargs["choose_better"] = True
+        if options["tune_budget_time"]:
+            if kwargs["search_library"] == "optuna":
+                kwargs["timeout"] = options["tune_budget_time"] * 60
+            else:
+                logger.info(
+                    "Tuning time budget only applies to optuna strategies; "
+                    f"limiting {kwargs['search_library']} search by n_iter"
+                )
+        return kwargs
+
+    @staticmethod
+    def _tune(
+        tune_model: Callable[..., Any],
+        model: Any,
+        options: Dict[str, Any],
+        report: RunReport,
+        **tune_kwargs: Any,
+    ) -> Any:
+        """
+        Run the tuning stage on a model, returning the better of tuned and untuned.
+
+        Args:
+            tune_model: PyCaret tune_model for the model's task.
+            model: Model selected by compare_models.
+            options: Resolved training options.
+            report: Run report to record the stage in.
+            **tune_kwargs: Extra tune_model arguments, e.g. optimize.
+
+        Returns:
+            The tuned model, or model itself when tuning is disabled.
+        """
+        search_kwargs = MLTrainer._tune_kwargs(options)
+        if search_kwargs is None:
+            return model
+
+        report.context["tuning"] = {"strategy": options["tune"], **search_kwargs}
+        logger.info(f"Tuning best model ({options['tune']} search)...")
+        with report.stage("tune_model"):
+            return tune_model(
+                model,
+                fold=options["fold"],
+                verbose=False,
+                **search_kwargs,
+                **tune_kwargs,
+            )
+
+    @staticmethod
+    def _tune_num_clusters(
+        experiment: Any,
+        model_name: str,
+        model: Any,
+        metrics_df: pd.DataFrame,
+        options: Dict[str, Any],
+        report: RunReport,
+    ) -> Tuple[Any, pd.DataFrame]:
+        """
+        Tune the number of clusters of a clustering model by Silhouette.
+
+        Cluster counts are fitted in parallel batches on copies of the
+        experiment. The search stops early once a batch brings no improvement,
+        after tune_n_iter cluster counts, or when the time budget runs out.
+
+        Args:
+            experiment: Set-up ClusteringExperiment.
+            model_name: PyCaret model id.
+            model: Model fitted with the default number of clusters.
+            metrics_df: Metrics of the default model.
+            options: Resolved training options.
+            report: Run report to record the stage in.
+
+        Returns:
+            Tuple of (best model, its metrics), the given ones if nothing beat them.
+        """
+        if (
+            TUNING_STRATEGIES.get(options["tune"]) is None
+            or model_name not in CLUSTERING_NUM_CLUSTERS_MODELS
+        ):
+            return model, metrics_df
+
+        cluster_counts = list(CLUSTERING_NUM_CLUSTERS_RANGE)[: options["tune_n_iter"]]
+        if options["n_jobs"] == -1:
+            n_workers = os.cpu_count() or 1
+        else:
+            n_workers = options["n_jobs"]
+        batch_size = max(1, min(n_workers, len(cluster_counts)))
+        deadline = None
+        if options["tune_budget_time"]:
+            deadline = time.perf_counter() + options["tune_budget_time"] * 60
+
+        best_score = metrics_df["Silhouette"].iloc[0]
+        logger.info(f"Tuning number of clusters for {model_name}...")
+        report.context["tuning"] = {"strategy": "num_clusters", "model": model_name}
+        with report.stage("tune_model"), ThreadPoolExecutor(batch_size) as executor:
+            for start in range(0, len(cluster_counts), batch_size):
+                if deadline is not None and time.perf_counter() > deadline:
+                    logger.info("Tuning time budget exhausted")
+                    break
+
+                batch = cluster_counts[start : start + batch_size]
+                copies = [copy.deepcopy(experiment) for _ in batch]
+                results = executor.map(
+                    lambda args: MLTrainer._fit_num_clusters(*args, model_name),
+                    zip(copies, batch),
+                )
+
+                improved = False
+                for num_clusters, (candidate, candidate_metrics) in zip(batch, results):
+                    score = candidate_metrics["Silhouette"].iloc[0]
+                    if score > best_score:
+                        best_score, model, metrics_df = score, candidate, candidate_metrics
+                        report.context["tuning"]["num_clusters"] = num_clusters
+                        improved = True
+                if not improved:
+                    logger.info("No improvement in the last batch, stopping early")
+                    break
+
+        return model, metrics_df
+
+    @staticmethod
+    def _fit_num_clusters(
+        experiment: Any, num_clusters: int, model_name: str
+    ) -> Tuple[Any, pd.DataFrame]:
+        """Fit a clustering model with a given number of clusters."""
+        model = experiment.create_model(
+            model_name, num_clusters=num_clusters, verbose=False
+        )
+        return model, experiment.pull()
+
+    @staticmethod
+    def _register(
+        model: Any,
+        save_model: Any,
+        analysis_type: str,
+        df: pd.DataFrame,
+        target: Optional[str],
+        leaderboard: Optional[pd.DataFrame],
+        report: RunReport,
+        export_onnx: bool = False,
+    ) -> str:
+        """Save a trained model as a new registry version and return its id."""
+
+        def timed_save_model(model: Any, path: str, **kwargs: Any) -> Any:
+            with report.stage("save_model"):
+                return save_model(model, path, **kwargs)
+
+        version = ModelRegistry().register(
+            model,
+            timed_save_model,
+            analysis_type,
+            df,
+            target,
+            leaderboard,
+            training_seconds=report.to_dict()["wall_seconds"],
+            run_report=report,
+            export_onnx=export_onnx,
+        )
+        if version is None:
+            raise RuntimeError("Failed to register trained model")
+        report.log()
+        return version
+
     @staticmethod
     def train_regression_model(
-        df: pd.DataFrame, target: str
-    ) -> Tuple[Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        df: pd.DataFrame, target: str, options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[
+        Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[str]
+    ]:
         """
         Train a regression model using PyCaret.
 
         Args:
             df: Training DataFrame.
             target: Target column name.
+            options: Training options, see resolve_options.
 
         Returns:
-            Tuple of (best_model, setup_df, compare_df).
+            Tuple of (best_model, setup_df, compare_df, version).
         """
+        report = RunReport("training", analysis_type="Regression", target=target)
         try:
+            from pycaret.regression import (
+                compare_models as regression_compare_models,
+                finalize_model as regression_finalize_model,
+                pull as regression_pull,
+                save_model as regression_save_model,
+                setup as regression_setup,
+                tune_model as regression_tune_model,
+            )
+
+            options = MLTrainer.resolve_options(options)
+            report.context["preset"] = options["preset"]
+            setup_kwargs = {
+                "target": target,
+                "fold": options["fold"],
+                "n_jobs": options["n_jobs"],
+            }
+            with report.stage("sample"):
+                sample = MLTrainer.sample_training_data(
+                    df, target, "Regression", options, report
+                )
+
             logger.info(f"Setting up regression experiment with target: {target}")
-            regression_setup(df, target=target)
-            setup_df = regression_pull()
+            with report.stage("setup"):
+                regression_setup(sample, **setup_kwargs)
+                setup_df = regression_pull()
 
-            logger.info("Comparing regression models...")
-            best_model = regression_compare_models()
-            compare_df = regression_pull()
+            logger.info(f"Comparing regression models ({options['preset']} preset)...")
+            with report.stage("compare_models"):
+                best_model = regression_compare_models(
+                    **MLTrainer._compare_kwargs(options, "Regression")
+                )
+                compare_df = regression_pull()
+            report.add_leaderboard(compare_df)
+
+            best_model = MLTrainer._tune(
+                regression_tune_model, best_model, options, report
+            )
+
+            if sample is not df and options["refit_full"]:
+                logger.info(f"Refitting best regression model on all {len(df)} rows...")
+                with report.stage("refit_full"):
+                    # finalize_model fits on train and holdout, i.e. every row
+                    regression_setup(df, **setup_kwargs)
+                    best_model = regression_finalize_model(best_model)
 
             logger.info("Saving best regression model...")
-            model_path = str(BEST_MODEL_PATH.with_suffix(""))
-            regression_save_model(best_model, model_path)
+            version = MLTrainer._register(
+                best_model,
+                regression_save_model,
+                "Regression",
+                df,
+                target,
+                compare_df,
+                report,
+                export_onnx=options["export_onnx"],
+            )
 
-            return best_model, setup_df, compare_df
+            return best_model, setup_df, compare_df, version
         except Exception as e:
             logger.error(f"Error training regression model: {e}")
-            return None, None, None
+            return None, None, None, None
 
     @staticmethod
     def train_classification_model(
-        df: pd.DataFrame, target: str
-    ) -> Tuple[Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        df: pd.DataFrame, target: str, options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[
+        Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[str]
+    ]:
         """
         Train a classification model using PyCaret.
 
         Args:
             df: Training DataFrame.
             target: Target column name.
+            options: Training options, see resolve_options.
 
         Returns:
-            Tuple of (tuned_model, setup_df, compare_df).
+            Tuple of (tuned_model, setup_df, compare_df, version).
         """
+        report = RunReport("training", analysis_type="Classification", target=target)
         try:
+            from pycaret.classification import (
+                compare_models as classification_compare_models,
+                finalize_model as classification_finalize_model,
+                pull as classification_pull,
+                save_model as classification_save_model,
+                setup as classification_setup,
+                tune_model as classification_tune_model,
+            )
+
+            options = MLTrainer.resolve_options(options)
+            report.context["preset"] = options["preset"]
+            setup_kwargs = {
+                "target": target,
+                "fold": options["fold"],
+                "n_jobs": options["n_jobs"],
+            }
+            with report.stage("sample"):
+                sample = MLTrainer.sample_training_data(
+                    df, target, "Classification", options, report
+                )
+
             logger.info(f"Setting up classification experiment with target: {target}")
-            classification_setup(df, target=target)
-            setup_df = classification_pull()
+            with report.stage("setup"):
+                classification_setup(sample, **setup_kwargs)
+                setup_df = classification_pull()
+
+            logger.info(
+                f"Comparing classification models ({options['preset']} preset)..."
+            )
+            with report.stage("compare_models"):
+                best_model = classification_compare_models(
+                    sort="AUC", **MLTrainer._compare_kwargs(options, "Classification")
+                )
+                compare_df = classification_pull()
+            report.add_leaderboard(compare_df)
 
-            logger.info("Comparing classification models...")
-            best_model = classification_compare_models(sort="AUC")
-            compare_df = classification_pull()
+            tuned_model = MLTrainer._tune(
+                classification_tune_model, best_model, options, report, optimize="AUC"
+            )
 
-            logger.info("Tuning best classification model...")
-            tuned_model = tune_model(best_model)
+            if sample is not df and options["refit_full"]:
+                logger.info(
+                    f"Refitting best classification model on all {len(df)} rows..."
+                )
+                with report.stage("refit_full"):
+                    # finalize_model fits on train and holdout, i.e. every row
+                    classification_setup(df, **setup_kwargs)
+                    tuned_model = classification_finalize_model(tuned_model)
 
             logger.info("Saving best classification model...")
-            model_path = str(BEST_MODEL_PATH.with_suffix(""))
-            classification_save_model(tuned_model, model_path)
+            version = MLTrainer._register(
+                tuned_model,
+                classification_save_model,
+                "Classification",
+                df,
+                target,
+                compare_df,
+                report,
+                export_onnx=options["export_onnx"],
+            )
 
-            return tuned_model, setup_df, compare_df
+            return tuned_model, setup_df, compare_df, version
         except Exception as e:
             logger.error(f"Error training classification model: {e}")
-            return None, None, None
+            return None, None, None, None
 
     @staticmethod
     def train_clustering_model(
-        df: pd.DataFrame,
-    ) -> Tuple[Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        df: pd.DataFrame, options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[
+        Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[str]
+    ]:
         """
         Train a clustering model using PyCaret.
 
         Args:
             df: Training DataFrame.
+            options: Training options, see resolve_options. Only n_jobs and
+                the tuning options apply; tuning searches the number of clusters.
 
         Returns:
-            Tuple of (best_model, setup_df, all_metrics_df).
+            Tuple of (best_model, setup_df, all_metrics_df, version).
         """
+        report = RunReport("training", analysis_type="Clustering")
         try:
-            logger.info("Setting up clustering experiment...")
-            clustering_setup(data=df, normalize=True, remove_multicollinearity=True)
-            setup_df = clustering_pull()
+            from pycaret.clustering import ClusteringExperiment
 
-            best_model_name = None
-            best_silhouette = -1
-            all_metrics_df = pd.DataFrame()
+            options = MLTrainer.resolve_options(options)
+            report.context["preset"] = options["preset"]
+            setup_kwargs = {
+                "normalize": True,
+                "remove_multicollinearity": True,
+                "n_jobs": options["n_jobs"],
+            }
+            with report.stage("sample"):
+                sample = MLTrainer.sample_training_data(
+                    df, None, "Clustering", options, report
+                )
 
+            logger.info("Setting up clustering experiment...")
+            with report.stage("setup"):
+                experiment = ClusteringExperiment()
+                experiment.setup(data=sample, **setup_kwargs)
+                setup_df = experiment.pull()
+
+            # Each candidate gets its own copy of the experiment so the fits can
+            # run concurrently without sharing PyCaret's display/pull state
             logger.info("Comparing clustering models...")
-            for model_name in CLUSTERING_MODELS:
-                logger.info(f"Training clustering model: {model_name}")
-                model = clustering_create_model(model_name)
-                metrics_df = clustering_pull()
-                metrics_df["model_name"] = model_name
-                all_metrics_df = pd.concat([all_metrics_df, metrics_df], ignore_index=True)
+            with report.stage("compare_models"):
+                candidate_experiments = {
+                    model_name: copy.deepcopy(experiment)
+                    for model_name in CLUSTERING_MODELS
+                }
+                with ThreadPoolExecutor(max_workers=len(CLUSTERING_MODELS)) as executor:
+                    futures = {
+                        model_name: executor.submit(
+                            MLTrainer._fit_clustering_candidate,
+                            candidate,
+                            model_name,
+                            report,
+                        )
+                        for model_name, candidate in candidate_experiments.items()
+                    }
+                    candidates = {
+                        model_name: future.result()
+                        for model_name, future in futures.items()
+                    }
 
-                current_silhouette = all_metrics_df.loc[
-                    all_metrics_df["model_name"] == model_name, "Silhouette"
-                ].values[0]
+            all_metrics_df = pd.concat(
+                [metrics_df for _, metrics_df in candidates.values()],
+                keys=list(candidates),
+                names=["model_name"],
+            ).droplevel(1)
 
-                if current_silhouette > best_silhouette:
-                    best_silhouette = current_silhouette
-                    best_model_name = model_name
+            best_model_name = all_metrics_df["Silhouette"].idxmax()
+            best_model, best_metrics_df = candidates[best_model_name]
+            logger.info(f"Best clustering model: {best_model_name}")
 
-            all_metrics_df.reset_index(drop=True, inplace=True)
-            all_metrics_df.set_index("model_name", inplace=True)
+            best_model, best_metrics_df = MLTrainer._tune_num_clusters(
+                candidate_experiments[best_model_name],
+                best_model_name,
+                best_model,
+                best_metrics_df,
+                options,
+                report,
+            )
 
-            logger.info(f"Best clustering model: {best_model_name}")
-            best_model = clustering_create_model(best_model_name)
+            best_experiment = candidate_experiments[best_model_name]
+            if sample is not df and options["refit_full"]:
+                logger.info(f"Refitting best clustering model on all {len(df)} rows...")
+                with report.stage("refit_full"):
+                    # Clustering setup keeps no holdout, so create_model sees every row
+                    best_experiment = ClusteringExperiment()
+                    best_experiment.setup(data=df, **setup_kwargs)
+                    # Keep the tuned number of clusters, if the model has one
+                    num_clusters = getattr(best_model, "n_clusters", None)
+                    best_model = best_experiment.create_model(
+                        best_model_name,
+                        verbose=False,
+                        **({"num_clusters": num_clusters} if num_clusters else {}),
+                    )
+                    best_metrics_df = best_experiment.pull()
 
             logger.info("Saving best clustering model...")
-            model_path = str(BEST_MODEL_PATH.with_suffix(""))
-            clustering_save_model(best_model, model_path)
+            version = MLTrainer._register(
+                best_model,
+                best_experiment.save_model,
+                "Clustering",
+                df,
+                None,
+                best_metrics_df.set_axis([best_model_name]),
+                report,
+                export_onnx=options["export_onnx"],
+            )
 
-            return best_model, setup_df, all_metrics_df
+            return best_model, setup_df, all_metrics_df, version
         except Exception as e:
             logger.error(f"Error training clustering model: {e}")
-            return None, None, None
+            return None, None, None, None
+
+    @staticmethod
+    def _fit_clustering_candidate(
+        experiment: Any, model_name: str, report: RunReport
+    ) -> Tuple[Any, pd.DataFrame]:
+        """Fit one clustering candidate, returning the model and its metrics."""
+        logger.info(f"Training clustering model: {model_name}")
+        start = time.perf_counter()
+        start_cpu = time.thread_time()
+        model = experiment.create_model(model_name, verbose=False)
+        report.add_candidate(
+            model_name,
+            time.perf_counter() - start,
+            cpu_seconds=time.thread_time() - start_cpu,
+        )
+        return model, experiment.pull()
+
+    @staticmethod
+    def train(
+        analysis_type: str,
+        df: pd.DataFrame,
+        target: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> Tuple[
+        Optional[Any], Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[str]
+    ]:
+        """
+        Train a model for an analysis type.
+
+        Results are cached on the data contents, target, analysis type and
+        resolved options, so repeating an identical request returns the
+        previous result without retraining.
+
+        Args:
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            df: Training DataFrame.
+            target: Target column name (ignored for clustering).
+            options: Training options, see resolve_options.
+            use_cache: Whether to reuse and store cached results.
+
+        Returns:
+            Tuple of (model, setup_df, comparison_df, version), where version
+            is the model registry version the model was saved as.
+        """
+        train_fns = {
+            "Regression": lambda: MLTrainer.train_regression_model(df, target, options),
+            "Classification": lambda: MLTrainer.train_classification_model(
+                df, target, options
+            ),
+            "Clustering": lambda: MLTrainer.train_clustering_model(df, options),
+        }
+        if analysis_type not in train_fns:
+            logger.error(f"Unknown analysis type: {analysis_type}")
+            return None, None, None, None
+
+        cache, key = None, None
+        if use_cache:
+            try:
+                cache = ExperimentCache()
+                key = cache.make_key(
+                    df,
+                    analysis_type,
+                    target if analysis_type != "Clustering" else None,
+                    MLTrainer.resolve_options(options),
+                )
+                cached = MLTrainer._get_cached_result(cache, key)
+                if cached is not None:
+                    logger.info(f"Reusing cached {analysis_type.lower()} experiment")
+                    return cached
+            except Exception as e:
+                logger.error(f"Error checking experiment cache: {e}")
+                key = None
+
+        result = train_fns[analysis_type]()
+        if key is not None and result[0] is not None:
+            cache.put(key, result)
+        return result
+
+    @staticmethod
+    def _get_cached_result(cache: ExperimentCache, key: str) -> Optional[Tuple[Any, ...]]:
+        """Return a cached result whose registered model version still exists."""
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        if ModelRegistry().get(cached[3]) is None:
+            # The model version was pruned from the registry; retrain
+            cache.delete(key)
+            return None
+        return cached
@@ -0,0 +1,319 @@
+"""
+Model registry module for AutoLearn.
+Stores every trained pipeline as an immutable, versioned entry with metadata.
+
+Each version lives in its own directory under MODEL_REGISTRY_DIR holding the
+model file and a metadata.json. Versions are staged in a hidden directory and
+renamed into place once complete, so concurrent trainers (including separate
+worker processes) never see or overwrite each other's partial entries.
+"""
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from backend.data_handler import DataHandler
+from backend.fast_inference import FastScorer
+from backend.model_serialization import ModelSerializer
+from backend.onnx_export import ONNX_FILENAME, STATUS_FILENAME, OnnxExporter
+from config import MODEL_REGISTRY_DIR, MODEL_REGISTRY_MAX_VERSIONS
+
+if TYPE_CHECKING:
+    from backend.instrumentation import RunReport
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+METADATA_FILENAME = "metadata.json"
+MODEL_FILENAME = "model.pkl"
+
+
+class ModelRegistry:
+    """Manages versioned model storage, lookup and retention."""
+
+    # Listing cache shared by all instances: registry dir -> (dir mtime, versions)
+    _listing_lock = threading.Lock()
+    _listing_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+    def __init__(
+        self,
+        registry_dir: Path = MODEL_REGISTRY_DIR,
+        max_versions: int = MODEL_REGISTRY_MAX_VERSIONS,
+    ):
+        self.registry_dir = Path(registry_dir)
+        self.max_versions = max_versions
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+
+    def register(
+        self,
+        model: Any,
+        save_model: Callable[[Any, str], Any],
+        analysis_type: str,
+        df: pd.DataFrame,
+        target: Optional[str],
+        leaderboard: Optional[pd.DataFrame],
+        training_seconds: float,
+        run_report: Optional["RunReport"] = None,
+        model_format: Optional[str] = None,
+        export_onnx: bool = False,
+    ) -> Optional[str]:
+        """
+        Save a trained model as a new registry version.
+
+        Args:
+            model: Trained pipeline.
+            save_model: PyCaret save_model for the model's task, called with
+                the model, the target path without extension and the
+                format's joblib.dump arguments.
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            df: Training DataFrame, used for the feature schema and data hash.
+            target: Target column name (None for clustering).
+            leaderboard: Model comparison table; its first row is the winner.
+            training_seconds: Wall time spent training.
+            run_report: Instrumentation of the training run. Stored in the
+                metadata once save_model has returned, so it includes the
+                time spent saving.
+            model_format: Key of MODEL_SERIALIZATION_FORMATS. Defaults to
+                MODEL_SERIALIZATION_FORMAT.
+            export_onnx: Also export the model to ONNX next to the model
+                file. Failed exports do not fail registration.
+
+        Returns:
+            The new version id if successful, None otherwise.
+        """
+        version = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        staging_dir = self.registry_dir / f".staging-{version}"
+        try:
+            serialization = ModelSerializer.resolve_format(model_format)
+            staging_dir.mkdir(parents=True)
+            save_model(
+                model,
+                str(staging_dir / Path(MODEL_FILENAME).stem),
+                **ModelSerializer.save_kwargs(serialization["format"]),
+            )
+
+            features = df.drop(columns=[target]) if target else df
+            if export_onnx:
+                stage = run_report.stage("export_onnx") if run_report else nullcontext()
+                with stage:
+                    self._export_onnx(
+                        staging_dir, serialization["format"], features, analysis_type
+                    )
+
+            metadata = {
+                "version": version,
+                "analysis_type": analysis_type,
+                "target": target,
+                "model_name": type(model).__name__,
+                "feature_schema": DataHandler.get_schema(features),
+                "metrics": self._leaderboard_metrics(leaderboard),
+                "training_seconds": training_seconds,
+                "model_size_bytes": (staging_dir / MODEL_FILENAME).stat().st_size,
+                "serialization": serialization,
+                "data_hash": DataHandler.hash_dataframe(df),
+                "n_rows": len(df),
+                "created_at": time.time(),
+            }
+            if run_report is not None:
+                metadata["run_report"] = run_report.to_dict()
+            (staging_dir / METADATA_FILENAME).write_text(
+                json.dumps(metadata, indent=2, default=str)
+            )
+            os.rename(staging_dir, self.registry_dir / version)
+            self._invalidate_listing()
+            logger.info(f"Registered {analysis_type.lower()} model version {version}")
+        except Exception as e:
+            logger.error(f"Error registering model: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+
+        self.enforce_retention()
+        return version
+
+    @staticmethod
+    def _export_onnx(
+        directory: Path, model_format: str, features: pd.DataFrame, analysis_type: str
+    ) -> None:
+        """Export a saved model to ONNX. Failures only mean there is no ONNX model."""
+        if not OnnxExporter.is_available():
+            logger.warning("Skipping ONNX export: skl2onnx and onnxruntime are not installed")
+            return
+        try:
+            # Export the saved artifact: it includes the preprocessing steps
+            # that save_model adds around the trained estimator
+            pipeline = ModelSerializer.load(directory / MODEL_FILENAME, model_format)
+        except Exception as e:
+            logger.warning(f"Could not reload model for ONNX export: {e}")
+            return
+        OnnxExporter.export(pipeline, features, analysis_type, directory)
+
+    @staticmethod
+    def _leaderboard_metrics(leaderboard: Optional[pd.DataFrame]) -> Dict[str, Any]:
+        """Extract the winning row of a leaderboard as plain JSON values."""
+        if leaderboard is None or leaderboard.empty:
+            return {}
+        row = json.loads(leaderboard.head(1).to_json(orient="records"))[0]
+        row["leaderboard_index"] = str(leaderboard.index[0])
+        return row
+
+    def list_versions(self, analysis_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List registered versions, newest first.
+
+        The scan is cached until the registry directory changes, so repeated
+        listing on every Streamlit rerun costs a single stat call.
+
+        Args:
+            analysis_type: Only return versions of this analysis type.
+
+        Returns:
+            List of version metadata dictionaries.
+        """
+        key = str(self.registry_dir.resolve())
+        mtime = self.registry_dir.stat().st_mtime_ns
+        with self._listing_lock:
+            cached = self._listing_cache.get(key)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, self._scan())
+                self._listing_cache[key] = cached
+        versions = cached[1]
+
+        if analysis_type is not None:
+            versions = [v for v in versions if v["analysis_type"] == analysis_type]
+        return list(versions)
+
+    def _invalidate_listing(self) -> None:
+        # Directory mtimes can be too coarse to notice changes made in quick
+        # succession, so changes made through this process drop the cache
+        with self._listing_lock:
+            self._listing_cache.pop(str(self.registry_dir.resolve()), None)
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        versions = []
+        for version_dir in self.registry_dir.iterdir():
+            if version_dir.name.startswith(".") or not version_dir.is_dir():
+                continue
+            try:
+                versions.append(
+                    json.loads((version_dir / METADATA_FILENAME).read_text())
+                )
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable model version {version_dir}: {e}")
+        return sorted(versions, key=lambda v: v["created_at"], reverse=True)
+
+    def get(self, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a version's metadata.
+
+        Args:
+            version: Version id.
+
+        Returns:
+            Metadata dictionary if the version exists, None otherwise.
+        """
+        try:
+            return json.loads((self.registry_dir / version / METADATA_FILENAME).read_text())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def latest(self, analysis_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the newest version's metadata.
+
+        Args:
+            analysis_type: Only consider versions of this analysis type.
+
+        Returns:
+            Metadata dictionary, or None if the registry is empty.
+        """
+        versions = self.list_versions(analysis_type)
+        return versions[0] if versions else None
+
+    def model_path(self, version: str) -> Path:
+        """
+        Return the path of a version's model file.
+
+        Args:
+            version: Version id.
+
+        Returns:
+            Path to the saved pipeline.
+        """
+        return self.registry_dir / version / MODEL_FILENAME
+
+    def onnx_path(self, version: str) -> Optional[Path]:
+        """
+        Return the path of a version's ONNX export.
+
+        Args:
+            version: Version id.
+
+        Returns:
+            Path to model.onnx if the version was exported, None otherwise.
+        """
+        path = self.registry_dir / version / ONNX_FILENAME
+        return path if path.exists() else None
+
+    def onnx_status(self, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the outcome of a version's ONNX export.
+
+        Args:
+            version: Version id.
+
+        Returns:
+            Export status, or None if no export was attempted.
+        """
+        try:
+            return json.loads((self.registry_dir / version / STATUS_FILENAME).read_text())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def delete(self, version: str) -> None:
+        """
+        Remove a version from the registry, and its loaded models from memory.
+
+        Args:
+            version: Version id.
+        """
+        # Imported here: ml_predictor imports this module
+        from backend.ml_predictor import ModelCache
+
+        shutil.rmtree(self.registry_dir / version, ignore_errors=True)
+        ModelCache.invalidate(self.registry_dir / version)
+        FastScorer.invalidate(version)
+        self._invalidate_listing()
+        logger.info(f"Deleted model version {version}")
+
+    def enforce_retention(self) -> None:
+        """
+        Delete the oldest versions beyond max_versions.
+
+        The newest version of each analysis type is always kept.
+        """
+        versions = self.list_versions()
+        if len(versions) <= self.max_versions:
+            return
+
+        newest_per_type = {}
+        for metadata in versions:
+            newest_per_type.setdefault(metadata["analysis_type"], metadata["version"])
+
+        keep = set(newest_per_type.values())
+        for metadata in versions:
+            if len(keep) >= self.max_versions:
+                break
+            keep.add(metadata["version"])
+
+        for metadata in versions:
+            if metadata["version"] not in keep:
+                self.delete(metadata["version"])
@@ -0,0 +1,174 @@
+"""
+Model serialization module for AutoLearn.
+Saves and loads model artifacts in the formats configured in
+MODEL_SERIALIZATION_FORMATS.
+
+Every format is a joblib file, so artifacts stay loadable with PyCaret's
+load_model. Formats differ in compression (smaller files, slower saves) and
+in whether loading memory-maps large numpy arrays (fast cold loads, pages
+shared between processes scoring with the same model).
+"""
+import gzip
+import importlib.util
+import logging
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config import (
+    MODEL_DOWNLOAD_COMPRESS_LEVEL,
+    MODEL_SERIALIZATION_FORMAT,
+    MODEL_SERIALIZATION_FORMATS,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Format assumed for artifacts registered before formats were recorded
+LEGACY_FORMAT = "pickle"
+DOWNLOAD_SUFFIX = ".gz"
+
+
+class ModelSerializer:
+    """Manages model artifact formats."""
+
+    @staticmethod
+    def resolve_format(name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Look up a serialization format, falling back when it is unavailable.
+
+        Args:
+            name: Key of MODEL_SERIALIZATION_FORMATS. Defaults to
+                MODEL_SERIALIZATION_FORMAT.
+
+        Returns:
+            Dictionary with the format's name, compress and mmap settings.
+        """
+        name = name or MODEL_SERIALIZATION_FORMAT
+        if name not in MODEL_SERIALIZATION_FORMATS:
+            raise ValueError(f"Unknown model serialization format: {name}")
+
+        settings = dict(MODEL_SERIALIZATION_FORMATS[name])
+        compress = settings["compress"]
+        if isinstance(compress, (tuple, list)) and compress[0] == "lz4":
+            if importlib.util.find_spec("lz4") is None:
+                logger.warning(f"lz4 is not installed, saving {name} models with zlib")
+                name = "zlib"
+                settings = dict(MODEL_SERIALIZATION_FORMATS[name])
+        return {"format": name, **settings}
+
+    @staticmethod
+    def save_kwargs(name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the extra joblib.dump arguments for a format.
+
+        PyCaret's save_model forwards keyword arguments to joblib.dump, so
+        these can be passed straight to it.
+
+        Args:
+            name: Key of MODEL_SERIALIZATION_FORMATS.
+
+        Returns:
+            Keyword arguments, empty for uncompressed formats.
+        """
+        compress = ModelSerializer.resolve_format(name)["compress"]
+        return {"compress": compress} if compress else {}
+
+    @staticmethod
+    def load(path: Path, name: Optional[str] = None) -> Any:
+        """
+        Load a model artifact.
+
+        Args:
+            path: Model file.
+            name: Format the artifact was saved in. Defaults to LEGACY_FORMAT.
+
+        Returns:
+            The deserialized model.
+        """
+        import joblib
+
+        settings = MODEL_SERIALIZATION_FORMATS.get(name or LEGACY_FORMAT, {})
+        mmap_mode = "r" if settings.get("mmap") else None
+        return joblib.load(path, mmap_mode=mmap_mode)
+
+    @staticmethod
+    def download_path(path: Path, name: Optional[str] = None) -> Path:
+        """
+        Return the file to offer for download, compressing it if needed.
+
+        Compressed artifacts are served as they are. Uncompressed ones get a
+        gzip copy next to them, written once per version; joblib (and so
+        PyCaret's load_model) reads it without unpacking.
+
+        Args:
+            path: Model file.
+            name: Format the artifact was saved in.
+
+        Returns:
+            Path of the file to download.
+        """
+        settings = MODEL_SERIALIZATION_FORMATS.get(name or LEGACY_FORMAT, {})
+        if settings.get("compress"):
+            return path
+
+        gz_path = path.with_name(path.name + DOWNLOAD_SUFFIX)
+        if gz_path.exists():
+            return gz_path
+
+        tmp_path = gz_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            with open(path, "rb") as src, gzip.open(
+                tmp_path, "wb", compresslevel=MODEL_DOWNLOAD_COMPRESS_LEVEL
+            ) as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, gz_path)
+            logger.info(
+                f"Compressed {path} for download: {path.stat().st_size:,} -> "
+                f"{gz_path.stat().st_size:,} bytes"
+            )
+            return gz_path
+        except Exception as e:
+            logger.error(f"Error compressing {path} for download: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return path
+
+    @staticmethod
+    def benchmark(
+        model: Any, directory: Path, names: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Measure save time, load time and artifact size per format.
+
+        Args:
+            model: Model to serialize.
+            directory: Directory for the temporary artifacts.
+            names: Formats to measure. Defaults to all configured formats.
+
+        Returns:
+            Mapping of format name to save_seconds, load_seconds and size_bytes.
+        """
+        import joblib
+
+        results = {}
+        for name in names or list(MODEL_SERIALIZATION_FORMATS):
+            path = Path(directory) / f"benchmark-{name}.pkl"
+            start = time.perf_counter()
+            joblib.dump(model, path, **ModelSerializer.save_kwargs(name))
+            save_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ModelSerializer.load(path, ModelSerializer.resolve_format(name)["format"])
+            load_seconds = time.perf_counter() - start
+
+            results[name] = {
+                "save_seconds": save_seconds,
+                "load_seconds": load_seconds,
+                "size_bytes": path.stat().st_size,
+            }
+            path.unlink()
+        return results
@@ -0,0 +1,236 @@
+"""
+ONNX export module for AutoLearn.
+Converts trained PyCaret pipelines to ONNX and scores them with onnxruntime,
+so processes that only score never have to import PyCaret.
+
+Only pipelines that reduce to standard scikit-learn steps over numeric
+features can be converted. Exports are checked against predict_model before
+they are kept; anything unsupported keeps being scored through PyCaret.
+skl2onnx and onnxruntime are optional (the "onnx" extra) and imported only
+when used.
+"""
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.fast_inference import (
+    LABEL_ENCODING_STEP,
+    format_predictions,
+    predictions_match,
+)
+from config import ONNX_PARITY_ROWS, ONNX_PARITY_TOLERANCE, ONNX_TARGET_OPSET
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ONNX_FILENAME = "model.onnx"
+STATUS_FILENAME = "onnx.json"
+# PyCaret pipeline steps that leave feature values unchanged at predict time
+PASSTHROUGH_STEPS = (LABEL_ENCODING_STEP, "clean_column_names")
+
+
+class OnnxScorer:
+    """Scores DataFrames with an exported ONNX model on the CPU."""
+
+    def __init__(
+        self,
+        path: Path,
+        analysis_type: str,
+        feature_columns: List[str],
+        classes: Optional[List[Any]] = None,
+    ):
+        import onnxruntime
+
+        self.session = onnxruntime.InferenceSession(
+            str(path), providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_names = [output.name for output in self.session.get_outputs()]
+        self.analysis_type = analysis_type
+        self.feature_columns = feature_columns
+        self.classes = np.asarray(classes) if classes is not None else None
+
+    @classmethod
+    def from_directory(cls, directory: Path, analysis_type: str) -> "OnnxScorer":
+        """
+        Load the export stored in a model version directory.
+
+        Args:
+            directory: Version directory holding model.onnx and onnx.json.
+            analysis_type: Analysis type of the version.
+
+        Returns:
+            The scorer.
+        """
+        status = json.loads((Path(directory) / STATUS_FILENAME).read_text())
+        return cls(
+            Path(directory) / ONNX_FILENAME,
+            analysis_type,
+            status["feature_columns"],
+            status.get("classes"),
+        )
+
+    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score a DataFrame.
+
+        Args:
+            df: Data to score. Columns beyond the training features are
+                passed through to the output.
+
+        Returns:
+            df with predict_model's prediction columns appended.
+        """
+        missing = [column for column in self.feature_columns if column not in df.columns]
+        if missing:
+            raise KeyError(f"Missing feature columns: {missing}")
+
+        features = np.ascontiguousarray(
+            df[self.feature_columns].to_numpy(dtype=np.float32)
+        )
+        outputs = dict(
+            zip(self.output_names, self.session.run(None, {self.input_name: features}))
+        )
+        # Classifiers and clusterers output "label", regressors "variable"
+        labels = outputs.get("label", outputs.get("variable")).ravel()
+        scores = None
+        if self.analysis_type == "Classification" and "probabilities" in outputs:
+            scores = outputs["probabilities"].max(axis=1)
+        return format_predictions(df, self.analysis_type, labels, scores, self.classes)
+
+
+class OnnxExporter:
+    """Manages conversion of trained pipelines to ONNX."""
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether skl2onnx and onnxruntime are installed."""
+        return all(
+            importlib.util.find_spec(name) is not None
+            for name in ("skl2onnx", "onnxruntime")
+        )
+
+    @staticmethod
+    def _to_sklearn(model: Any, feature_columns: List[str]) -> Any:
+        """
+        Rebuild a PyCaret pipeline as a plain scikit-learn pipeline.
+
+        PyCaret wraps each preprocessing step to apply it to a subset of
+        columns. Steps are unwrapped when they apply to every feature or to
+        none; any other column subset cannot be expressed and is rejected.
+        """
+        from sklearn.pipeline import Pipeline
+
+        steps = []
+        for name, step in model.steps[:-1]:
+            transformer = getattr(step, "transformer", step)
+            if name in PASSTHROUGH_STEPS or getattr(transformer, "_train_only", False):
+                continue
+            include = getattr(step, "include", None)
+            if include is not None and len(include) == 0:
+                continue
+            if getattr(step, "exclude", None) or (
+                include is not None and set(include) != set(feature_columns)
+            ):
+                raise ValueError(f"Step {name} only transforms some of the columns")
+            steps.append((name, transformer))
+        steps.append(("estimator", model.steps[-1][1]))
+        return Pipeline(steps)
+
+    @staticmethod
+    def export(
+        model: Any, features: pd.DataFrame, analysis_type: str, directory: Path
+    ) -> Dict[str, Any]:
+        """
+        Convert a trained pipeline to ONNX and check it against predict_model.
+
+        Writes model.onnx (only when the check passes) and onnx.json with the
+        outcome to the directory.
+
+        Args:
+            model: Trained PyCaret pipeline.
+            features: Training features (without the target), used for the
+                input signature and the parity check.
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            directory: Model version directory to write to.
+
+        Returns:
+            Export status: "exported" plus details or the failure reason.
+        """
+        directory = Path(directory)
+        onnx_path = directory / ONNX_FILENAME
+        status: Dict[str, Any] = {"exported": False}
+        try:
+            if not OnnxExporter.is_available():
+                raise RuntimeError("skl2onnx and onnxruntime are not installed")
+            non_numeric = [
+                str(column)
+                for column, dtype in features.dtypes.items()
+                if not pd.api.types.is_numeric_dtype(dtype)
+            ]
+            if non_numeric:
+                raise ValueError(f"Non-numeric features are not supported: {non_numeric}")
+
+            from skl2onnx import to_onnx
+
+            feature_columns = [str(column) for column in features.columns]
+            pipeline = OnnxExporter._to_sklearn(model, feature_columns)
+            sample = features.head(ONNX_PARITY_ROWS)
+            options = None
+            if analysis_type == "Classification":
+                # Plain probability tensors instead of a list of dictionaries
+                options = {id(pipeline.steps[-1][1]): {"zipmap": False}}
+            onx = to_onnx(
+                pipeline,
+                sample.to_numpy(dtype=np.float32),
+                target_opset=ONNX_TARGET_OPSET,
+                options=options,
+            )
+
+            tmp_path = onnx_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(onx.SerializeToString())
+            os.replace(tmp_path, onnx_path)
+
+            encoder = dict(model.steps).get(LABEL_ENCODING_STEP)
+            classes = getattr(getattr(encoder, "transformer", encoder), "classes_", None)
+            classes = np.asarray(classes).tolist() if classes is not None else None
+
+            scorer = OnnxScorer(onnx_path, analysis_type, feature_columns, classes)
+            predict_model = importlib.import_module(
+                f"pycaret.{analysis_type.lower()}"
+            ).predict_model
+            if not predictions_match(
+                predict_model(model, data=sample),
+                scorer.predict(sample),
+                sample,
+                atol=ONNX_PARITY_TOLERANCE,
+            ):
+                raise ValueError("ONNX predictions differ from PyCaret's")
+
+            status = {
+                "exported": True,
+                "feature_columns": feature_columns,
+                "classes": classes,
+                "opset": ONNX_TARGET_OPSET,
+                "size_bytes": onnx_path.stat().st_size,
+                "parity_rows": len(sample),
+            }
+            logger.info(f"Exported {analysis_type.lower()} model to {onnx_path}")
+        except Exception as e:
+            logger.warning(f"ONNX export not possible, PyCaret will be used: {e}")
+            onnx_path.unlink(missing_ok=True)
+            status["error"] = str(e)
+
+        tmp_path = directory / f".{STATUS_FILENAME}.{uuid.uuid4().hex}.tmp"
+        tmp_path.write_text(json.dumps(status, indent=2, default=str))
+        os.replace(tmp_path, directory / STATUS_FILENAME)
+        return status
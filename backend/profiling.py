@@ -1,35 +1,208 @@
 """
 Profiling module for AutoLearn.
 Handles data profiling and report generation using YData Profiling.
+
+ydata_profiling is imported when a report is first generated, so importing
+this module stays cheap for pages that never profile data.
 """
+import hashlib
+import json
 import logging
-from typing import Optional
+import os
+import pickle
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import pandas as pd
-from ydata_profiling import ProfileReport
+
+from backend.column_stats import DatasetStats
+from backend.data_handler import DataHandler
+from backend.disk_cache import DiskCache
+from backend.instrumentation import RunReport
+from config import (
+    PROFILE_CACHE_DIR,
+    PROFILE_CACHE_MAX_BYTES,
+    PROFILE_MINIMAL_COLUMNS,
+    PROFILE_SAMPLE_RANDOM_STATE,
+    PROFILE_SAMPLE_ROWS,
+    PROFILE_SAMPLED_SKIP_SECTIONS,
+    PROFILE_SKIPPABLE_SECTIONS,
+    SOURCE_DATA_PATH,
+    SOURCE_STATS_PATH,
+)
+
+if TYPE_CHECKING:
+    from ydata_profiling import ProfileReport
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class ProfileCache(DiskCache):
+    """
+    Persistent cache of rendered profile reports.
+
+    Entries are HTML files named after a hash of the dataset contents and the
+    profiling settings.
+    """
+
+    suffix = ".html"
+    description = "profile cache"
+
+    def __init__(
+        self,
+        cache_dir: Path = PROFILE_CACHE_DIR,
+        max_bytes: int = PROFILE_CACHE_MAX_BYTES,
+    ):
+        super().__init__(cache_dir, max_bytes)
+
+    @staticmethod
+    def make_key(df: pd.DataFrame, settings: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a dataset and its profiling settings.
+
+        Args:
+            df: DataFrame being profiled.
+            settings: Keyword arguments passed to ProfileReport.
+
+        Returns:
+            Hex digest identifying the report.
+        """
+        digest = hashlib.sha256()
+        digest.update(DataHandler.hash_dataframe(df).encode())
+        digest.update(json.dumps(settings or {}, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached report HTML for a key.
+
+        Args:
+            key: Cache key from make_key.
+
+        Returns:
+            HTML string if cached, None otherwise.
+        """
+        data = self.get_bytes(key)
+        return data.decode("utf-8") if data is not None else None
+
+    def put(self, key: str, html: str) -> bool:
+        """
+        Store report HTML under a key and evict old entries if needed.
+
+        Args:
+            key: Cache key from make_key.
+            html: Rendered report HTML.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        return self.put_bytes(key, html.encode("utf-8"))
+
+
 class DataProfiler:
     """Manages data profiling operations."""
 
     @staticmethod
-    def generate_profile_report(df: pd.DataFrame) -> Optional[ProfileReport]:
+    def choose_profile_mode(df: pd.DataFrame) -> str:
+        """
+        Pick a profiling mode from the dataset size.
+
+        Args:
+            df: DataFrame to profile.
+
+        Returns:
+            "minimal" for very wide data, "sampled" for long data, else "full".
+        """
+        if len(df.columns) > PROFILE_MINIMAL_COLUMNS:
+            return "minimal"
+        if len(df) > PROFILE_SAMPLE_ROWS:
+            return "sampled"
+        return "full"
+
+    @staticmethod
+    def default_skip_sections(mode: str) -> List[str]:
+        """
+        Return the report sections skipped by default in a profiling mode.
+
+        Args:
+            mode: Profiling mode.
+
+        Returns:
+            Names of sections from PROFILE_SKIPPABLE_SECTIONS.
+        """
+        return list(PROFILE_SAMPLED_SKIP_SECTIONS) if mode == "sampled" else []
+
+    @staticmethod
+    def build_profile_settings(
+        mode: str, skip_sections: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build ProfileReport settings for a profiling mode.
+
+        Args:
+            mode: "full", "sampled" or "minimal".
+            skip_sections: Sections from PROFILE_SKIPPABLE_SECTIONS to disable.
+
+        Returns:
+            Keyword arguments for ProfileReport.
+        """
+        settings: Dict[str, Any] = {}
+        if mode == "minimal":
+            settings["minimal"] = True
+        for section in skip_sections or []:
+            settings.update(PROFILE_SKIPPABLE_SECTIONS[section])
+        return settings
+
+    @staticmethod
+    def sample_for_profiling(
+        df: pd.DataFrame,
+        n_rows: int = PROFILE_SAMPLE_ROWS,
+        stratify_by: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Sample rows for profiling, optionally stratified by a column.
+
+        Stratified sampling draws the same fraction from every value of the
+        column (missing values form their own stratum), so rare categories
+        keep their share of the sample.
+
+        Args:
+            df: DataFrame to sample.
+            n_rows: Target number of rows.
+            stratify_by: Optional column to stratify on.
+
+        Returns:
+            The sampled DataFrame, or df itself when it is already small enough.
+        """
+        return DataHandler.sample_rows(
+            df,
+            n_rows,
+            strata=df[stratify_by] if stratify_by is not None else None,
+            random_state=PROFILE_SAMPLE_RANDOM_STATE,
+        )
+
+    @staticmethod
+    def generate_profile_report(
+        df: pd.DataFrame, settings: Optional[Dict[str, Any]] = None
+    ) -> Optional["ProfileReport"]:
         """
         Generate a profiling report for the provided DataFrame.
 
         Args:
             df: DataFrame to profile.
+            settings: Optional keyword arguments passed to ProfileReport.
 
         Returns:
             ProfileReport object if successful, None otherwise.
         """
         try:
+            from ydata_profiling import ProfileReport
+
             logger.info("Generating profile report...")
-            report = ProfileReport(df)
+            report = ProfileReport(df, **(settings or {}))
             logger.info("Profile report generated successfully")
             return report
         except Exception as e:
@@ -37,7 +210,7 @@ class DataProfiler:
             return None
 
     @staticmethod
-    def profile_to_html(profile_report: ProfileReport) -> Optional[str]:
+    def profile_to_html(profile_report: "ProfileReport") -> Optional[str]:
         """
         Convert profile report to HTML string.
 
@@ -54,3 +227,232 @@ class DataProfiler:
         except Exception as e:
             logger.error(f"Error converting profile to HTML: {e}")
             return None
+
+    @staticmethod
+    def get_profile_html(
+        df: pd.DataFrame,
+        mode: str = "full",
+        skip_sections: Optional[List[str]] = None,
+        stratify_by: Optional[str] = None,
+        cache: Optional[ProfileCache] = None,
+        report: Optional[RunReport] = None,
+    ) -> Optional[str]:
+        """
+        Return the profile report HTML, generating it only on a cache miss.
+
+        Args:
+            df: DataFrame to profile.
+            mode: "auto", "full", "sampled" or "minimal".
+            skip_sections: Sections to disable. Defaults to the mode's defaults.
+            stratify_by: Column to stratify the sample on in sampled modes.
+            cache: Profile cache to use. Defaults to the configured cache.
+            report: Run report to record stage timings in.
+
+        Returns:
+            HTML string if successful, None otherwise.
+        """
+        if mode == "auto":
+            mode = DataProfiler.choose_profile_mode(df)
+        if skip_sections is None:
+            skip_sections = DataProfiler.default_skip_sections(mode)
+        settings = DataProfiler.build_profile_settings(mode, skip_sections)
+
+        sample_rows = None
+        if mode != "full" and len(df) > PROFILE_SAMPLE_ROWS:
+            sample_rows = PROFILE_SAMPLE_ROWS
+            settings["title"] = (
+                f"Profiling Report ({sample_rows:,} of {len(df):,} rows)"
+            )
+
+        report = report or RunReport("profiling")
+        report.context.update(mode=mode, rows=len(df), columns=len(df.columns))
+
+        cache = cache or ProfileCache()
+        with report.stage("cache_lookup"):
+            try:
+                key = cache.make_key(
+                    df,
+                    {
+                        "settings": settings,
+                        "sample_rows": sample_rows,
+                        "stratify_by": stratify_by,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Error hashing data for profile cache: {e}")
+                key = None
+
+            html = cache.get(key) if key is not None else None
+        if html is not None:
+            report.context["cache_hit"] = True
+            return html
+
+        if sample_rows is not None:
+            logger.info(f"Profiling a sample of {sample_rows} of {len(df)} rows")
+            with report.stage("sample"):
+                df = DataProfiler.sample_for_profiling(df, sample_rows, stratify_by)
+
+        logger.info(f"Profiling in {mode} mode")
+        # ProfileReport computes lazily, so most of the work lands in "render"
+        with report.stage("describe"):
+            profile_report = DataProfiler.generate_profile_report(df, settings)
+        if profile_report is None:
+            return None
+
+        with report.stage("render"):
+            html = DataProfiler.profile_to_html(profile_report)
+        if html is not None and key is not None:
+            with report.stage("cache_store"):
+                cache.put(key, html)
+        report.log()
+        return html
+
+    @staticmethod
+    def _stats_paths(
+        data_path: Optional[Path], stats_path: Optional[Path]
+    ) -> Tuple[Path, Path]:
+        """Resolve a data file and its statistics file (default: the source data)."""
+        if data_path is None:
+            return SOURCE_DATA_PATH, stats_path or SOURCE_STATS_PATH
+        return Path(data_path), Path(stats_path)
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Size and mtime of a data file, None if there is none."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def load_source_stats(
+        data_path: Optional[Path] = None, stats_path: Optional[Path] = None
+    ) -> Optional[DatasetStats]:
+        """
+        Load the stored column statistics of a data file.
+
+        Statistics are stored with the signature of the data file they
+        describe and are only returned while that file is unchanged.
+
+        Args:
+            data_path: Data file described. Defaults to the source data.
+            stats_path: Statistics file; required with data_path.
+
+        Returns:
+            DatasetStats if current statistics are stored, None otherwise.
+        """
+        data_path, stats_path = DataProfiler._stats_paths(data_path, stats_path)
+        try:
+            if not stats_path.exists():
+                return None
+            with open(stats_path, "rb") as f:
+                signature, stats = pickle.load(f)
+            if signature != DataProfiler._file_signature(data_path):
+                logger.info("Stored column statistics are stale")
+                return None
+            return stats
+        except Exception as e:
+            logger.error(f"Error loading column statistics: {e}")
+            return None
+
+    @staticmethod
+    def save_source_stats(
+        stats: DatasetStats,
+        data_path: Optional[Path] = None,
+        stats_path: Optional[Path] = None,
+    ) -> bool:
+        """
+        Store column statistics for the current contents of a data file.
+
+        Args:
+            stats: Statistics of the data file.
+            data_path: Data file described. Defaults to the source data.
+            stats_path: Statistics file; required with data_path.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        data_path, stats_path = DataProfiler._stats_paths(data_path, stats_path)
+        tmp_path = stats_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    (DataProfiler._file_signature(data_path), stats),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, stats_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving column statistics: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+    @staticmethod
+    def get_source_stats(
+        df: pd.DataFrame,
+        data_path: Optional[Path] = None,
+        stats_path: Optional[Path] = None,
+    ) -> DatasetStats:
+        """
+        Return the column statistics of stored data, computing them on a miss.
+
+        Args:
+            df: Contents of the data file.
+            data_path: Data file. Defaults to the source data.
+            stats_path: Statistics file; required with data_path.
+
+        Returns:
+            Statistics of every row of df.
+        """
+        stats = DataProfiler.load_source_stats(data_path, stats_path)
+        if stats is None or stats.rows != len(df):
+            stats = DatasetStats.from_dataframe(df)
+            DataProfiler.save_source_stats(stats, data_path, stats_path)
+        return stats
+
+    @staticmethod
+    def update_source_stats(
+        previous: Optional[DatasetStats],
+        new_rows: pd.DataFrame,
+        combined: pd.DataFrame,
+        report: Optional[RunReport] = None,
+        data_path: Optional[Path] = None,
+        stats_path: Optional[Path] = None,
+    ) -> DatasetStats:
+        """
+        Update the column statistics after rows were appended to stored data.
+
+        Only the new rows are summarized when statistics of the data before
+        the append are available; otherwise every row is.
+
+        Args:
+            previous: Statistics loaded with load_source_stats before the
+                append, or None.
+            new_rows: Appended rows, as stored (see DataHandler.concat_rows).
+            combined: Data after the append.
+            report: Run report to record stage timings in.
+            data_path: File holding the combined data. Defaults to the source data.
+            stats_path: Statistics file; required with data_path.
+
+        Returns:
+            Statistics of the combined data.
+        """
+        report = report or RunReport("column_stats")
+        report.context.update(rows=len(combined), new_rows=len(new_rows))
+        with report.stage("update"):
+            stats = None
+            if previous is not None and previous.rows + len(new_rows) == len(combined):
+                try:
+                    stats = previous.update(new_rows)
+                    report.context["incremental"] = True
+                except ValueError as e:
+                    logger.warning(f"Recomputing column statistics: {e}")
+            if stats is None:
+                stats = DatasetStats.from_dataframe(combined)
+                report.context["incremental"] = False
+        with report.stage("store"):
+            DataProfiler.save_source_stats(stats, data_path, stats_path)
+        report.log()
+        return stats
@@ -0,0 +1,406 @@
+"""
+Scoring service module for AutoLearn.
+Serves MLPredictor over HTTP without Streamlit, for online scoring traffic.
+
+Endpoints:
+    POST /predict  Score rows sent as JSON, CSV or Arrow IPC stream.
+    GET  /health   Liveness check.
+    GET  /metrics  Latency, throughput and batching statistics as JSON.
+
+Usage:
+    python -m backend.scoring_service --analysis-type Regression
+    python -m backend.scoring_service --version 20240101-120000-1a2b3c4d
+"""
+import argparse
+import io
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from backend.ml_predictor import MLPredictor
+from config import (
+    ANALYSIS_TYPES,
+    SCORING_HOST,
+    SCORING_MAX_BATCH_ROWS,
+    SCORING_MAX_WAIT_MS,
+    SCORING_PORT,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_CSV = "text/csv"
+CONTENT_TYPE_ARROW = "application/vnd.apache.arrow.stream"
+
+
+class ServiceMetrics:
+    """Thread-safe request, latency and batching counters."""
+
+    def __init__(self, window: int = 10_000):
+        self._lock = threading.Lock()
+        self._latencies_ms: deque = deque(maxlen=window)
+        self._started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.rows = 0
+        self.batches = 0
+        self.batched_rows = 0
+
+    def record_request(self, rows: int, latency_ms: float, ok: bool) -> None:
+        """Record a finished request."""
+        with self._lock:
+            self.requests += 1
+            if ok:
+                self.rows += rows
+                self._latencies_ms.append(latency_ms)
+            else:
+                self.errors += 1
+
+    def record_batch(self, rows: int) -> None:
+        """Record one predict call made by the micro-batcher."""
+        with self._lock:
+            self.batches += 1
+            self.batched_rows += rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return current metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            uptime = time.time() - self._started_at
+
+            def percentile(p: float) -> Optional[float]:
+                if not latencies:
+                    return None
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+            return {
+                "uptime_seconds": uptime,
+                "requests": self.requests,
+                "errors": self.errors,
+                "rows": self.rows,
+                "requests_per_sec": self.requests / uptime if uptime else 0.0,
+                "rows_per_sec": self.rows / uptime if uptime else 0.0,
+                "latency_ms": {
+                    "p50": percentile(0.50),
+                    "p95": percentile(0.95),
+                    "p99": percentile(0.99),
+                },
+                "batches": self.batches,
+                "avg_batch_rows": (
+                    self.batched_rows / self.batches if self.batches else 0.0
+                ),
+            }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent scoring requests into single predict calls.
+
+    Request threads enqueue their frames and block on a future. A worker
+    thread takes the first waiting request, keeps collecting more for up to
+    max_wait_ms or until max_batch_rows rows are queued, scores them with one
+    predict call and hands each request its slice of the result. If that call
+    fails, the requests are scored one at a time, so a bad request fails alone.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[pd.DataFrame], Optional[pd.DataFrame]],
+        max_batch_rows: int = SCORING_MAX_BATCH_ROWS,
+        max_wait_ms: float = SCORING_MAX_WAIT_MS,
+        metrics: Optional[ServiceMetrics] = None,
+    ):
+        self._predict_fn = predict_fn
+        self._max_batch_rows = max_batch_rows
+        self._max_wait = max_wait_ms / 1000
+        self._metrics = metrics
+        self._queue: "queue.Queue[Tuple[pd.DataFrame, Future]]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="scoring-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score a frame as part of the next batch.
+
+        Args:
+            df: Rows to score.
+
+        Returns:
+            Predictions for exactly these rows.
+        """
+        future: Future = Future()
+        self._queue.put((df, future))
+        return future.result()
+
+    def _collect_batch(self) -> List[Tuple[pd.DataFrame, Future]]:
+        batch = [self._queue.get()]
+        rows = len(batch[0][0])
+        deadline = time.perf_counter() + self._max_wait
+        while rows < self._max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            # Only requests with the same columns can share a predict call
+            groups: Dict[Tuple[str, ...], List[Tuple[pd.DataFrame, Future]]] = {}
+            for df, future in batch:
+                groups.setdefault(tuple(map(str, df.columns)), []).append((df, future))
+            for group in groups.values():
+                self._score_group(group)
+
+    def _score_group(self, group: List[Tuple[pd.DataFrame, Future]]) -> None:
+        if len(group) > 1:
+            try:
+                predictions = self._predict([df for df, _ in group])
+            except Exception as e:
+                # Score each request alone, so only a bad request gets the error
+                logger.warning(
+                    f"Batch of {len(group)} requests failed, scoring them one by one: {e}"
+                )
+            else:
+                offset = 0
+                for df, future in group:
+                    part = predictions.iloc[offset : offset + len(df)]
+                    future.set_result(part.reset_index(drop=True))
+                    offset += len(df)
+                return
+
+        for df, future in group:
+            try:
+                future.set_result(self._predict([df]))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _predict(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        combined = pd.concat(frames, ignore_index=True)
+        predictions = self._predict_fn(combined)
+        if predictions is None:
+            raise RuntimeError("Prediction failed. Check logs for details.")
+        if self._metrics is not None:
+            self._metrics.record_batch(len(combined))
+        return predictions.reset_index(drop=True)
+
+
+def parse_payload(body: bytes, content_type: str) -> pd.DataFrame:
+    """
+    Parse a request body into a DataFrame.
+
+    JSON bodies may be a list of records, {"records": [...]}, or
+    {"columns": [...], "data": [[...], ...]}.
+
+    Args:
+        body: Raw request body.
+        content_type: Request Content-Type header.
+
+    Returns:
+        Parsed DataFrame.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == CONTENT_TYPE_CSV:
+        return pd.read_csv(io.BytesIO(body), index_col=False)
+    if media_type == CONTENT_TYPE_ARROW:
+        import pyarrow as pa
+
+        return pa.ipc.open_stream(body).read_all().to_pandas()
+
+    payload = json.loads(body)
+    if isinstance(payload, list):
+        return pd.DataFrame.from_records(payload)
+    if "records" in payload:
+        return pd.DataFrame.from_records(payload["records"])
+    if "columns" in payload and "data" in payload:
+        return pd.DataFrame(payload["data"], columns=payload["columns"])
+    raise ValueError(
+        "JSON body must be a list of records, 'records' or 'columns'/'data'"
+    )
+
+
+def serialize_predictions(predictions: pd.DataFrame, accept: str) -> Tuple[bytes, str]:
+    """
+    Serialize predictions in the format requested by the Accept header.
+
+    Args:
+        predictions: Predictions DataFrame.
+        accept: Request Accept header.
+
+    Returns:
+        Tuple of (body, content type).
+    """
+    if CONTENT_TYPE_CSV in accept:
+        return predictions.to_csv(index=False).encode(), CONTENT_TYPE_CSV
+    if CONTENT_TYPE_ARROW in accept:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(predictions, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), CONTENT_TYPE_ARROW
+
+    body = '{"predictions": ' + predictions.to_json(orient="records") + "}"
+    return body.encode(), CONTENT_TYPE_JSON
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the scoring endpoints."""
+
+    server: "ScoringServer"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(
+                200,
+                {
+                    "status": "ok",
+                    "analysis_type": self.server.analysis_type,
+                    "version": self.server.version,
+                },
+            )
+        elif self.path == "/metrics":
+            self._send_json(200, self.server.metrics.snapshot())
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/predict":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        start = time.perf_counter()
+        rows = 0
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            df = parse_payload(
+                self.rfile.read(length),
+                self.headers.get("Content-Type", CONTENT_TYPE_JSON),
+            )
+            rows = len(df)
+        except Exception as e:
+            self.server.metrics.record_request(0, 0.0, ok=False)
+            self._send_json(400, {"error": f"Invalid payload: {e}"})
+            return
+
+        try:
+            predictions = self.server.batcher.submit(df)
+            body, content_type = serialize_predictions(
+                predictions, self.headers.get("Accept", CONTENT_TYPE_JSON)
+            )
+        except Exception as e:
+            logger.error(f"Error scoring request: {e}")
+            self.server.metrics.record_request(rows, 0.0, ok=False)
+            self._send_json(500, {"error": str(e)})
+            return
+
+        # Record before responding so a client that reads /metrics right after
+        # its response always sees its own request
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.server.metrics.record_request(rows, latency_ms, ok=True)
+        self._send(200, body, content_type)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(payload).encode(), CONTENT_TYPE_JSON)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the batcher and metrics shared by handlers."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        analysis_type: str,
+        predict_fn: Optional[Callable[[pd.DataFrame], Optional[pd.DataFrame]]] = None,
+        max_batch_rows: int = SCORING_MAX_BATCH_ROWS,
+        max_wait_ms: float = SCORING_MAX_WAIT_MS,
+        version: Optional[str] = None,
+    ):
+        super().__init__(address, ScoringRequestHandler)
+        self.analysis_type = analysis_type
+        self.version = version
+        self.metrics = ServiceMetrics()
+        if predict_fn is None:
+
+            def predict_fn(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+                return MLPredictor.predict(analysis_type, df, version)
+
+        self.batcher = MicroBatcher(
+            predict_fn, max_batch_rows, max_wait_ms, metrics=self.metrics
+        )
+
+
+def main() -> None:
+    """Preload the model and serve predictions until interrupted."""
+    parser = argparse.ArgumentParser(description="AutoLearn scoring service")
+    parser.add_argument(
+        "--analysis-type",
+        choices=ANALYSIS_TYPES,
+        help="Serve the newest model of this type",
+    )
+    parser.add_argument("--version", help="Model registry version to serve")
+    parser.add_argument("--host", default=SCORING_HOST)
+    parser.add_argument("--port", type=int, default=SCORING_PORT)
+    parser.add_argument("--max-batch-rows", type=int, default=SCORING_MAX_BATCH_ROWS)
+    parser.add_argument("--max-wait-ms", type=float, default=SCORING_MAX_WAIT_MS)
+    args = parser.parse_args()
+    if args.version is None and args.analysis_type is None:
+        parser.error("either --version or --analysis-type is required")
+
+    # Pin the resolved version so newly trained models don't change what is served
+    metadata = MLPredictor.preload_model(args.analysis_type, args.version)
+    if metadata is None:
+        raise SystemExit("No trained model could be loaded. Train a model first.")
+
+    server = ScoringServer(
+        (args.host, args.port),
+        metadata["analysis_type"],
+        max_batch_rows=args.max_batch_rows,
+        max_wait_ms=args.max_wait_ms,
+        version=metadata["version"],
+    )
+    logger.info(
+        f"Serving model version {metadata['version']} "
+        f"on http://{args.host}:{args.port}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
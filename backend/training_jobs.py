@@ -0,0 +1,425 @@
+"""
+Training jobs module for AutoLearn.
+Runs MLTrainer experiments in background worker processes so the Streamlit
+script thread is never blocked by a long training run.
+
+Identical requests submitted while a run is in flight share that run: each
+submitter gets its own job, but only one worker trains. Once the run has
+finished, the experiment cache answers identical requests instead.
+"""
+import atexit
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from backend.experiment_cache import ExperimentCache
+from backend.ml_trainer import MLTrainer
+from config import (
+    TRAINING_COALESCE_REQUESTS,
+    TRAINING_JOB_RETENTION_SECONDS,
+    TRAINING_MAX_WORKERS,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+# How long a worker may take to exit after sending its outcome
+WORKER_EXIT_TIMEOUT_SECONDS = 10
+
+
+@dataclass
+class TrainingJob:
+    """State of a single background training job."""
+
+    job_id: str
+    analysis_type: str
+    target: Optional[str]
+    status: str = JOB_QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Tuple[Any, ...]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    # Whether the job attached to an identical run that was already in flight
+    coalesced: bool = False
+    process: Optional[multiprocessing.process.BaseProcess] = field(
+        default=None, repr=False
+    )
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job has reached a terminal status."""
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds spent running so far (or in total once finished)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+
+@dataclass
+class _TrainingRun:
+    """One training run in a worker, shared by the jobs attached to it."""
+
+    key: Optional[str]
+    jobs: List[TrainingJob]
+    cancel_requested: bool = False
+    process: Optional[multiprocessing.process.BaseProcess] = None
+
+
+def _process_entry(conn, train_fn: Callable, args: Tuple[Any, ...]) -> None:
+    """Worker process entry point: run training and send the outcome back."""
+    try:
+        conn.send(("ok", train_fn(*args)))
+    except BaseException as e:
+        conn.send(("error", repr(e)))
+    finally:
+        conn.close()
+        # A non-daemon worker joins its children on exit, including loky's
+        # idle reusable executor, which would only time out after minutes
+        try:
+            from joblib.externals.loky import get_reusable_executor
+
+            get_reusable_executor().shutdown(wait=False)
+        except Exception:
+            pass
+
+
+class TrainingJobManager:
+    """
+    Submits training runs to a bounded pool of worker processes.
+
+    Each run executes in its own spawned process, so running jobs can be
+    cancelled by terminating that process. Workers are not daemonic, because
+    joblib falls back to a single job inside daemon processes; shutdown()
+    terminates any still running. At most max_workers runs execute
+    at once and the rest wait in the queue. The manager lives at module level,
+    so jobs are shared by all Streamlit sessions and survive page reruns.
+
+    With coalescing, a submit identical to one still queued or running
+    attaches a new job to that run. Cancelling a job detaches it; the run
+    itself is cancelled once no job is attached to it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = TRAINING_MAX_WORKERS,
+        train_fn: Callable = MLTrainer.train,
+        coalesce: bool = TRAINING_COALESCE_REQUESTS,
+    ):
+        self._train_fn = train_fn
+        self._coalesce = coalesce
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._jobs: Dict[str, TrainingJob] = {}
+        # Unfinished runs, by job id and by request key
+        self._job_runs: Dict[str, _TrainingRun] = {}
+        self._inflight: Dict[str, _TrainingRun] = {}
+        self._lock = threading.Lock()
+        # Forking a multi-threaded Streamlit server is unsafe, so always spawn
+        self._context = multiprocessing.get_context("spawn")
+
+    @staticmethod
+    def request_key(
+        analysis_type: str,
+        df: pd.DataFrame,
+        target: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Identify a training request for coalescing.
+
+        Uses the experiment cache key, so requests share a run exactly when
+        they would share a cached result.
+
+        Args:
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            df: Training DataFrame.
+            target: Target column name (ignored for clustering).
+            options: Training options, see MLTrainer.resolve_options.
+
+        Returns:
+            Hex digest of the request, or None if it cannot be keyed.
+        """
+        try:
+            return ExperimentCache.make_key(
+                df,
+                analysis_type,
+                target if analysis_type != "Clustering" else None,
+                MLTrainer.resolve_options(options),
+            )
+        except Exception as e:
+            logger.warning(f"Not coalescing training request: {e}")
+            return None
+
+    def submit(
+        self,
+        analysis_type: str,
+        df: pd.DataFrame,
+        target: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Queue a training run, or attach to an identical run in flight.
+
+        Args:
+            analysis_type: One of the configured ANALYSIS_TYPES.
+            df: Training DataFrame.
+            target: Target column name (ignored for clustering).
+            options: Training options, see MLTrainer.resolve_options.
+
+        Returns:
+            The new job id.
+        """
+        self._prune_finished_jobs()
+        key = (
+            self.request_key(analysis_type, df, target, options)
+            if self._coalesce
+            else None
+        )
+        job = TrainingJob(
+            job_id=uuid.uuid4().hex, analysis_type=analysis_type, target=target
+        )
+        with self._lock:
+            self._jobs[job.job_id] = job
+            run = self._inflight.get(key) if key is not None else None
+            if run is not None:
+                current = run.jobs[0]
+                job.coalesced = True
+                job.status = current.status
+                job.started_at = current.started_at
+                job.process = run.process
+                run.jobs.append(job)
+                self._job_runs[job.job_id] = run
+                logger.info(
+                    f"Training job {job.job_id} attached to the identical job "
+                    f"{current.job_id} in flight"
+                )
+                return job.job_id
+
+            run = _TrainingRun(key=key, jobs=[job])
+            self._job_runs[job.job_id] = run
+            if key is not None:
+                self._inflight[key] = run
+
+        thread = threading.Thread(
+            target=self._run_job,
+            args=(run, (analysis_type, df, target, options)),
+            name=f"training-job-{job.job_id[:8]}",
+            daemon=True,
+        )
+        thread.start()
+        logger.info(f"Submitted {analysis_type} training job {job.job_id}")
+        return job.job_id
+
+    def get_job(self, job_id: str) -> Optional[TrainingJob]:
+        """
+        Look up a job by id.
+
+        Args:
+            job_id: Id returned by submit.
+
+        Returns:
+            The job if known, None otherwise.
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[TrainingJob]:
+        """Return all known jobs, most recently submitted first."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return sorted(jobs, key=lambda job: job.submitted_at, reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        The job is detached from its run at once. The run is stopped only
+        when no other job is attached to it.
+
+        Args:
+            job_id: Id returned by submit.
+
+        Returns:
+            True if the job was cancelled, False if it was unknown or finished.
+        """
+        process = None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            run = self._job_runs.pop(job_id, None)
+            if job is None or job.is_finished or run is None:
+                return False
+            job.cancel_requested = True
+            run.jobs.remove(job)
+            self._set_finished(job, JOB_CANCELLED)
+            if not run.jobs:
+                run.cancel_requested = True
+                process = run.process
+                if run.key is not None:
+                    self._inflight.pop(run.key, None)
+
+        if process is not None and process.is_alive():
+            process.terminate()
+        logger.info(f"Cancelled training job {job_id}")
+        return True
+
+    def shutdown(self) -> None:
+        """
+        Cancel every unfinished run and terminate its worker process.
+
+        Called at interpreter exit for the process-wide manager, since
+        non-daemonic workers would otherwise keep the process alive.
+        """
+        with self._lock:
+            runs = {id(run): run for run in self._job_runs.values()}.values()
+            processes = []
+            for run in runs:
+                run.cancel_requested = True
+                if run.process is not None:
+                    processes.append(run.process)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(timeout=WORKER_EXIT_TIMEOUT_SECONDS)
+        if processes:
+            logger.info(f"Terminated {len(processes)} training worker(s)")
+
+    def _run_job(self, run: _TrainingRun, args: Tuple[Any, ...]) -> None:
+        """Wait for a free worker slot, then run the job in a worker process."""
+        while not self._slots.acquire(timeout=0.5):
+            if run.cancel_requested:
+                self._finish(run, JOB_CANCELLED)
+                return
+
+        try:
+            if run.cancel_requested:
+                self._finish(run, JOB_CANCELLED)
+                return
+
+            parent_conn, child_conn = self._context.Pipe(duplex=False)
+            # Not a daemon: joblib (n_jobs, parallel tuning) runs serially in daemons
+            process = self._context.Process(
+                target=_process_entry,
+                args=(child_conn, self._train_fn, args),
+                daemon=False,
+            )
+            process.start()
+            child_conn.close()
+            # Publish the process only once started, so cancel and shutdown
+            # never see one they cannot terminate or join
+            with self._lock:
+                run.process = process
+                started_at = time.time()
+                for job in run.jobs:
+                    job.status = JOB_RUNNING
+                    job.started_at = started_at
+                    job.process = process
+            if run.cancel_requested:
+                process.terminate()
+
+            outcome = None
+            while outcome is None:
+                try:
+                    if parent_conn.poll(0.5):
+                        outcome = parent_conn.recv()
+                    elif not process.is_alive():
+                        break
+                except (EOFError, OSError):
+                    # Worker exited (or was terminated) without sending a result
+                    break
+            # The outcome is in; don't let a slow worker exit hold the slot
+            process.join(timeout=WORKER_EXIT_TIMEOUT_SECONDS)
+            if process.is_alive():
+                logger.warning(f"Terminating training worker {process.pid} on exit")
+                process.terminate()
+                process.join(timeout=WORKER_EXIT_TIMEOUT_SECONDS)
+            parent_conn.close()
+
+            if run.cancel_requested:
+                self._finish(run, JOB_CANCELLED)
+            elif outcome is None:
+                self._finish(
+                    run, JOB_FAILED, error=f"Worker exited with code {process.exitcode}"
+                )
+            elif outcome[0] == "error":
+                self._finish(run, JOB_FAILED, error=outcome[1])
+            elif outcome[1] is None or outcome[1][0] is None:
+                self._finish(run, JOB_FAILED, error="Training failed. Check logs.")
+            else:
+                self._finish(run, JOB_SUCCEEDED, result=outcome[1])
+        except Exception as e:
+            logger.error(f"Error running training run {run.key}: {e}")
+            self._finish(run, JOB_FAILED, error=str(e))
+        finally:
+            self._slots.release()
+
+    def _finish(
+        self,
+        run: _TrainingRun,
+        status: str,
+        result: Optional[Tuple[Any, ...]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Finish every job still attached to a run and retire the run."""
+        with self._lock:
+            if run.key is not None and self._inflight.get(run.key) is run:
+                del self._inflight[run.key]
+            jobs, run.jobs = run.jobs, []
+            run.process = None
+            for job in jobs:
+                self._job_runs.pop(job.job_id, None)
+                self._set_finished(job, status, result, error)
+        for job in jobs:
+            logger.info(f"Training job {job.job_id} finished with status {status}")
+
+    @staticmethod
+    def _set_finished(
+        job: TrainingJob,
+        status: str,
+        result: Optional[Tuple[Any, ...]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        # Callers hold the manager lock
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        job.process = None
+
+    def _prune_finished_jobs(self) -> None:
+        cutoff = time.time() - TRAINING_JOB_RETENTION_SECONDS
+        with self._lock:
+            for job_id, job in list(self._jobs.items()):
+                if job.is_finished and job.finished_at < cutoff:
+                    del self._jobs[job_id]
+
+
+_manager: Optional[TrainingJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> TrainingJobManager:
+    """Return the process-wide training job manager, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = TrainingJobManager()
+            atexit.register(_manager.shutdown)
+        return _manager
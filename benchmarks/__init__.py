@@ -0,0 +1 @@
+"""Benchmarks package for AutoLearn application."""
@@ -0,0 +1,151 @@
+"""
+Inference micro-benchmark for AutoLearn.
+Compares per-call and per-row latency of PyCaret's predict_model with the
+fast scoring path across batch sizes, on models trained on synthetic data.
+
+Models are written to a temporary registry, so benchmarking never touches
+the app's model registry.
+
+Usage:
+    python benchmarks/inference_benchmark.py [--batch-sizes 1 100 10000] [--repeat 20]
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_HISTORY_PATH = Path(__file__).parent / "results" / "inference_history.jsonl"
+DEFAULT_BATCH_SIZES = [1, 10, 100, 1_000, 10_000]
+ANALYSIS_TYPES = ["Regression", "Classification", "Clustering"]
+
+
+def _median_seconds(fn: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of fn over repeat calls, after one warm-up call."""
+    fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench_analysis_type(
+    analysis_type: str, batch_sizes: List[int], repeat: int, preset: str
+) -> Dict[str, Dict[str, float]]:
+    """
+    Train a model and time both scoring paths at every batch size.
+
+    Args:
+        analysis_type: Analysis type to train and score.
+        batch_sizes: Rows per predict call.
+        repeat: Timed calls per batch size and path.
+        preset: Training preset.
+
+    Returns:
+        Mapping of batch size to per-call and per-row latencies of both paths.
+    """
+    from backend.fast_inference import FastScorer
+    from backend.ml_predictor import MLPredictor
+    from backend.ml_trainer import MLTrainer
+    from benchmarks.pipeline_benchmark import make_dataset
+
+    rows = max(batch_sizes)
+    df = make_dataset(analysis_type, max(rows, 1_000), 10)
+    target = None if analysis_type == "Clustering" else "target"
+    version = MLTrainer.train(
+        analysis_type, df, target, {"preset": preset}, use_cache=False
+    )[3]
+    if version is None:
+        raise RuntimeError(f"{analysis_type} training failed")
+
+    model, metadata = MLPredictor._load_model(analysis_type, version)
+    predict_model = importlib.import_module(
+        f"pycaret.{analysis_type.lower()}"
+    ).predict_model
+    features = df.drop(columns=[target] if target else [])
+
+    scorer = FastScorer.get(
+        metadata, model, lambda data: predict_model(model, data=data), features
+    )
+    if scorer is None:
+        raise RuntimeError(f"Fast path is not available for the {analysis_type} model")
+
+    results = {}
+    for batch_size in batch_sizes:
+        batch = features.head(batch_size)
+        slow = _median_seconds(lambda: predict_model(model, data=batch), repeat)
+        fast = _median_seconds(lambda: scorer.predict(batch), repeat)
+        results[str(batch_size)] = {
+            "predict_model_ms_per_call": slow * 1e3,
+            "fast_path_ms_per_call": fast * 1e3,
+            "predict_model_us_per_row": slow * 1e6 / batch_size,
+            "fast_path_us_per_row": fast * 1e6 / batch_size,
+            "speedup": slow / fast if fast > 0 else float("inf"),
+        }
+    return results
+
+
+def main() -> int:
+    """Run the inference micro-benchmark and record the results."""
+    parser = argparse.ArgumentParser(description="AutoLearn inference micro-benchmark")
+    parser.add_argument(
+        "--analysis-types", nargs="+", choices=ANALYSIS_TYPES, default=ANALYSIS_TYPES
+    )
+    parser.add_argument(
+        "--batch-sizes", nargs="+", type=int, default=DEFAULT_BATCH_SIZES
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per batch")
+    parser.add_argument("--preset", default="fast", help="Training preset")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="autolearn-bench-") as workdir:
+        # Must be set before config is imported by the backend modules
+        os.environ["AUTOLEARN_MODEL_REGISTRY_DIR"] = str(Path(workdir) / "registry")
+        os.environ["AUTOLEARN_EXPERIMENT_CACHE_DIR"] = str(Path(workdir) / "experiments")
+        sys.path.insert(0, str(BASE_DIR))
+
+        results = {
+            analysis_type: bench_analysis_type(
+                analysis_type, args.batch_sizes, args.repeat, args.preset
+            )
+            for analysis_type in args.analysis_types
+        }
+
+    for analysis_type, by_batch in results.items():
+        print(f"\n{analysis_type}")
+        print(f"{'rows':>8} {'predict_model':>16} {'fast path':>16} {'speedup':>8}")
+        for batch_size, stats in by_batch.items():
+            print(
+                f"{batch_size:>8} "
+                f"{stats['predict_model_ms_per_call']:>13.2f} ms "
+                f"{stats['fast_path_ms_per_call']:>13.2f} ms "
+                f"{stats['speedup']:>7.1f}x"
+            )
+
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "pandas": pd.__version__,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.history, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"\nResults appended to {args.history}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
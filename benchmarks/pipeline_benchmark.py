@@ -0,0 +1,390 @@
+"""
+Pipeline benchmark for AutoLearn.
+Times profiling, training, batch scoring and model save/load on synthetic
+regression, classification and clustering datasets, keeps a history of runs
+and flags regressions against a stored baseline.
+
+Everything runs offline on CPU. Models and caches are written to a temporary
+directory, so benchmarking never touches the app's model registry.
+
+Usage:
+    python benchmarks/pipeline_benchmark.py [--sizes small medium] [--tasks train]
+    python benchmarks/pipeline_benchmark.py --update-baseline
+    python benchmarks/pipeline_benchmark.py --threshold-for predict/Clustering/small=0.5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_HISTORY_PATH = RESULTS_DIR / "pipeline_history.jsonl"
+DEFAULT_BASELINE_PATH = RESULTS_DIR / "pipeline_baseline.json"
+
+# Dataset sizes as (rows, numeric feature columns)
+DATASET_SIZES = {
+    "small": (1_000, 10),
+    "medium": (10_000, 20),
+    "large": (100_000, 50),
+}
+ANALYSIS_TYPES = ["Regression", "Classification", "Clustering"]
+TASKS = ["profile", "train", "predict", "serialize"]
+RANDOM_SEED = 42
+# Default allowed slowdown relative to the baseline (0.2 = 20% slower)
+DEFAULT_THRESHOLD = 0.2
+
+
+def make_dataset(
+    analysis_type: str, rows: int, columns: int, seed: int = RANDOM_SEED
+) -> pd.DataFrame:
+    """
+    Generate a reproducible synthetic dataset.
+
+    Every dataset has numeric features plus one low-cardinality categorical
+    column, so PyCaret's encoding steps are exercised too. Regression and
+    classification datasets get a "target" column; clustering datasets are
+    drawn from well-separated Gaussian blobs and have no target.
+
+    Args:
+        analysis_type: One of ANALYSIS_TYPES.
+        rows: Number of rows.
+        columns: Number of numeric feature columns.
+        seed: Random seed.
+
+    Returns:
+        The generated DataFrame.
+    """
+    rng = np.random.default_rng(seed)
+    if analysis_type == "Clustering":
+        centers = rng.normal(scale=5.0, size=(4, columns))
+        labels = rng.integers(0, len(centers), size=rows)
+        features = centers[labels] + rng.normal(size=(rows, columns))
+    else:
+        features = rng.normal(size=(rows, columns))
+
+    df = pd.DataFrame(features, columns=[f"x{i}" for i in range(columns)])
+    df["category"] = rng.choice(["a", "b", "c", "d"], size=rows)
+
+    if analysis_type != "Clustering":
+        weights = rng.normal(size=columns)
+        offsets = df["category"].map({"a": 0.0, "b": 1.0, "c": -1.0, "d": 2.0})
+        signal = features @ weights + offsets
+        if analysis_type == "Regression":
+            df["target"] = signal + rng.normal(scale=0.5, size=rows)
+        else:
+            probability = 1 / (1 + np.exp(-signal))
+            df["target"] = (rng.random(rows) < probability).astype(int)
+    return df
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Tuple[Dict[str, float], Any]:
+    """Run fn repeat times, returning timing statistics and the last result."""
+    from backend.instrumentation import peak_rss_mb
+
+    timings: List[float] = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return {
+        "median_seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        "peak_rss_mb": peak_rss_mb(),
+    }, result
+
+
+def bench_profile(df: pd.DataFrame, repeat: int) -> Dict[str, Any]:
+    """Time generating and rendering a full profile report."""
+    from backend.profiling import DataProfiler
+
+    def run() -> Optional[str]:
+        report = DataProfiler.generate_profile_report(df)
+        # ProfileReport computes lazily, so rendering is part of the cost
+        return DataProfiler.profile_to_html(report) if report is not None else None
+
+    stats, html = _time(run, repeat)
+    if html is None:
+        raise RuntimeError("Profile report generation failed")
+    return stats
+
+
+def bench_train(
+    analysis_type: str, df: pd.DataFrame, preset: str, repeat: int
+) -> Tuple[Dict[str, Any], str]:
+    """Time one training method, returning stats and the registered version."""
+    from backend.ml_trainer import MLTrainer
+    from backend.model_registry import ModelRegistry
+
+    options = {"preset": preset}
+    train_fns = {
+        "Regression": lambda: MLTrainer.train_regression_model(df, "target", options),
+        "Classification": lambda: MLTrainer.train_classification_model(
+            df, "target", options
+        ),
+        "Clustering": lambda: MLTrainer.train_clustering_model(df, options),
+    }
+    stats, result = _time(train_fns[analysis_type], repeat)
+    version = result[3]
+    if version is None:
+        raise RuntimeError(f"{analysis_type} training failed")
+
+    run_report = ModelRegistry().get(version).get("run_report", {})
+    stats["stages"] = {
+        stage["stage"]: stage["wall_seconds"] for stage in run_report.get("stages", [])
+    }
+    return stats, version
+
+
+def bench_predict(df: pd.DataFrame, version: str, repeat: int) -> Dict[str, Any]:
+    """Time batch scoring with an already loaded model version."""
+    from backend.ml_predictor import MLPredictor
+
+    features = df.drop(columns=["target"], errors="ignore")
+    load_start = time.perf_counter()
+    if MLPredictor.preload_model(version=version) is None:
+        raise RuntimeError(f"Could not load model version {version}")
+    load_seconds = time.perf_counter() - load_start
+
+    stats, predictions = _time(
+        lambda: MLPredictor.predict(None, features, version), repeat
+    )
+    if predictions is None:
+        raise RuntimeError("Batch scoring failed")
+    stats["load_seconds"] = load_seconds
+    stats["rows_per_sec"] = len(features) / stats["median_seconds"]
+    return stats
+
+
+def bench_serialize(version: str, workdir: Path) -> Dict[str, Dict[str, Any]]:
+    """Time saving and cold-loading a trained model in every artifact format."""
+    from backend.model_registry import ModelRegistry
+    from backend.model_serialization import LEGACY_FORMAT, ModelSerializer
+
+    registry = ModelRegistry()
+    metadata = registry.get(version)
+    model = ModelSerializer.load(
+        registry.model_path(version),
+        metadata.get("serialization", {}).get("format", LEGACY_FORMAT),
+    )
+    results = ModelSerializer.benchmark(model, workdir)
+    # Cold load time is what the baseline check guards
+    for stats in results.values():
+        stats["median_seconds"] = stats["load_seconds"]
+    return results
+
+
+def run_benchmarks(
+    sizes: List[str],
+    analysis_types: List[str],
+    tasks: List[str],
+    preset: str,
+    repeat: int,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the selected benchmarks.
+
+    Args:
+        sizes: Keys of DATASET_SIZES.
+        analysis_types: Analysis types to train and score.
+        tasks: Any of TASKS. Scoring and serialization need a trained model,
+            so "predict" and "serialize" imply training (timed only when
+            "train" is selected).
+        preset: Training preset.
+        repeat: Timed runs per benchmark.
+
+    Returns:
+        Mapping of benchmark name (e.g. "train/Regression/small") to stats.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in sizes:
+        rows, columns = DATASET_SIZES[size]
+        for analysis_type in analysis_types:
+            df = make_dataset(analysis_type, rows, columns)
+
+            if "profile" in tasks and analysis_type == analysis_types[0]:
+                name = f"profile/{size}"
+                print(f"Running {name} ({rows:,} x {columns})...", flush=True)
+                results[name] = bench_profile(df, repeat)
+
+            if not {"train", "predict", "serialize"} & set(tasks):
+                continue
+
+            name = f"train/{analysis_type}/{size}"
+            print(f"Running {name} ({rows:,} x {columns})...", flush=True)
+            stats, version = bench_train(
+                analysis_type, df, preset, repeat if "train" in tasks else 1
+            )
+            if "train" in tasks:
+                results[name] = stats
+
+            if "predict" in tasks:
+                name = f"predict/{analysis_type}/{size}"
+                print(f"Running {name}...", flush=True)
+                results[name] = bench_predict(df, version, repeat)
+
+            if "serialize" in tasks:
+                print(f"Running serialize/{analysis_type}/{size}...", flush=True)
+                with tempfile.TemporaryDirectory() as workdir:
+                    formats = bench_serialize(version, Path(workdir))
+                for model_format, stats in formats.items():
+                    results[f"serialize/{analysis_type}/{size}/{model_format}"] = stats
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    overrides: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    """
+    Find benchmarks that got slower than the baseline allows.
+
+    Args:
+        results: Current results from run_benchmarks.
+        baseline: Baseline record with "benchmarks" and optional per-benchmark
+            "thresholds".
+        threshold: Allowed relative slowdown when no override applies.
+        overrides: Per-benchmark thresholds, taking precedence over the
+            baseline's own.
+
+    Returns:
+        Human-readable descriptions of the regressions found.
+    """
+    thresholds = {**baseline.get("thresholds", {}), **(overrides or {})}
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        allowed = thresholds.get(name, threshold)
+        limit = reference["median_seconds"] * (1 + allowed)
+        if stats["median_seconds"] > limit:
+            regressions.append(
+                f"{name}: {stats['median_seconds']:.3f}s vs baseline "
+                f"{reference['median_seconds']:.3f}s (allowed +{allowed:.0%})"
+            )
+    return regressions
+
+
+def _git_revision() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _parse_overrides(values: List[str]) -> Dict[str, float]:
+    overrides = {}
+    for value in values:
+        name, _, threshold = value.partition("=")
+        overrides[name] = float(threshold)
+    return overrides
+
+
+def main() -> int:
+    """Run the pipeline benchmark, record it and check it against the baseline."""
+    parser = argparse.ArgumentParser(description="AutoLearn pipeline benchmark")
+    parser.add_argument(
+        "--sizes", nargs="+", choices=list(DATASET_SIZES), default=["small", "medium"]
+    )
+    parser.add_argument(
+        "--analysis-types", nargs="+", choices=ANALYSIS_TYPES, default=ANALYSIS_TYPES
+    )
+    parser.add_argument("--tasks", nargs="+", choices=TASKS, default=TASKS)
+    parser.add_argument("--preset", default="fast", help="Training preset")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per benchmark")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown vs the baseline (0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--threshold-for",
+        action="append",
+        default=[],
+        metavar="NAME=THRESHOLD",
+        help="Per-benchmark threshold, e.g. train/Regression/small=0.5",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="autolearn-bench-") as workdir:
+        # Must be set before config is imported by the backend modules
+        os.environ["AUTOLEARN_MODEL_REGISTRY_DIR"] = str(Path(workdir) / "registry")
+        os.environ["AUTOLEARN_EXPERIMENT_CACHE_DIR"] = str(Path(workdir) / "experiments")
+        os.environ["AUTOLEARN_PROFILE_CACHE_DIR"] = str(Path(workdir) / "profiles")
+        sys.path.insert(0, str(BASE_DIR))
+
+        results = run_benchmarks(
+            args.sizes, args.analysis_types, args.tasks, args.preset, args.repeat
+        )
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    for name, stats in results.items():
+        line = f"{name:<32} {stats['median_seconds']:9.3f}s"
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is not None:
+            change = stats["median_seconds"] / reference["median_seconds"] - 1
+            line += f"  ({change:+.0%} vs baseline)"
+        if "rows_per_sec" in stats:
+            line += f"  {stats['rows_per_sec']:,.0f} rows/sec"
+        if "size_bytes" in stats:
+            line += f"  {stats['size_bytes'] / 1e6:,.1f} MB"
+        print(line)
+
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "cpu_count": os.cpu_count(),
+        "preset": args.preset,
+        "benchmarks": results,
+    }
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.history, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"Results appended to {args.history}")
+
+    if args.update_baseline:
+        record["thresholds"] = baseline.get("thresholds", {})
+        record["benchmarks"] = {**baseline.get("benchmarks", {}), **results}
+        args.baseline.write_text(json.dumps(record, indent=2))
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+
+    regressions = compare_to_baseline(
+        results, baseline, args.threshold, _parse_overrides(args.threshold_for)
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Startup-time benchmark for AutoLearn.
+Measures the cold import time of the app entry point and every page module,
+and records which heavy libraries each of them pulls in at import.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--repeat 5] [--history PATH]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_HISTORY_PATH = Path(__file__).parent / "results" / "startup_history.jsonl"
+
+# Modules whose import time we track
+TARGET_MODULES = [
+    "app",
+    "ui.upload_page",
+    "ui.ml_page",
+    "ui.download_page",
+    "ui.inference_page",
+]
+
+# Libraries that should only be imported when a page actually needs them
+HEAVY_MODULES = ["pycaret", "ydata_profiling", "sklearn", "lightgbm"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure_import(module: str, repeat: int) -> Dict[str, Any]:
+    """
+    Import a module in fresh interpreters and time it.
+
+    Args:
+        module: Dotted module name to import.
+        repeat: Number of fresh interpreters to run.
+
+    Returns:
+        Dictionary with median/min import time and heavy modules loaded.
+    """
+    timings: List[float] = []
+    heavy: List[str] = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(sample["seconds"])
+        heavy = sample["heavy"]
+
+    return {
+        "median_seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        "heavy_modules": heavy,
+    }
+
+
+def _git_revision() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _load_last_run(history_path: Path) -> Dict[str, Any]:
+    if not history_path.exists():
+        return {}
+    lines = history_path.read_text().strip().splitlines()
+    return json.loads(lines[-1]) if lines else {}
+
+
+def main() -> None:
+    """Run the startup benchmark and append the result to the history file."""
+    parser = argparse.ArgumentParser(description="AutoLearn startup-time benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per module")
+    parser.add_argument(
+        "--history", type=Path, default=DEFAULT_HISTORY_PATH, help="History file"
+    )
+    args = parser.parse_args()
+
+    previous = _load_last_run(args.history).get("modules", {})
+    results = {}
+    for module in TARGET_MODULES:
+        results[module] = measure_import(module, args.repeat)
+        current = results[module]["median_seconds"]
+        line = f"{module:<20} {current:8.3f}s"
+        if module in previous:
+            line += f"  (previous {previous[module]['median_seconds']:.3f}s)"
+        if results[module]["heavy_modules"]:
+            line += f"  heavy: {', '.join(results[module]['heavy_modules'])}"
+        print(line)
+
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "modules": results,
+    }
+    with open(args.history, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"Results appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
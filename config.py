@@ -15,9 +15,122 @@ DATA_DIR.mkdir(exist_ok=True)
 MODELS_DIR.mkdir(exist_ok=True)
 
 # File paths
-SOURCE_DATA_PATH = DATA_DIR / "sourcedata.csv"
+# Source data is stored as Parquet; the CSV path is only read to migrate data
+# saved by older versions
+SOURCE_DATA_PATH = DATA_DIR / "sourcedata.parquet"
+LEGACY_SOURCE_DATA_PATH = DATA_DIR / "sourcedata.csv"
+SOURCE_DATA_MEMORY_MAP = True
 PREDICTIONS_PATH = DATA_DIR / "predictions.csv"
-BEST_MODEL_PATH = MODELS_DIR / "best_model.pkl"
+
+# Dataset catalog: named datasets under DATASET_CATALOG_DIR, one directory per
+# version. Older versions beyond DATASET_CATALOG_MAX_VERSIONS are deleted.
+DATASET_CATALOG_DIR = Path(
+    os.environ.get("AUTOLEARN_DATASET_CATALOG_DIR", DATA_DIR / "datasets")
+)
+DATASET_CATALOG_MAX_VERSIONS = int(
+    os.environ.get("AUTOLEARN_DATASET_CATALOG_MAX_VERSIONS", 5)
+)
+DATASET_CATALOG_DIR.mkdir(parents=True, exist_ok=True)
+
+# In-memory cache of parsed datasets shared by all sessions (source data and
+# catalog datasets); least recently used datasets are evicted over budget
+DATASET_CACHE_MAX_BYTES = int(
+    os.environ.get("AUTOLEARN_DATASET_CACHE_MAX_BYTES", 2 * 1024 * 1024 * 1024)
+)
+
+# Dtype optimization applied to ingested data (uploads, CLI inputs). The
+# resulting dtypes are recorded with each trained model and applied again to
+# inference inputs so training and scoring see the same schema.
+#   INGEST_DOWNCAST_FLOATS: store float64 columns as float32
+#   INGEST_CATEGORY_MAX_RATIO: string columns with at most this share of
+#       distinct values become category
+#   INGEST_DATETIME_MIN_PARSED: share of sampled values that must parse as
+#       dates for a string column to become datetime
+INGEST_DOWNCAST_FLOATS = True
+INGEST_CATEGORY_MAX_RATIO = 0.5
+INGEST_DATETIME_SAMPLE_ROWS = 1_000
+INGEST_DATETIME_MIN_PARSED = 0.95
+
+# Versioned model registry: one directory per trained model under MODELS_DIR
+MODEL_REGISTRY_DIR = Path(
+    os.environ.get("AUTOLEARN_MODEL_REGISTRY_DIR", MODELS_DIR / "registry")
+)
+MODEL_REGISTRY_MAX_VERSIONS = int(
+    os.environ.get("AUTOLEARN_MODEL_REGISTRY_MAX_VERSIONS", 20)
+)
+
+# Model artifact formats. compress is joblib's compress argument (0 = none);
+# mmap loads large numpy arrays as read-only memory maps instead of reading
+# them into memory, which only works for uncompressed files. Formats using an
+# optional compressor fall back to "zlib" when it is not installed.
+MODEL_SERIALIZATION_FORMATS = {
+    "pickle": {"compress": 0, "mmap": False},
+    "mmap": {"compress": 0, "mmap": True},
+    "zlib": {"compress": ("zlib", 3), "mmap": False},
+    "lz4": {"compress": ("lz4", 3), "mmap": False},
+}
+MODEL_SERIALIZATION_FORMAT = os.environ.get("AUTOLEARN_MODEL_FORMAT", "mmap")
+# gzip level for downloads of uncompressed models (joblib reads gzip directly)
+MODEL_DOWNLOAD_COMPRESS_LEVEL = 6
+
+# Training result cache: identical data, target, analysis type and options
+# reuse the previous run instead of retraining
+EXPERIMENT_CACHE_DIR = Path(
+    os.environ.get("AUTOLEARN_EXPERIMENT_CACHE_DIR", MODELS_DIR / "experiment_cache")
+)
+EXPERIMENT_CACHE_MAX_BYTES = int(
+    os.environ.get("AUTOLEARN_EXPERIMENT_CACHE_MAX_BYTES", 2 * 1024 * 1024 * 1024)
+)
+EXPERIMENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Profile report cache (content-addressed, LRU-evicted once over the size budget)
+PROFILE_CACHE_DIR = Path(
+    os.environ.get("AUTOLEARN_PROFILE_CACHE_DIR", DATA_DIR / "profile_cache")
+)
+PROFILE_CACHE_MAX_BYTES = int(
+    os.environ.get("AUTOLEARN_PROFILE_CACHE_MAX_BYTES", 500 * 1024 * 1024)
+)
+PROFILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Profiling modes. "auto" picks one from the dataset size:
+#   full: every row, all report sections
+#   sampled: rows above PROFILE_SAMPLE_ROWS are sampled, expensive sections skipped
+#   minimal: YData minimal mode (no correlations, interactions or duplicates),
+#            sampled above PROFILE_SAMPLE_ROWS
+PROFILE_MODES = ["auto", "full", "sampled", "minimal"]
+PROFILE_SAMPLE_ROWS = 100_000
+PROFILE_MINIMAL_COLUMNS = 100
+PROFILE_SAMPLE_RANDOM_STATE = 42
+
+# Report sections that can be skipped, with the YData settings that disable them
+PROFILE_SKIPPABLE_SECTIONS = {
+    "interactions": {"interactions": {"continuous": False, "targets": []}},
+    "duplicates": {"duplicates": {"head": 0}},
+    "correlations": {
+        "correlations": {
+            "auto": {"calculate": False},
+            "pearson": {"calculate": False},
+            "spearman": {"calculate": False},
+            "kendall": {"calculate": False},
+            "phi_k": {"calculate": False},
+            "cramers": {"calculate": False},
+        }
+    },
+    "missing_diagrams": {"missing_diagrams": {"heatmap": False}},
+}
+PROFILE_SAMPLED_SKIP_SECTIONS = ["interactions", "duplicates", "missing_diagrams"]
+
+# Mergeable column statistics of the source data, updated incrementally when
+# rows are appended (see backend/column_stats.py):
+#   PROFILE_STATS_HISTOGRAM_BINS: maximum histogram bins per numeric column
+#   PROFILE_STATS_HLL_PRECISION: HyperLogLog precision of the distinct counts
+#                                (2**p registers, ~1.04 / sqrt(2**p) error)
+#   PROFILE_STATS_MAX_CATEGORIES: exact value counts are kept for non-numeric
+#                                 columns up to this many distinct values
+SOURCE_STATS_PATH = DATA_DIR / "sourcedata_stats.pkl"
+PROFILE_STATS_HISTOGRAM_BINS = 64
+PROFILE_STATS_HLL_PRECISION = 12
+PROFILE_STATS_MAX_CATEGORIES = 1_000
 
 # Application settings
 APP_TITLE = "AutoLearn"
@@ -32,8 +145,131 @@ APP_INFO = (
 # Navigation options
 NAVIGATION_OPTIONS = ["Upload", "ML", "Download", "Model Inference"]
 
+# Streaming inference: rows scored per chunk, and the upload size above which
+# the inference page switches to streaming mode by default
+INFERENCE_CHUNK_SIZE = 50_000
+INFERENCE_STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+# Loaded models, ONNX sessions and fast-path scorers kept in memory per
+# process; the least recently used are evicted beyond this many
+MODEL_CACHE_MAX_ENTRIES = int(os.environ.get("AUTOLEARN_MODEL_CACHE_MAX_ENTRIES", 8))
+# Fast-path inference calls the fitted pipeline directly instead of PyCaret's
+# predict_model. Each model version is checked once against predict_model on
+# the first rows it scores, and stays on predict_model if outputs differ.
+INFERENCE_FAST_PATH = os.environ.get("AUTOLEARN_INFERENCE_FAST_PATH", "1") != "0"
+INFERENCE_FAST_PATH_CHECK_ROWS = 100
+# ONNX export (needs the onnx extra: skl2onnx and onnxruntime). Exported
+# models are checked against predict_model on up to ONNX_PARITY_ROWS rows of
+# the training data and only kept when predictions agree within the
+# tolerance. Versions with an ONNX export are scored with onnxruntime unless
+# AUTOLEARN_INFERENCE_ONNX=0.
+ONNX_PARITY_ROWS = 200
+ONNX_PARITY_TOLERANCE = 1e-3
+ONNX_TARGET_OPSET = 15
+INFERENCE_ONNX = os.environ.get("AUTOLEARN_INFERENCE_ONNX", "1") != "0"
+
+# Headless scoring service
+SCORING_HOST = os.environ.get("AUTOLEARN_SCORING_HOST", "127.0.0.1")
+SCORING_PORT = int(os.environ.get("AUTOLEARN_SCORING_PORT", 8502))
+SCORING_MAX_BATCH_ROWS = 10_000
+SCORING_MAX_WAIT_MS = 5
+
+# Background training jobs
+TRAINING_MAX_WORKERS = int(os.environ.get("AUTOLEARN_TRAINING_MAX_WORKERS", 2))
+TRAINING_POLL_INTERVAL_SECONDS = 2
+TRAINING_JOB_RETENTION_SECONDS = 24 * 60 * 60
+# Identical submits (same data, target, analysis type and resolved options)
+# attach to the run already in flight instead of starting another
+TRAINING_COALESCE_REQUESTS = (
+    os.environ.get("AUTOLEARN_TRAINING_COALESCE", "1") != "0"
+)
+
 # ML analysis types
 ANALYSIS_TYPES = ["Regression", "Classification", "Clustering"]
 
 # Clustering models that support predict_model
 CLUSTERING_MODELS = ["kmeans", "ap", "birch"]
+# Clustering models whose number of clusters is tuned, and the values tried
+CLUSTERING_NUM_CLUSTERS_MODELS = ["kmeans", "birch"]
+CLUSTERING_NUM_CLUSTERS_RANGE = range(2, 11)
+
+# Hyperparameter search strategies for the tuning stage, as tune_model
+# arguments. Strategies using optional search libraries fall back to "random"
+# when the library is not installed. "none" skips tuning.
+TUNING_STRATEGIES = {
+    "none": None,
+    "random": {"search_library": "scikit-learn", "search_algorithm": "random"},
+    "bayesian": {"search_library": "scikit-optimize", "search_algorithm": "bayesian"},
+    "tpe": {"search_library": "optuna", "search_algorithm": "tpe"},
+    # TPE with optuna's ASHA pruner. PyCaret prunes only estimators with
+    # partial_fit (e.g. sgd, mlp); for the others this is plain TPE
+    "tpe-asha": {
+        "search_library": "optuna",
+        "search_algorithm": "tpe",
+        "early_stopping": "asha",
+    },
+}
+
+# Training presets trade accuracy against latency. Option keys:
+#   n_jobs: parallel jobs for folds and models (-1 uses all cores)
+#   fold: number of cross-validation folds
+#   budget_time: wall-clock budget in minutes for model comparison (None or 0 = unlimited)
+#   include / exclude: model ids to compare or skip, optionally per analysis type
+#   turbo: skip estimators PyCaret marks as slow
+#   tune: search strategy from TUNING_STRATEGIES for the tuning stage
+#   tune_n_iter: search iterations (for clustering, cluster counts tried)
+#   tune_budget_time: wall-clock budget in minutes for tuning (None or 0 = unlimited)
+#   sample_rows: above this many rows, model selection and tuning run on a
+#       stratified sample (None or 0 = always use all rows)
+#   refit_full: after selecting on a sample, refit the winner on all rows
+#   export_onnx: also export the model to ONNX (see ONNX_* settings)
+TRAINING_PRESETS = {
+    "fast": {
+        "n_jobs": -1,
+        "fold": 3,
+        "budget_time": 2,
+        "include": {
+            "Regression": ["lr", "ridge", "dt", "rf", "lightgbm"],
+            "Classification": ["lr", "nb", "dt", "rf", "lightgbm"],
+        },
+        "exclude": None,
+        "turbo": True,
+        "tune": "none",
+        "tune_n_iter": 5,
+        "tune_budget_time": 1,
+        "sample_rows": 50_000,
+        "refit_full": True,
+        "export_onnx": False,
+    },
+    "balanced": {
+        "n_jobs": -1,
+        "fold": 5,
+        "budget_time": 10,
+        "include": None,
+        "exclude": None,
+        "turbo": True,
+        "tune": "random",
+        "tune_n_iter": 10,
+        "tune_budget_time": 5,
+        "sample_rows": 200_000,
+        "refit_full": True,
+        "export_onnx": False,
+    },
+    "exhaustive": {
+        "n_jobs": -1,
+        "fold": 10,
+        "budget_time": None,
+        "include": None,
+        "exclude": None,
+        "turbo": False,
+        "tune": "tpe",
+        "tune_n_iter": 50,
+        "tune_budget_time": None,
+        "sample_rows": 1_000_000,
+        "refit_full": True,
+        "export_onnx": False,
+    },
+}
+DEFAULT_TRAINING_PRESET = "balanced"
+# Regression targets are binned into this many quantiles to stratify samples
+TRAINING_SAMPLE_TARGET_BINS = 10
+TRAINING_SAMPLE_RANDOM_STATE = 42
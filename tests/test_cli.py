@@ -0,0 +1,135 @@
+"""
+Unit tests for cli module.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend import cli
+from backend.data_handler import DatasetCatalog
+from backend.ml_predictor import MLPredictor
+from backend.ml_trainer import MLTrainer
+
+
+class TestCli:
+    """Test suite for the command line entry points."""
+
+    def test_predict_scores_each_file(self, tmp_path, monkeypatch):
+        """Test that every input file gets its own predictions file."""
+        monkeypatch.setattr(
+            MLPredictor,
+            "resolve_version",
+            staticmethod(lambda analysis_type, version: {"version": "v1"}),
+        )
+        monkeypatch.setattr(
+            MLPredictor,
+            "predict",
+            staticmethod(
+                lambda analysis_type, df, version: df.assign(prediction_label=1)
+            ),
+        )
+        csv_path = tmp_path / "a.csv"
+        parquet_path = tmp_path / "b.parquet"
+        pd.DataFrame({"A": [1, 2, 3]}).to_csv(csv_path, index=False)
+        pd.DataFrame({"A": [4, 5]}).to_parquet(parquet_path, index=False)
+
+        exit_code = cli.main(
+            [
+                "predict",
+                str(csv_path),
+                str(parquet_path),
+                "--analysis-type",
+                "Regression",
+                "--output-dir",
+                str(tmp_path / "out"),
+                "--workers",
+                "1",
+                "--chunk-size",
+                "2",
+                "--report",
+            ]
+        )
+
+        assert exit_code == 0
+        assert len(pd.read_csv(tmp_path / "out" / "a_predictions.csv")) == 3
+        report = json.loads((tmp_path / "out" / "a_report.json").read_text())
+        assert {"read", "predict", "write"} <= {s["stage"] for s in report["stages"]}
+        assert len(pd.read_csv(tmp_path / "out" / "b_predictions.csv")) == 2
+
+    def test_predict_requires_model_selection(self, tmp_path):
+        """Test that predict needs either a version or an analysis type."""
+        path = tmp_path / "a.csv"
+        pd.DataFrame({"A": [1]}).to_csv(path, index=False)
+        assert cli.main(["predict", str(path)]) == 2
+
+    def test_train_requires_target(self, tmp_path):
+        """Test that supervised training without a target is rejected."""
+        path = tmp_path / "a.csv"
+        pd.DataFrame({"A": [1, 2]}).to_csv(path, index=False)
+        assert cli.main(["train", str(path), "--analysis-type", "Regression"]) == 2
+
+    def test_train_passes_options(self, tmp_path, monkeypatch):
+        """Test that preset and overrides reach the trainer."""
+        received = {}
+
+        def fake_train(analysis_type, df, target, options, use_cache=True):
+            received.update(options, analysis_type=analysis_type, target=target)
+            return "model", pd.DataFrame(), pd.DataFrame({"Model": ["lr"]}), "v1"
+
+        monkeypatch.setattr(MLTrainer, "train", staticmethod(fake_train))
+        path = tmp_path / "a.csv"
+        pd.DataFrame({"A": [1, 2], "B": [3, 4]}).to_csv(path, index=False)
+
+        exit_code = cli.main(
+            [
+                "train",
+                str(path),
+                "--analysis-type",
+                "Regression",
+                "--target",
+                "B",
+                "--preset",
+                "fast",
+                "--fold",
+                "4",
+            ]
+        )
+
+        assert exit_code == 0
+        assert received["preset"] == "fast"
+        assert received["fold"] == 4
+        assert received["target"] == "B"
+
+    def test_export_writes_dataset_versions_as_csv(self, tmp_path, monkeypatch):
+        """Test that export writes the newest or a given dataset version."""
+        catalog = DatasetCatalog(tmp_path / "datasets")
+        monkeypatch.setattr(cli, "DatasetCatalog", lambda: catalog)
+        first = catalog.add("My Data", pd.DataFrame({"A": [1, 2]}))
+        catalog.add("My Data", pd.DataFrame({"A": [3]}))
+        newest, older = tmp_path / "newest.csv", tmp_path / "older.csv"
+
+        assert cli.main(["export", "--dataset", "My Data", "--output", str(newest)]) == 0
+        assert cli.main(
+            [
+                "export",
+                "--dataset",
+                "My Data",
+                "--version",
+                first["version"],
+                "--output",
+                str(older),
+            ]
+        ) == 0
+        assert pd.read_csv(newest)["A"].tolist() == [3]
+        assert pd.read_csv(older)["A"].tolist() == [1, 2]
+        assert cli.main(["export", "--version", first["version"]]) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+Unit tests for column_stats module and incremental source data statistics.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import backend.data_handler as data_handler
+import backend.profiling as profiling
+from backend.column_stats import DatasetStats, Histogram, HyperLogLog, NumericStats
+from backend.data_handler import DataHandler, DatasetCache
+from backend.profiling import DataProfiler
+
+
+def make_df(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(size=n_rows)
+    values[::7] = np.nan
+    return pd.DataFrame(
+        {
+            "x": values,
+            "n": rng.integers(-50, 50, size=n_rows),
+            "c": rng.choice(["a", "b", "c"], size=n_rows),
+        }
+    )
+
+
+class TestNumericStats:
+    """Test suite for NumericStats class."""
+
+    def test_merge_matches_statistics_of_all_values(self):
+        """Test that merged moments equal those computed over both parts."""
+        rng = np.random.default_rng(0)
+        first, second = rng.exponential(size=1_000), rng.normal(5, 2, size=300)
+        values = pd.Series(np.concatenate([first, second]))
+
+        merged = NumericStats.from_values(first).merge(NumericStats.from_values(second))
+
+        assert merged.count == len(values)
+        assert merged.mean == pytest.approx(values.mean())
+        assert merged.std == pytest.approx(values.std())
+        assert merged.minimum == values.min() and merged.maximum == values.max()
+        assert merged.skewness == pytest.approx(values.skew(), rel=1e-2)
+        assert merged.kurtosis == pytest.approx(values.kurt(), rel=1e-2)
+
+
+class TestSketches:
+    """Test suite for the histogram and distinct count sketches."""
+
+    def test_histogram_merge_keeps_every_value(self):
+        """Test that histograms over different ranges merge without losing counts."""
+        first, second = Histogram(max_bins=16), Histogram(max_bins=16)
+        first.add(np.linspace(0, 1, 100))
+        second.add(np.linspace(-1_000, 5_000, 50))
+
+        merged = first.merge(second)
+
+        assert sum(count for _, _, count in merged.bins()) == 150
+        assert len(merged.bins()) <= 16
+        assert merged.bins()[0][0] <= -1_000 and merged.bins()[-1][1] > 5_000
+
+    def test_hyperloglog_estimate_and_merge(self):
+        """Test that distinct counts are close and merging counts the union."""
+        first, second = HyperLogLog(), HyperLogLog()
+        first.add(pd.Series(np.arange(20_000)))
+        second.add(pd.Series(np.arange(10_000, 30_000)))
+
+        assert first.estimate() == pytest.approx(20_000, rel=0.05)
+        assert first.merge(second).estimate() == pytest.approx(30_000, rel=0.05)
+
+        small = HyperLogLog()
+        small.add(pd.Series(["a", "b", "a", "c"]))
+        assert small.estimate() == 3
+
+
+class TestDatasetStats:
+    """Test suite for DatasetStats class."""
+
+    def test_update_matches_full_computation(self):
+        """Test that appending rows gives the statistics of the combined data."""
+        old, new = make_df(500, 1), make_df(200, 2)
+        combined = pd.concat([old, new], ignore_index=True)
+
+        updated = DatasetStats.from_dataframe(old).update(new).summary()
+        full = DatasetStats.from_dataframe(combined).summary()
+
+        assert updated.index.tolist() == ["x", "n", "c"]
+        pd.testing.assert_frame_equal(updated, full, check_exact=False, rtol=1e-9)
+        assert updated.loc["x", "missing"] == combined["x"].isna().sum()
+        assert updated.loc["c", "freq"] == combined["c"].value_counts().max()
+
+    def test_merge_rejects_different_columns(self):
+        """Test that statistics of unrelated datasets cannot be merged."""
+        with pytest.raises(ValueError):
+            DatasetStats.from_dataframe(make_df(10, 1)).update(
+                pd.DataFrame({"other": [1.0]})
+            )
+
+
+class TestIncrementalSourceStats:
+    """Test suite for appending to the stored source data."""
+
+    @pytest.fixture(autouse=True)
+    def source_paths(self, tmp_path, monkeypatch):
+        source = tmp_path / "source.parquet"
+        monkeypatch.setattr(data_handler, "SOURCE_DATA_PATH", source)
+        monkeypatch.setattr(data_handler, "LEGACY_SOURCE_DATA_PATH", tmp_path / "s.csv")
+        monkeypatch.setattr(profiling, "SOURCE_DATA_PATH", source)
+        monkeypatch.setattr(profiling, "SOURCE_STATS_PATH", tmp_path / "stats.pkl")
+        DatasetCache.invalidate()
+        yield
+        DatasetCache.invalidate()
+
+    def test_append_casts_to_stored_dtypes(self):
+        """Test that appended rows take the stored dtypes and categories merge."""
+        stored, _ = DataHandler.optimize_dtypes(make_df(100, 1))
+        DataHandler.save_source_data(stored)
+        new_rows = pd.DataFrame({"c": ["d"], "n": [3], "x": [1.5]})
+
+        combined = DataHandler.concat_rows(stored, new_rows)
+
+        assert len(combined) == 101
+        assert DataHandler.get_schema(combined) == DataHandler.get_schema(stored)
+        assert combined["c"].iloc[-1] == "d"
+        with pytest.raises(ValueError):
+            DataHandler.concat_rows(stored, pd.DataFrame({"z": [1]}))
+
+    def test_stats_are_updated_from_new_rows_only(self, monkeypatch):
+        """Test that an append summarizes the new rows, not the whole dataset."""
+        old, new = make_df(300, 1), make_df(50, 2)
+        DataHandler.save_source_data(old)
+        DataProfiler.get_source_stats(old)
+
+        previous = DataProfiler.load_source_stats()
+        combined = DataHandler.concat_rows(old, new)
+        DataHandler.save_source_data(combined)
+        assert DataProfiler.load_source_stats() is None  # stale after the append
+
+        summarized = []
+        original = DatasetStats.from_dataframe.__func__
+        monkeypatch.setattr(
+            DatasetStats,
+            "from_dataframe",
+            classmethod(lambda cls, df: summarized.append(len(df)) or original(cls, df)),
+        )
+        stats = DataProfiler.update_source_stats(previous, combined.tail(len(new)), combined)
+
+        assert summarized == [50]
+        assert stats.rows == 350
+        assert DataProfiler.load_source_stats().rows == 350
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
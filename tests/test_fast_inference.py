@@ -0,0 +1,178 @@
+"""
+Unit tests for fast_inference module.
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.fast_inference import FastScorer
+from backend.ml_predictor import MLPredictor
+
+
+class FakePipeline:
+    """Minimal stand-in for a fitted PyCaret pipeline."""
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    def __getitem__(self, index):
+        return FakePipeline(self.steps[index])
+
+    def transform(self, X):
+        for _, step in self.steps:
+            X = step.transform(X)
+        return X
+
+
+class Doubler:
+    def transform(self, X):
+        return X * 2
+
+
+class PassThroughLabelEncoder:
+    """Mimics PyCaret's label encoding wrapper, which leaves X untouched."""
+
+    def __init__(self, classes):
+        self.transformer = SimpleNamespace(classes_=np.array(classes))
+
+    def transform(self, X):
+        return X
+
+
+class SumRegressor:
+    def predict(self, X):
+        return X.sum(axis=1) + 0.123456
+
+
+class ThresholdClassifier:
+    def predict(self, X):
+        return (X[:, 0] > 0).astype(int)
+
+    def predict_proba(self, X):
+        p = (X[:, 0] > 0).astype(float) * 0.6 + 0.2
+        return np.column_stack([1 - p, p])
+
+
+def metadata(version, analysis_type, columns):
+    return {
+        "version": version,
+        "analysis_type": analysis_type,
+        "feature_schema": {column: "float64" for column in columns},
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_scorers():
+    FastScorer.invalidate()
+    yield
+    FastScorer.invalidate()
+
+
+class TestFastScorer:
+    """Test suite for FastScorer class."""
+
+    def test_regression_output_matches_predict_model_columns(self):
+        """Test that labels are appended and rounded like predict_model's."""
+        model = FakePipeline([("scale", Doubler()), ("trained_model", SumRegressor())])
+        scorer = FastScorer(model, "Regression", ["a", "b"])
+        df = pd.DataFrame({"b": [1.0, 2.0], "a": [0.5, 0.0], "id": ["x", "y"]})
+
+        result = scorer.predict(df)
+
+        assert list(result.columns) == ["b", "a", "id", "prediction_label"]
+        assert result["prediction_label"].tolist() == [3.1235, 4.1235]
+        assert "prediction_label" not in df.columns
+
+    def test_nan_regression_predictions_stay_nan(self):
+        """Test that NaN predictions are not turned into plausible zeros."""
+        model = FakePipeline([("trained_model", SumRegressor())])
+        scorer = FastScorer(model, "Regression", ["a"])
+
+        result = scorer.predict(pd.DataFrame({"a": [1.0, np.nan]}))
+
+        assert result["prediction_label"].iloc[0] == 1.1235
+        assert np.isnan(result["prediction_label"].iloc[1])
+
+    def test_classification_decodes_labels_and_scores(self):
+        """Test that encoded labels are mapped back and scores are max probabilities."""
+        model = FakePipeline(
+            [
+                ("label_encoding", PassThroughLabelEncoder(["no", "yes"])),
+                ("trained_model", ThresholdClassifier()),
+            ]
+        )
+        scorer = FastScorer(model, "Classification", ["a"])
+
+        result = scorer.predict(pd.DataFrame({"a": [1.0, -1.0]}))
+
+        assert result["prediction_label"].tolist() == ["yes", "no"]
+        assert result["prediction_score"].tolist() == [0.8, 0.8]
+
+    def test_missing_feature_is_an_error(self):
+        """Test that inputs without a training column are rejected."""
+        model = FakePipeline([("trained_model", SumRegressor())])
+        scorer = FastScorer(model, "Regression", ["a", "b"])
+
+        with pytest.raises(KeyError):
+            scorer.predict(pd.DataFrame({"a": [1.0]}))
+
+    def test_get_validates_once_per_version(self):
+        """Test that predict_model is consulted only on the first request."""
+        model = FakePipeline([("trained_model", SumRegressor())])
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+        calls = []
+
+        def reference(data):
+            calls.append(len(data))
+            return data.assign(prediction_label=np.round(data["a"] + 0.123456, 4))
+
+        first = FastScorer.get(metadata("v1", "Regression", ["a"]), model, reference, df)
+        second = FastScorer.get(metadata("v1", "Regression", ["a"]), model, reference, df)
+
+        assert first is not None and first is second
+        assert calls == [2]
+
+    def test_get_rejects_mismatching_output(self):
+        """Test that a version whose fast output differs keeps using predict_model."""
+        model = FakePipeline([("trained_model", SumRegressor())])
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+
+        def reference(data):
+            return data.assign(prediction_label=data["a"] * 10)
+
+        assert FastScorer.get(metadata("v2", "Regression", ["a"]), model, reference, df) is None
+
+
+class TestMLPredictorScore:
+    """Test suite for the predictor's choice of scoring path."""
+
+    def test_falls_back_to_predict_model(self):
+        """Test that a failing fast path does not fail the request."""
+        model = FakePipeline([("trained_model", SumRegressor())])
+        meta = metadata("v3", "Regression", ["a"])
+
+        def predict_model(model, data):
+            return data.assign(prediction_label=np.round(data["a"] + 0.123456, 4))
+
+        fast = MLPredictor._score(model, meta, pd.DataFrame({"a": [1.0]}), predict_model)
+        # Missing feature column: the fast path raises, predict_model answers
+        slow = MLPredictor._score(
+            model,
+            meta,
+            pd.DataFrame({"b": [1.0]}),
+            lambda model, data: data.assign(prediction_label=0.0),
+        )
+
+        assert fast["prediction_label"].tolist() == [1.1235]
+        assert slow["prediction_label"].tolist() == [0.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
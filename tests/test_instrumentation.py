@@ -0,0 +1,75 @@
+"""
+Unit tests for instrumentation module.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.instrumentation import RunReport
+
+
+class TestRunReport:
+    """Test suite for RunReport class."""
+
+    def test_stages_accumulate(self):
+        """Test that repeated stages add up and count their calls."""
+        report = RunReport("inference")
+
+        for _ in range(3):
+            with report.stage("predict"):
+                sum(range(1000))
+        with report.stage("write"):
+            pass
+
+        stages = {s["stage"]: s for s in report.to_dict()["stages"]}
+        assert list(stages) == ["predict", "write"]
+        assert stages["predict"]["calls"] == 3
+        assert stages["predict"]["wall_seconds"] >= 0
+        assert "cpu_seconds" in stages["predict"]
+
+    def test_stage_recorded_on_error(self):
+        """Test that a failing stage is still timed."""
+        report = RunReport("training")
+
+        with pytest.raises(ValueError):
+            with report.stage("setup"):
+                raise ValueError("bad data")
+
+        assert report.to_dict()["stages"][0]["stage"] == "setup"
+
+    def test_add_leaderboard(self):
+        """Test that candidate fit times are read from a PyCaret leaderboard."""
+        leaderboard = pd.DataFrame(
+            {"Model": ["Linear Regression", "Random Forest"], "TT (Sec)": [0.1, 2.5]},
+            index=["lr", "rf"],
+        )
+        report = RunReport("training")
+
+        report.add_leaderboard(leaderboard)
+
+        assert report.candidates == [
+            {"model": "Linear Regression", "fit_seconds": 0.1, "model_id": "lr"},
+            {"model": "Random Forest", "fit_seconds": 2.5, "model_id": "rf"},
+        ]
+
+    def test_save_writes_json(self, tmp_path):
+        """Test that the saved report is valid JSON with its context."""
+        report = RunReport("profiling", mode="full")
+        with report.stage("render"):
+            pass
+
+        assert report.save(tmp_path / "report.json") is True
+        saved = json.loads((tmp_path / "report.json").read_text())
+        assert saved["name"] == "profiling"
+        assert saved["context"] == {"mode": "full"}
+        assert saved["stages"][0]["stage"] == "render"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,38 @@
+"""
+Tests that backend modules defer their heavy imports.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "backend.ml_trainer",
+        "backend.ml_predictor",
+        "backend.model_registry",
+        "backend.profiling",
+        "backend.cli",
+    ],
+)
+def test_backend_import_does_not_load_heavy_libraries(module):
+    """Test that importing a backend module loads neither PyCaret nor ydata_profiling."""
+    code = (
+        f"import sys, {module}; "
+        "heavy = ('pycaret', 'ydata_profiling', 'streamlit'); "
+        "loaded = [m for m in heavy if m in sys.modules]; "
+        "assert not loaded, loaded"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BASE_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
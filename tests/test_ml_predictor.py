@@ -0,0 +1,209 @@
+"""
+Unit tests for ml_predictor module.
+"""
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import backend.data_handler as data_handler
+from backend.ml_predictor import MLPredictor, ModelCache
+from backend.model_registry import ModelRegistry
+
+
+class TestModelCache:
+    """Test suite for ModelCache class."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ModelCache.invalidate()
+        yield
+        ModelCache.invalidate()
+
+    def test_repeated_get_loads_once(self, tmp_path):
+        """Test that an unchanged model file is deserialized only once."""
+        path = tmp_path / "model.pkl"
+        path.write_bytes(b"model")
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return object()
+
+        first = ModelCache.get(path, loader)
+        second = ModelCache.get(path, loader)
+
+        assert first is second
+        assert len(loads) == 1
+
+    def test_reloads_when_file_changes(self, tmp_path):
+        """Test that rewriting the model file invalidates the entry."""
+        path = tmp_path / "model.pkl"
+        path.write_bytes(b"model")
+        first = ModelCache.get(path, lambda: "v1")
+
+        path.write_bytes(b"new model")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+        assert first == "v1"
+        assert ModelCache.get(path, lambda: "v2") == "v2"
+
+    def test_invalidate(self, tmp_path):
+        """Test explicit invalidation forces a reload."""
+        path = tmp_path / "model.pkl"
+        path.write_bytes(b"model")
+        ModelCache.get(path, lambda: "v1")
+
+        ModelCache.invalidate(path)
+
+        assert ModelCache.get(path, lambda: "v2") == "v2"
+
+    def test_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        """Test that the cache keeps only the most recently used models."""
+        monkeypatch.setattr(ModelCache, "max_entries", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.pkl"
+            path.write_bytes(name.encode())
+            paths.append(path)
+
+        ModelCache.get(paths[0], lambda: "a")
+        ModelCache.get(paths[1], lambda: "b")
+        ModelCache.get(paths[0], lambda: "reloaded a")
+        ModelCache.get(paths[2], lambda: "c")
+
+        assert ModelCache.get(paths[0], lambda: "reloaded a") == "a"
+        assert ModelCache.get(paths[1], lambda: "reloaded b") == "reloaded b"
+
+    def test_slow_load_does_not_block_other_models(self, tmp_path):
+        """Test that loading one model leaves lookups of others unblocked."""
+        slow, fast = tmp_path / "slow.pkl", tmp_path / "fast.pkl"
+        slow.write_bytes(b"slow")
+        fast.write_bytes(b"fast")
+        started, release = threading.Event(), threading.Event()
+
+        def slow_loader():
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        thread = threading.Thread(target=ModelCache.get, args=(slow, slow_loader))
+        thread.start()
+        started.wait(5)
+        try:
+            assert ModelCache.get(fast, lambda: "fast") == "fast"
+        finally:
+            release.set()
+            thread.join(5)
+        assert ModelCache.get(slow, lambda: "reloaded") == "slow"
+
+    def test_registry_delete_drops_cached_models(self, tmp_path):
+        """Test that deleting a registry version evicts its loaded models."""
+        registry = ModelRegistry(tmp_path / "registry")
+        version = registry.register(
+            "model",
+            lambda model, path: Path(path + ".pkl").write_bytes(b"model"),
+            "Regression",
+            pd.DataFrame({"A": [1], "B": [2]}),
+            "B",
+            None,
+            training_seconds=0.0,
+        )
+        path = registry.model_path(version)
+        ModelCache.get(path, lambda: "model")
+
+        registry.delete(version)
+
+        assert str(path.resolve()) not in ModelCache._entries
+
+
+class TestMLPredictor:
+    """Test suite for MLPredictor class."""
+
+    @pytest.fixture(autouse=True)
+    def registered_versions(self, monkeypatch):
+        # Each lookup of the latest version finds a newer one
+        versions = iter(f"v{i}" for i in range(1, 100))
+        monkeypatch.setattr(
+            MLPredictor,
+            "resolve_version",
+            staticmethod(
+                lambda analysis_type=None, version=None: {
+                    "version": version or next(versions),
+                    "analysis_type": analysis_type,
+                }
+            ),
+        )
+
+    def test_predict_stream_appends_every_chunk(self, tmp_path, monkeypatch):
+        """Test that each chunk is scored and appended to the output file."""
+        output = tmp_path / "predictions.csv"
+        monkeypatch.setattr(data_handler, "PREDICTIONS_PATH", output)
+        monkeypatch.setattr(
+            MLPredictor,
+            "predict",
+            staticmethod(
+                lambda analysis_type, df, version: df.assign(
+                    prediction_label=df["A"] * 2
+                )
+            ),
+        )
+        chunks = [pd.DataFrame({"A": [1, 2]}), pd.DataFrame({"A": [3]})]
+        progress = []
+
+        stats = MLPredictor.predict_stream(
+            "Regression", chunks, on_chunk=lambda rows, elapsed, preds: progress.append(rows)
+        )
+
+        assert stats["rows"] == 3
+        assert stats["chunks"] == 2
+        assert progress == [2, 3]
+        result = pd.read_csv(output)
+        assert result["prediction_label"].tolist() == [2, 4, 6]
+
+    def test_predict_stream_stops_on_failure(self, tmp_path, monkeypatch):
+        """Test that a failed chunk aborts streaming."""
+        monkeypatch.setattr(data_handler, "PREDICTIONS_PATH", tmp_path / "p.csv")
+        monkeypatch.setattr(MLPredictor, "predict", staticmethod(lambda t, df, v: None))
+
+        assert MLPredictor.predict_stream("Regression", [pd.DataFrame({"A": [1]})]) is None
+
+    def test_predict_stream_pins_the_latest_version(self, tmp_path, monkeypatch):
+        """Test that every chunk is scored by the version latest at the start."""
+        monkeypatch.setattr(data_handler, "PREDICTIONS_PATH", tmp_path / "p.csv")
+        used = []
+        monkeypatch.setattr(
+            MLPredictor,
+            "predict",
+            staticmethod(lambda t, df, version: used.append(version) or df),
+        )
+        chunks = [pd.DataFrame({"A": [i]}) for i in range(3)]
+
+        assert MLPredictor.predict_stream("Regression", chunks)["chunks"] == 3
+        assert used == ["v1", "v1", "v1"]
+
+    def test_predict_stream_keeps_output_on_failure(self, tmp_path, monkeypatch):
+        """Test that a failure mid-stream leaves no truncated output file."""
+        output = tmp_path / "p.csv"
+        output.write_text("prediction_label\n1\n")
+        monkeypatch.setattr(data_handler, "PREDICTIONS_PATH", output)
+        monkeypatch.setattr(
+            MLPredictor,
+            "predict",
+            staticmethod(lambda t, df, v: df if df["A"].iloc[0] == 1 else None),
+        )
+        chunks = [pd.DataFrame({"A": [1]}), pd.DataFrame({"A": [2]})]
+
+        assert MLPredictor.predict_stream("Regression", chunks) is None
+        assert output.read_text() == "prediction_label\n1\n"
+        assert [path.name for path in tmp_path.iterdir()] == ["p.csv"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,329 @@
+"""
+Unit tests for ml_trainer module.
+"""
+import sys
+import types
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import backend.ml_trainer as ml_trainer
+from backend.experiment_cache import ExperimentCache
+from backend.instrumentation import RunReport
+from backend.ml_trainer import MLTrainer
+from backend.model_registry import ModelRegistry
+from config import DEFAULT_TRAINING_PRESET, TRAINING_PRESETS
+
+
+def fake_pycaret_task(monkeypatch, task, calls):
+    """Install a stand-in pycaret.<task> module that records setup and refit calls."""
+    module = types.ModuleType(f"pycaret.{task}")
+    module.setup = lambda data, **kwargs: calls.append(("setup", len(data)))
+    module.pull = lambda: pd.DataFrame({"Model": ["best"]})
+    module.compare_models = lambda **kwargs: "best"
+    module.tune_model = lambda model, **kwargs: model
+    module.finalize_model = lambda model: calls.append(("finalize", model)) or f"final-{model}"
+    module.save_model = lambda model, path, **kwargs: None
+    monkeypatch.setitem(sys.modules, "pycaret", types.ModuleType("pycaret"))
+    monkeypatch.setitem(sys.modules, f"pycaret.{task}", module)
+
+
+class FakeClusteringExperiment:
+    """Stand-in for PyCaret's ClusteringExperiment that records each fit."""
+
+    silhouettes = {"kmeans": 0.5, "ap": 0.7, "birch": 0.3}
+    # (experiment id, model name) of every create_model call
+    fits = []
+
+    def setup(self, data, **kwargs):
+        self.metrics = pd.DataFrame({"Description": ["Session id"]})
+
+    def create_model(self, model_name, verbose=False, **kwargs):
+        FakeClusteringExperiment.fits.append((id(self), model_name))
+        self.metrics = pd.DataFrame({"Silhouette": [self.silhouettes[model_name]]})
+        return f"{model_name}-model"
+
+    def pull(self):
+        return self.metrics
+
+    def save_model(self, model, path, **kwargs):
+        pass
+
+
+class TestMLTrainer:
+    """Test suite for MLTrainer class."""
+
+    def test_resolve_options_defaults_to_preset(self):
+        """Test that missing options fall back to the default preset."""
+        options = MLTrainer.resolve_options()
+        assert options["preset"] == DEFAULT_TRAINING_PRESET
+        assert options["fold"] == TRAINING_PRESETS[DEFAULT_TRAINING_PRESET]["fold"]
+
+    def test_resolve_options_overrides(self):
+        """Test that explicit overrides win and None keeps the preset value."""
+        options = MLTrainer.resolve_options({"preset": "fast", "fold": 7, "n_jobs": None})
+        assert options["fold"] == 7
+        assert options["n_jobs"] == TRAINING_PRESETS["fast"]["n_jobs"]
+
+    def test_resolve_options_unknown_preset(self):
+        """Test that an unknown preset is rejected."""
+        with pytest.raises(ValueError):
+            MLTrainer.resolve_options({"preset": "nonexistent"})
+
+    def test_compare_kwargs_per_task_include(self):
+        """Test that per-task include lists are selected by analysis type."""
+        options = MLTrainer.resolve_options({"preset": "fast", "budget_time": 0})
+        kwargs = MLTrainer._compare_kwargs(options, "Classification")
+        assert kwargs["include"] == TRAINING_PRESETS["fast"]["include"]["Classification"]
+        assert kwargs["budget_time"] is None
+
+
+class TestSampleTrainingData:
+    """Test suite for sampling large training sets."""
+
+    def test_sample_training_data(self):
+        """Test that large classification sets are sampled by class."""
+        df = pd.DataFrame({"A": range(2000), "label": [0] * 1996 + [1] * 4})
+        options = MLTrainer.resolve_options({"sample_rows": 200, "fold": 3})
+
+        sample = MLTrainer.sample_training_data(df, "label", "Classification", options)
+
+        assert len(sample) < len(df)
+        assert sample["label"].value_counts()[1] == 3
+
+    def test_sample_training_data_disabled(self):
+        """Test that sample_rows of 0 keeps every row."""
+        df = pd.DataFrame({"A": range(100), "y": range(100)})
+        options = MLTrainer.resolve_options({"sample_rows": 0})
+        assert MLTrainer.sample_training_data(df, "y", "Regression", options) is df
+
+
+class TestTuning:
+    """Test suite for the tuning stage."""
+
+    def test_tuning_disabled(self):
+        """Test that the none strategy returns the untuned model."""
+        options = MLTrainer.resolve_options({"tune": "none"})
+        report = RunReport("training")
+
+        tuned = MLTrainer._tune(lambda model, **kw: "tuned", "model", options, report)
+
+        assert tuned == "model"
+        assert report.stages == {}
+
+    def test_tune_passes_search_options(self):
+        """Test that strategy, budget and choose_better reach tune_model."""
+        received = {}
+
+        def fake_tune_model(model, **kwargs):
+            received.update(kwargs)
+            return "tuned"
+
+        options = MLTrainer.resolve_options(
+            {"tune": "random", "tune_n_iter": 7, "fold": 3}
+        )
+        tuned = MLTrainer._tune(
+            fake_tune_model, "model", options, RunReport("training"), optimize="AUC"
+        )
+
+        assert tuned == "tuned"
+        assert received["search_library"] == "scikit-learn"
+        assert received["n_iter"] == 7
+        assert received["fold"] == 3
+        assert received["choose_better"] is True
+        assert received["optimize"] == "AUC"
+
+    def test_missing_search_library_falls_back_to_random(self, monkeypatch):
+        """Test that optuna strategies degrade to random search without optuna."""
+        monkeypatch.setattr(ml_trainer.importlib.util, "find_spec", lambda name: None)
+        options = MLTrainer.resolve_options(
+            {"tune": "tpe-asha", "tune_budget_time": 2}
+        )
+
+        kwargs = MLTrainer._tune_kwargs(options)
+
+        assert kwargs["search_library"] == "scikit-learn"
+        assert "early_stopping" not in kwargs
+        assert "timeout" not in kwargs
+
+    def test_optuna_strategy_gets_timeout(self, monkeypatch):
+        """Test that the tuning budget becomes an optuna timeout in seconds."""
+        monkeypatch.setattr(
+            ml_trainer.importlib.util, "find_spec", lambda name: object()
+        )
+        options = MLTrainer.resolve_options(
+            {"tune": "tpe-asha", "tune_budget_time": 2}
+        )
+
+        kwargs = MLTrainer._tune_kwargs(options)
+
+        assert kwargs["early_stopping"] == "asha"
+        assert kwargs["timeout"] == 120
+
+    def test_num_clusters_search_keeps_best(self):
+        """Test that the cluster count with the best Silhouette wins."""
+
+        class FakeExperiment:
+            def create_model(self, model_name, num_clusters, verbose):
+                self.num_clusters = num_clusters
+                return f"{model_name}-{num_clusters}"
+
+            def pull(self):
+                # Silhouette peaks at 3 clusters
+                score = 1 - abs(self.num_clusters - 3) / 10
+                return pd.DataFrame({"Silhouette": [score]})
+
+        options = MLTrainer.resolve_options(
+            {"tune": "random", "tune_n_iter": 6, "n_jobs": 2}
+        )
+        model, metrics = MLTrainer._tune_num_clusters(
+            FakeExperiment(),
+            "kmeans",
+            "kmeans-4",
+            pd.DataFrame({"Silhouette": [0.9]}),
+            options,
+            RunReport("training"),
+        )
+
+        assert model == "kmeans-3"
+        assert metrics["Silhouette"].iloc[0] == 1.0
+
+    def test_num_clusters_skipped_for_unsupported_model(self):
+        """Test that models without a cluster count are left alone."""
+        options = MLTrainer.resolve_options({"tune": "random"})
+        metrics = pd.DataFrame({"Silhouette": [0.5]})
+
+        assert MLTrainer._tune_num_clusters(
+            None, "ap", "ap-model", metrics, options, RunReport("training")
+        ) == ("ap-model", metrics)
+
+
+class TestRefitFull:
+    """Test suite for refitting the selected model on every row."""
+
+    def test_refit_finalizes_on_all_rows(self, monkeypatch):
+        """Test that the winner is finalized after a setup on the full data."""
+        calls, registered = [], []
+        fake_pycaret_task(monkeypatch, "regression", calls)
+        monkeypatch.setattr(
+            MLTrainer,
+            "_register",
+            staticmethod(lambda model, *args, **kwargs: registered.append(model) or "v1"),
+        )
+        df = pd.DataFrame({"A": range(1000), "y": range(1000)})
+
+        model, _, _, version = MLTrainer.train_regression_model(
+            df, "y", {"sample_rows": 100, "tune": "none", "refit_full": True}
+        )
+
+        assert calls[0][0] == "setup" and calls[0][1] < len(df)
+        assert calls[1:] == [("setup", len(df)), ("finalize", "best")]
+        assert model == registered[0] == "final-best"
+        assert version == "v1"
+
+
+class TestClustering:
+    """Test suite for the concurrent clustering candidates."""
+
+    def test_candidates_fit_on_copies_and_winner_is_reused(self, monkeypatch):
+        """Test per-candidate experiments, the metrics index and the saved winner."""
+        module = types.ModuleType("pycaret.clustering")
+        module.ClusteringExperiment = FakeClusteringExperiment
+        monkeypatch.setitem(sys.modules, "pycaret", types.ModuleType("pycaret"))
+        monkeypatch.setitem(sys.modules, "pycaret.clustering", module)
+        monkeypatch.setattr(FakeClusteringExperiment, "fits", [])
+        registered = {}
+
+        def fake_register(model, save_fn, *args, **kwargs):
+            registered.update(model=model, experiment=save_fn.__self__)
+            return "v1"
+
+        monkeypatch.setattr(MLTrainer, "_register", staticmethod(fake_register))
+        df = pd.DataFrame({"A": range(50), "B": range(50)})
+
+        model, _, all_metrics_df, version = MLTrainer.train_clustering_model(
+            df, {"tune": "none", "sample_rows": 0}
+        )
+
+        fits = FakeClusteringExperiment.fits
+        assert sorted(name for _, name in fits) == ["ap", "birch", "kmeans"]
+        assert len({experiment_id for experiment_id, _ in fits}) == 3
+        assert all_metrics_df.index.name == "model_name"
+        assert all_metrics_df.index.tolist() == ["kmeans", "ap", "birch"]
+        # The winner is saved as fitted, from its own experiment, without a refit
+        assert model == registered["model"] == "ap-model"
+        assert (id(registered["experiment"]), "ap") in fits
+        assert version == "v1"
+
+
+class TestExperimentCache:
+    """Test suite for cached training results."""
+
+    @pytest.fixture
+    def registry(self, tmp_path, monkeypatch):
+        registry = ModelRegistry(tmp_path / "registry")
+        cache = ExperimentCache(tmp_path / "cache", max_bytes=10_000_000)
+        monkeypatch.setattr(ml_trainer, "ModelRegistry", lambda: registry)
+        monkeypatch.setattr(ml_trainer, "ExperimentCache", lambda: cache)
+        return registry
+
+    @pytest.fixture
+    def runs(self, registry, monkeypatch):
+        runs = []
+
+        def fake_train(df, target, options=None):
+            runs.append(target)
+            version = registry.register(
+                "model",
+                lambda model, path: Path(path + ".pkl").write_bytes(b"model"),
+                "Regression",
+                df,
+                target,
+                None,
+                training_seconds=0.0,
+            )
+            return "model", pd.DataFrame({"setup": [1]}), pd.DataFrame(), version
+
+        monkeypatch.setattr(MLTrainer, "train_regression_model", staticmethod(fake_train))
+        return runs
+
+    def test_identical_request_is_served_from_cache(self, runs):
+        """Test that repeating a request does not retrain."""
+        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+
+        first = MLTrainer.train("Regression", df, "B")
+        second = MLTrainer.train("Regression", df.copy(), "B")
+
+        assert len(runs) == 1
+        assert second[3] == first[3]
+        assert second[1].equals(first[1])
+
+    def test_changed_inputs_retrain(self, runs):
+        """Test that different data, target or options miss the cache."""
+        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+
+        MLTrainer.train("Regression", df, "B")
+        MLTrainer.train("Regression", df.assign(A=[3, 2, 1]), "B")
+        MLTrainer.train("Regression", df, "A")
+        MLTrainer.train("Regression", df, "B", {"preset": "fast"})
+        MLTrainer.train("Regression", df, "B", use_cache=False)
+
+        assert len(runs) == 5
+
+    def test_pruned_version_retrains(self, runs, registry):
+        """Test that a cached result whose model was deleted is not reused."""
+        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+
+        version = MLTrainer.train("Regression", df, "B")[3]
+        registry.delete(version)
+
+        assert MLTrainer.train("Regression", df, "B")[3] != version
+        assert len(runs) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""
+Unit tests for model_registry module.
+"""
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.model_registry import ModelRegistry
+
+
+def fake_save_model(model, path):
+    """Stand-in for PyCaret's save_model, which appends .pkl to the path."""
+    Path(path + ".pkl").write_bytes(repr(model).encode())
+
+
+class TestModelRegistry:
+    """Test suite for ModelRegistry class."""
+
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": ["x", "y", "z"]})
+
+    @pytest.fixture
+    def leaderboard(self):
+        return pd.DataFrame({"Model": ["Linear Regression"], "R2": [0.9]}, index=["lr"])
+
+    def register(self, registry, df, leaderboard, analysis_type="Regression"):
+        version = registry.register(
+            {"weights": [1, 2]},
+            fake_save_model,
+            analysis_type,
+            df,
+            "B" if analysis_type != "Clustering" else None,
+            leaderboard,
+            training_seconds=1.5,
+        )
+        # Versions are ordered by creation time
+        time.sleep(0.01)
+        return version
+
+    def test_register_writes_model_and_metadata(self, tmp_path, df, leaderboard):
+        """Test that a registered version has its model file and metadata."""
+        registry = ModelRegistry(tmp_path)
+
+        version = self.register(registry, df, leaderboard)
+        metadata = registry.get(version)
+
+        assert registry.model_path(version).exists()
+        assert metadata["analysis_type"] == "Regression"
+        assert metadata["target"] == "B"
+        assert metadata["feature_schema"] == {"A": "float64"}
+        assert metadata["metrics"]["R2"] == 0.9
+        assert metadata["metrics"]["leaderboard_index"] == "lr"
+        assert metadata["n_rows"] == 3
+        assert metadata["model_size_bytes"] > 0
+        assert metadata["serialization"]["format"] == "mmap"
+
+    def test_failed_save_leaves_no_version(self, tmp_path, df, leaderboard):
+        """Test that a failing save does not leave a partial entry behind."""
+        registry = ModelRegistry(tmp_path)
+
+        def failing_save(model, path):
+            raise IOError("disk full")
+
+        version = registry.register(
+            "model", failing_save, "Regression", df, "B", leaderboard, 1.0
+        )
+
+        assert version is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_latest_per_analysis_type(self, tmp_path, df, leaderboard):
+        """Test that latest picks the newest version of the requested type."""
+        registry = ModelRegistry(tmp_path)
+        regression = self.register(registry, df, leaderboard)
+        clustering = self.register(registry, df, None, "Clustering")
+
+        assert registry.latest()["version"] == clustering
+        assert registry.latest("Regression")["version"] == regression
+        assert registry.latest("Classification") is None
+        assert [v["version"] for v in registry.list_versions()] == [
+            clustering,
+            regression,
+        ]
+
+    def test_retention_keeps_newest_of_each_type(self, tmp_path, df, leaderboard):
+        """Test that old versions are pruned but every type keeps its newest."""
+        registry = ModelRegistry(tmp_path, max_versions=2)
+        clustering = self.register(registry, df, None, "Clustering")
+        versions = [self.register(registry, df, leaderboard) for _ in range(3)]
+
+        remaining = [v["version"] for v in registry.list_versions()]
+
+        assert remaining == [versions[-1], clustering]
+        assert registry.get(versions[0]) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
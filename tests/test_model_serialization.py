@@ -0,0 +1,72 @@
+"""
+Unit tests for model_serialization module.
+"""
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import backend.model_serialization as model_serialization
+from backend.model_serialization import ModelSerializer
+
+
+@pytest.fixture
+def model():
+    """Picklable stand-in for a fitted pipeline with large parameters."""
+    return {"coef": np.arange(200_000, dtype=np.float64), "name": "linear"}
+
+
+class TestModelSerializer:
+    """Test suite for ModelSerializer class."""
+
+    def test_mmap_format_loads_memory_mapped_arrays(self, tmp_path, model):
+        """Test that mmap artifacts load arrays as read-only memory maps."""
+        path = tmp_path / "model.pkl"
+        joblib.dump(model, path, **ModelSerializer.save_kwargs("mmap"))
+
+        loaded = ModelSerializer.load(path, "mmap")
+
+        assert isinstance(loaded["coef"], np.memmap)
+        assert np.array_equal(loaded["coef"], model["coef"])
+
+    def test_compressed_format_is_smaller(self, tmp_path, model):
+        """Test that a compressed format writes a smaller artifact."""
+        results = ModelSerializer.benchmark(model, tmp_path, ["pickle", "zlib"])
+
+        assert results["zlib"]["size_bytes"] < results["pickle"]["size_bytes"]
+        assert all(stats["load_seconds"] >= 0 for stats in results.values())
+        assert list(tmp_path.iterdir()) == []
+
+    def test_missing_lz4_falls_back_to_zlib(self, monkeypatch):
+        """Test that the lz4 format degrades to zlib without the lz4 package."""
+        monkeypatch.setattr(
+            model_serialization.importlib.util, "find_spec", lambda name: None
+        )
+
+        assert ModelSerializer.resolve_format("lz4")["format"] == "zlib"
+
+    def test_unknown_format_is_rejected(self):
+        """Test that a typo in the configured format fails loudly."""
+        with pytest.raises(ValueError):
+            ModelSerializer.resolve_format("parquet")
+
+    def test_download_copy_is_gzip_and_loadable(self, tmp_path, model):
+        """Test that uncompressed models are downloaded as a loadable gzip copy."""
+        path = tmp_path / "model.pkl"
+        joblib.dump(model, path)
+
+        download = ModelSerializer.download_path(path, "mmap")
+
+        assert download != path
+        assert download.stat().st_size < path.stat().st_size
+        assert np.array_equal(joblib.load(download)["coef"], model["coef"])
+        assert ModelSerializer.download_path(path, "zlib") == path
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,142 @@
+"""
+Unit tests for onnx_export module.
+"""
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.model_registry import ModelRegistry
+from backend.onnx_export import ONNX_FILENAME, STATUS_FILENAME, OnnxExporter, OnnxScorer
+
+
+class FakeSession:
+    """Stand-in for an onnxruntime session of a binary classifier."""
+
+    def run(self, output_names, feeds):
+        features = next(iter(feeds.values()))
+        assert features.dtype == np.float32 and features.flags["C_CONTIGUOUS"]
+        labels = (features[:, 0] > 0).astype(np.int64)
+        probabilities = np.column_stack([1 - 0.7 * labels, 0.7 * labels])
+        return [labels, probabilities.astype(np.float32)]
+
+
+def make_scorer(analysis_type, feature_columns, classes=None):
+    """Build an OnnxScorer around a fake session without onnxruntime."""
+    scorer = OnnxScorer.__new__(OnnxScorer)
+    scorer.session = FakeSession()
+    scorer.input_name = "X"
+    scorer.output_names = ["label", "probabilities"]
+    scorer.analysis_type = analysis_type
+    scorer.feature_columns = feature_columns
+    scorer.classes = np.asarray(classes) if classes is not None else None
+    return scorer
+
+
+class TestOnnxScorer:
+    """Test suite for OnnxScorer class."""
+
+    def test_classification_output_matches_predict_model_columns(self):
+        """Test that labels are decoded and scores are max probabilities."""
+        scorer = make_scorer("Classification", ["a", "b"], classes=["no", "yes"])
+        df = pd.DataFrame({"b": [0.0, 0.0], "a": [1.0, -1.0], "id": [7, 8]})
+
+        result = scorer.predict(df)
+
+        assert list(result.columns) == [
+            "b", "a", "id", "prediction_label", "prediction_score"
+        ]
+        assert result["prediction_label"].tolist() == ["yes", "no"]
+        assert result["prediction_score"].tolist() == pytest.approx([0.7, 1.0])
+
+    def test_missing_feature_is_an_error(self):
+        """Test that inputs without a training column are rejected."""
+        with pytest.raises(KeyError):
+            make_scorer("Classification", ["a", "b"]).predict(pd.DataFrame({"a": [1.0]}))
+
+
+class TestOnnxExporter:
+    """Test suite for OnnxExporter class."""
+
+    def test_unavailable_runtime_is_recorded(self, tmp_path, monkeypatch):
+        """Test that a failed export leaves a status file and no ONNX model."""
+        monkeypatch.setattr(OnnxExporter, "is_available", staticmethod(lambda: False))
+
+        status = OnnxExporter.export(
+            object(), pd.DataFrame({"a": [1.0]}), "Regression", tmp_path
+        )
+
+        assert status["exported"] is False
+        assert "not installed" in status["error"]
+        assert not (tmp_path / ONNX_FILENAME).exists()
+        assert json.loads((tmp_path / STATUS_FILENAME).read_text()) == status
+
+    def test_non_numeric_features_are_rejected(self, tmp_path, monkeypatch):
+        """Test that categorical features make the export fall back to PyCaret."""
+        monkeypatch.setattr(OnnxExporter, "is_available", staticmethod(lambda: True))
+
+        status = OnnxExporter.export(
+            object(), pd.DataFrame({"a": [1.0], "c": ["x"]}), "Regression", tmp_path
+        )
+
+        assert status["exported"] is False
+        assert "['c']" in status["error"]
+
+    def test_to_sklearn_unwraps_full_width_steps(self):
+        """Test that wrapped steps over all columns become plain pipeline steps."""
+        pytest.importorskip("sklearn")
+        scaler, estimator = object(), object()
+        model = SimpleNamespace(
+            steps=[
+                ("label_encoding", SimpleNamespace(transformer=object())),
+                ("imputer", SimpleNamespace(transformer=object(), include=[])),
+                ("scaler", SimpleNamespace(transformer=scaler, include=["a", "b"])),
+                ("trained_model", estimator),
+            ]
+        )
+
+        pipeline = OnnxExporter._to_sklearn(model, ["a", "b"])
+
+        assert [step for _, step in pipeline.steps] == [scaler, estimator]
+
+    def test_to_sklearn_rejects_partial_steps(self):
+        """Test that steps over a subset of the columns cannot be exported."""
+        pytest.importorskip("sklearn")
+        model = SimpleNamespace(
+            steps=[
+                ("encoder", SimpleNamespace(transformer=object(), include=["a"])),
+                ("trained_model", object()),
+            ]
+        )
+
+        with pytest.raises(ValueError):
+            OnnxExporter._to_sklearn(model, ["a", "b"])
+
+
+class TestRegistryOnnx:
+    """Test suite for ONNX lookups in the model registry."""
+
+    def test_onnx_path_and_status(self, tmp_path):
+        """Test that exports are only reported once their files exist."""
+        registry = ModelRegistry(tmp_path)
+        (tmp_path / "v1").mkdir()
+
+        assert registry.onnx_path("v1") is None
+        assert registry.onnx_status("v1") is None
+
+        (tmp_path / "v1" / ONNX_FILENAME).write_bytes(b"onnx")
+        (tmp_path / "v1" / STATUS_FILENAME).write_text('{"exported": true}')
+
+        assert registry.onnx_path("v1") == tmp_path / "v1" / ONNX_FILENAME
+        assert registry.onnx_status("v1") == {"exported": True}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
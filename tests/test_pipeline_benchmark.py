@@ -0,0 +1,54 @@
+"""
+Unit tests for the pipeline benchmark helpers.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.pipeline_benchmark import compare_to_baseline, make_dataset
+
+
+class TestPipelineBenchmark:
+    """Test suite for synthetic data and baseline comparison."""
+
+    def test_make_dataset_is_reproducible(self):
+        """Test that the same seed yields the same dataset."""
+        first = make_dataset("Classification", 200, 5)
+        assert first.equals(make_dataset("Classification", 200, 5))
+        assert first.shape == (200, 7)
+        assert set(first["target"]) <= {0, 1}
+
+    def test_clustering_dataset_has_no_target(self):
+        """Test that clustering data only contains features."""
+        assert "target" not in make_dataset("Clustering", 100, 3)
+
+    def test_compare_to_baseline(self):
+        """Test that only slowdowns beyond the threshold are reported."""
+        baseline = {
+            "benchmarks": {
+                "train/Regression/small": {"median_seconds": 10.0},
+                "predict/Regression/small": {"median_seconds": 1.0},
+            },
+            "thresholds": {"predict/Regression/small": 0.5},
+        }
+        results = {
+            "train/Regression/small": {"median_seconds": 12.5},
+            "predict/Regression/small": {"median_seconds": 1.4},
+            "profile/small": {"median_seconds": 99.0},
+        }
+
+        regressions = compare_to_baseline(results, baseline, threshold=0.2)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("train/Regression/small")
+        assert compare_to_baseline(
+            results, baseline, overrides={"train/Regression/small": 0.3}
+        ) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+"""
+Unit tests for profiling module.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import backend.profiling as profiling
+from backend.profiling import DataProfiler, ProfileCache
+
+
+class TestProfileCache:
+    """Test suite for ProfileCache class."""
+
+    def test_key_depends_on_data_and_settings(self):
+        """Test that the key changes with dataset contents and settings."""
+        df = pd.DataFrame({"A": [1, 2, 3]})
+        key = ProfileCache.make_key(df)
+        assert ProfileCache.make_key(df.copy()) == key
+        assert ProfileCache.make_key(pd.DataFrame({"A": [3, 2, 1]})) != key
+        assert ProfileCache.make_key(df, {"minimal": True}) != key
+
+    def test_put_and_get(self, tmp_path):
+        """Test storing and retrieving a report."""
+        cache = ProfileCache(cache_dir=tmp_path, max_bytes=1024)
+        assert cache.get("missing") is None
+        assert cache.put("abc", "<html>report</html>") is True
+        assert cache.get("abc") == "<html>report</html>"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest entry is evicted once over budget."""
+        cache = ProfileCache(cache_dir=tmp_path, max_bytes=25)
+        cache.put("old", "x" * 10)
+        cache.put("new", "y" * 10)
+        os.utime(tmp_path / "old.html", (1, 1))
+        os.utime(tmp_path / "new.html", (2, 2))
+
+        cache.put("newest", "z" * 10)
+
+        assert cache.get("old") is None
+        assert cache.get("new") == "y" * 10
+        assert cache.get("newest") == "z" * 10
+
+
+class TestDataProfiler:
+    """Test suite for DataProfiler class."""
+
+    def test_get_profile_html_uses_cache(self, tmp_path, monkeypatch):
+        """Test that the report is generated only once per dataset."""
+        calls = []
+
+        def fake_generate(df, settings=None):
+            calls.append(settings)
+            return object()
+
+        monkeypatch.setattr(DataProfiler, "generate_profile_report", fake_generate)
+        monkeypatch.setattr(DataProfiler, "profile_to_html", lambda report: "<html/>")
+
+        cache = ProfileCache(cache_dir=tmp_path)
+        df = pd.DataFrame({"A": [1, 2, 3]})
+
+        assert DataProfiler.get_profile_html(df, cache=cache) == "<html/>"
+        assert DataProfiler.get_profile_html(df.copy(), cache=cache) == "<html/>"
+        assert len(calls) == 1
+
+
+    def test_choose_profile_mode(self, monkeypatch):
+        """Test that the mode is chosen from the dataset shape."""
+        monkeypatch.setattr(profiling, "PROFILE_SAMPLE_ROWS", 10)
+        monkeypatch.setattr(profiling, "PROFILE_MINIMAL_COLUMNS", 3)
+        assert DataProfiler.choose_profile_mode(pd.DataFrame({"A": range(5)})) == "full"
+        assert DataProfiler.choose_profile_mode(pd.DataFrame({"A": range(50)})) == "sampled"
+        wide = pd.DataFrame({c: range(5) for c in "ABCD"})
+        assert DataProfiler.choose_profile_mode(wide) == "minimal"
+
+    def test_build_profile_settings(self):
+        """Test that minimal mode and skipped sections map to YData settings."""
+        settings = DataProfiler.build_profile_settings("minimal", ["duplicates"])
+        assert settings["minimal"] is True
+        assert settings["duplicates"] == {"head": 0}
+        assert DataProfiler.build_profile_settings("full") == {}
+
+    def test_stratified_sample_keeps_proportions(self):
+        """Test that stratified sampling keeps each group's share."""
+        df = pd.DataFrame({"label": ["a"] * 900 + ["b"] * 100, "x": range(1000)})
+        sample = DataProfiler.sample_for_profiling(df, n_rows=100, stratify_by="label")
+        assert sample["label"].value_counts().to_dict() == {"a": 90, "b": 10}
+
+    def test_sample_returns_small_frames_unchanged(self):
+        """Test that frames under the sample size are not sampled."""
+        df = pd.DataFrame({"x": range(10)})
+        assert DataProfiler.sample_for_profiling(df, n_rows=100) is df
+
+    def test_sampled_mode_profiles_sample(self, tmp_path, monkeypatch):
+        """Test that sampled mode generates the report from a sample."""
+        profiled = []
+
+        def fake_generate(df, settings=None):
+            profiled.append((len(df), settings))
+            return object()
+
+        monkeypatch.setattr(profiling, "PROFILE_SAMPLE_ROWS", 10)
+        monkeypatch.setattr(DataProfiler, "generate_profile_report", fake_generate)
+        monkeypatch.setattr(DataProfiler, "profile_to_html", lambda report: "<html/>")
+
+        df = pd.DataFrame({"A": range(100)})
+        DataProfiler.get_profile_html(df, mode="auto", cache=ProfileCache(tmp_path))
+
+        rows, settings = profiled[0]
+        assert rows == 10
+        assert "interactions" in settings
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
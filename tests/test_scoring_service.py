@@ -0,0 +1,132 @@
+"""
+Unit tests for scoring_service module.
+"""
+import json
+import sys
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.scoring_service import MicroBatcher, ScoringServer, parse_payload
+
+
+def double_predict(df):
+    """Stand-in for MLPredictor.predict that appends a prediction column."""
+    return df.assign(prediction_label=df["A"] * 2)
+
+
+class TestMicroBatcher:
+    """Test suite for MicroBatcher class."""
+
+    def test_concurrent_requests_share_a_predict_call(self):
+        """Test that concurrent requests are coalesced and split correctly."""
+        calls = []
+        release = threading.Event()
+
+        def predict(df):
+            calls.append(len(df))
+            release.wait(5)
+            return double_predict(df)
+
+        batcher = MicroBatcher(predict, max_batch_rows=1000, max_wait_ms=200)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(batcher.submit, pd.DataFrame({"A": [i, i + 1]}))
+                for i in range(4)
+            ]
+            release.set()
+            results = [future.result(timeout=10) for future in futures]
+
+        for i, result in enumerate(results):
+            assert result["prediction_label"].tolist() == [2 * i, 2 * (i + 1)]
+        assert sum(calls) == 8
+        assert len(calls) < 4
+
+    def test_failed_prediction_raises(self):
+        """Test that a failed predict call is reported to the caller."""
+        batcher = MicroBatcher(lambda df: None, max_wait_ms=1)
+        with pytest.raises(RuntimeError):
+            batcher.submit(pd.DataFrame({"A": [1]}))
+
+    def test_bad_request_fails_alone(self):
+        """Test that a request breaking the batch doesn't fail its neighbours."""
+        release = threading.Event()
+
+        def predict(df):
+            release.wait(5)
+            if (df["A"] < 0).any():
+                raise ValueError("negative input")
+            return double_predict(df)
+
+        batcher = MicroBatcher(predict, max_batch_rows=1000, max_wait_ms=200)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(batcher.submit, pd.DataFrame({"A": [value]}))
+                for value in (1, -1, 2)
+            ]
+            release.set()
+
+            assert futures[0].result(timeout=10)["prediction_label"].tolist() == [2]
+            assert futures[2].result(timeout=10)["prediction_label"].tolist() == [4]
+            with pytest.raises(ValueError):
+                futures[1].result(timeout=10)
+
+
+class TestPayloads:
+    """Test suite for request payload parsing."""
+
+    def test_parse_json_variants(self):
+        """Test the accepted JSON layouts."""
+        records = [{"A": 1}, {"A": 2}]
+        assert parse_payload(json.dumps(records).encode(), "application/json")["A"].tolist() == [1, 2]
+        body = json.dumps({"records": records}).encode()
+        assert len(parse_payload(body, "application/json")) == 2
+        body = json.dumps({"columns": ["A"], "data": [[1], [2]]}).encode()
+        assert parse_payload(body, "application/json")["A"].tolist() == [1, 2]
+
+    def test_parse_csv(self):
+        """Test CSV payloads."""
+        df = parse_payload(b"A,B\n1,x\n2,y\n", "text/csv; charset=utf-8")
+        assert df["B"].tolist() == ["x", "y"]
+
+
+class TestScoringServer:
+    """Test suite for the HTTP endpoints."""
+
+    @pytest.fixture
+    def server(self):
+        server = ScoringServer(("127.0.0.1", 0), "Regression", predict_fn=double_predict)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_predict_and_metrics(self, server):
+        """Test scoring a JSON request and reading the metrics endpoint."""
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        request = urllib.request.Request(
+            f"{url}/predict",
+            data=json.dumps([{"A": 1}, {"A": 3}]).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request) as response:
+            body = json.loads(response.read())
+        assert [row["prediction_label"] for row in body["predictions"]] == [2, 6]
+
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            metrics = json.loads(response.read())
+        assert metrics["requests"] == 1
+        assert metrics["rows"] == 2
+        assert metrics["latency_ms"]["p50"] is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,186 @@
+"""
+Unit tests for training_jobs module.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.training_jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    TrainingJobManager,
+)
+
+
+def fake_train(analysis_type, df, target, options):
+    """Stand-in for MLTrainer.train that runs quickly in a worker process."""
+    return "model", df.head(1), pd.DataFrame({"target": [target]}), "v1"
+
+
+def slow_train(analysis_type, df, target, options):
+    """Stand-in for a long training run."""
+    time.sleep(30)
+    return "model", None, None
+
+
+def failing_train(analysis_type, df, target, options):
+    """Stand-in for a training run that fails inside MLTrainer."""
+    return None, None, None, None
+
+
+def counting_train(analysis_type, df, target, options):
+    """Stand-in for a training run that records each run in a log file."""
+    with open(options["log_path"], "a") as f:
+        f.write("run\n")
+    time.sleep(1)
+    return "model", None, None, f"v-{target}"
+
+
+def _slow_pid():
+    time.sleep(0.2)
+    return os.getpid()
+
+
+def parallel_train(analysis_type, df, target, options):
+    """Stand-in for a training run that fits with joblib, like PyCaret's n_jobs."""
+    from joblib import Parallel, delayed
+
+    pids = Parallel(n_jobs=2)(delayed(_slow_pid)() for _ in range(8))
+    return "model", None, None, len(set(pids))
+
+
+def wait_for(manager, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get_job(job_id)
+        if job.is_finished:
+            return job
+        time.sleep(0.1)
+    raise TimeoutError(job_id)
+
+
+class TestTrainingJobManager:
+    """Test suite for TrainingJobManager class."""
+
+    def test_job_succeeds(self):
+        """Test that a job runs in a worker and returns its result."""
+        manager = TrainingJobManager(max_workers=1, train_fn=fake_train)
+        df = pd.DataFrame({"A": [1, 2, 3]})
+
+        job = wait_for(manager, manager.submit("Regression", df, "A"))
+
+        assert job.status == JOB_SUCCEEDED
+        model, setup_df, compare_df, version = job.result
+        assert model == "model"
+        assert compare_df["target"].tolist() == ["A"]
+        assert version == "v1"
+
+    def test_failed_training_marks_job_failed(self):
+        """Test that a trainer returning no model fails the job."""
+        manager = TrainingJobManager(max_workers=1, train_fn=failing_train)
+
+        job = wait_for(manager, manager.submit("Regression", pd.DataFrame(), "A"))
+
+        assert job.status == JOB_FAILED
+
+    def test_worker_can_run_joblib_in_parallel(self):
+        """Test that workers are not daemons, where joblib drops to n_jobs=1."""
+        manager = TrainingJobManager(max_workers=1, train_fn=parallel_train)
+
+        job = wait_for(manager, manager.submit("Regression", pd.DataFrame(), "A"))
+
+        assert job.status == JOB_SUCCEEDED
+        assert job.result[3] > 1
+
+    def test_shutdown_terminates_running_workers(self):
+        """Test that shutdown stops workers that would outlive the process."""
+        manager = TrainingJobManager(max_workers=1, train_fn=slow_train)
+        job_id = manager.submit("Regression", pd.DataFrame({"A": [1]}), "A")
+        deadline = time.time() + 30
+        while manager.get_job(job_id).process is None and time.time() < deadline:
+            time.sleep(0.1)
+        process = manager.get_job(job_id).process
+
+        manager.shutdown()
+
+        assert wait_for(manager, job_id).status == JOB_CANCELLED
+        assert not process.is_alive()
+
+    def test_cancel_running_and_queued_jobs(self):
+        """Test cancelling both a running job and one waiting for a slot."""
+        # Separate runs: identical requests would otherwise share one
+        manager = TrainingJobManager(max_workers=1, train_fn=slow_train, coalesce=False)
+        df = pd.DataFrame({"A": [1]})
+        running_id = manager.submit("Regression", df, "A")
+        queued_id = manager.submit("Regression", df, "A")
+
+        assert manager.cancel(queued_id) is True
+        assert manager.cancel(running_id) is True
+
+        assert wait_for(manager, running_id).status == JOB_CANCELLED
+        assert wait_for(manager, queued_id).status == JOB_CANCELLED
+        assert manager.cancel(running_id) is False
+
+
+class TestRequestCoalescing:
+    """Test suite for sharing runs between identical training requests."""
+
+    def test_identical_requests_share_one_run(self, tmp_path):
+        """Test that an identical submit attaches to the run in flight."""
+        log_path = tmp_path / "runs.log"
+        manager = TrainingJobManager(max_workers=2, train_fn=counting_train)
+        df = pd.DataFrame({"A": [1, 2, 3]})
+        options = {"log_path": str(log_path)}
+
+        first_id = manager.submit("Regression", df, "A", options)
+        second_id = manager.submit("Regression", df.copy(), "A", dict(options))
+        other_id = manager.submit("Regression", df, "B", options)
+
+        first, second = wait_for(manager, first_id), wait_for(manager, second_id)
+        other = wait_for(manager, other_id)
+        assert first_id != second_id
+        assert not first.coalesced and second.coalesced and not other.coalesced
+        assert first.status == second.status == JOB_SUCCEEDED
+        assert second.result[3] == "v-A" and other.result[3] == "v-B"
+        assert log_path.read_text().count("run") == 2
+
+    def test_cancelling_one_job_keeps_the_shared_run(self, tmp_path):
+        """Test that a run continues while another job is attached to it."""
+        manager = TrainingJobManager(max_workers=1, train_fn=counting_train)
+        df = pd.DataFrame({"A": [1]})
+        options = {"log_path": str(tmp_path / "runs.log")}
+        first_id = manager.submit("Regression", df, "A", options)
+        second_id = manager.submit("Regression", df, "A", options)
+
+        assert manager.cancel(first_id) is True
+
+        assert manager.get_job(first_id).status == JOB_CANCELLED
+        assert wait_for(manager, second_id).status == JOB_SUCCEEDED
+
+    def test_coalescing_can_be_disabled(self, tmp_path):
+        """Test that every submit gets its own run without coalescing."""
+        log_path = tmp_path / "runs.log"
+        manager = TrainingJobManager(
+            max_workers=2, train_fn=counting_train, coalesce=False
+        )
+        df = pd.DataFrame({"A": [1]})
+        job_ids = [
+            manager.submit("Regression", df, "A", {"log_path": str(log_path)})
+            for _ in range(2)
+        ]
+
+        statuses = [wait_for(manager, job_id).status for job_id in job_ids]
+        assert statuses == [JOB_SUCCEEDED, JOB_SUCCEEDED]
+        assert log_path.read_text().count("run") == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Dataset selector UI component for AutoLearn.
+"""
+import time
+from typing import Any, Dict, Optional
+
+import pandas as pd
+import streamlit as st
+
+from backend.data_handler import DatasetCatalog
+
+
+def _describe_version(metadata: Dict[str, Any]) -> str:
+    """Build a one-line label for a dataset version."""
+    created = time.strftime("%Y-%m-%d %H:%M", time.localtime(metadata["created_at"]))
+    size_mb = metadata["size_bytes"] / 1_000_000
+    return (
+        f"{metadata['version']} | {metadata['n_rows']:,} rows x "
+        f"{metadata['n_columns']} columns | {created} | {size_mb:.1f} MB"
+    )
+
+
+def render_dataset_selector() -> Optional[pd.DataFrame]:
+    """
+    Render sidebar selectboxes of catalog datasets and their versions.
+
+    The selection is kept in st.session_state.dataset (the version's
+    metadata), so every page of the session works on the same dataset.
+    Only the selected version is loaded.
+
+    Returns:
+        The selected dataset, or None if the catalog is empty.
+    """
+    catalog = DatasetCatalog()
+    names = [metadata["name"] for metadata in catalog.list_datasets()]
+    if not names:
+        st.session_state.dataset = None
+        return None
+
+    current = st.session_state.get("dataset") or {}
+    with st.sidebar:
+        name = st.selectbox(
+            "Dataset",
+            names,
+            index=names.index(current["name"]) if current.get("name") in names else 0,
+        )
+        versions = catalog.list_versions(name)
+        ids = [metadata["version"] for metadata in versions]
+        index = 0
+        if current.get("name") == name and current.get("version") in ids:
+            index = ids.index(current["version"])
+        selected = st.selectbox(
+            "Dataset version", versions, index=index, format_func=_describe_version
+        )
+
+    st.session_state.dataset = selected
+    return catalog.load(name, selected["version"])
+
+
+def load_selected_dataset() -> Optional[pd.DataFrame]:
+    """
+    Load the dataset selected on the Upload or ML page.
+
+    Returns:
+        The selected dataset, or None if none is selected.
+    """
+    selected = st.session_state.get("dataset")
+    if not selected:
+        return None
+    return DatasetCatalog().load(selected["name"], selected["version"])
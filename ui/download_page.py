@@ -4,22 +4,77 @@ Handles model download interface.
 """
 import streamlit as st
 
-from config import BEST_MODEL_PATH
+from backend.ml_predictor import MLPredictor
+from backend.model_registry import ModelRegistry
+from backend.model_serialization import LEGACY_FORMAT, ModelSerializer
+from backend.onnx_export import OnnxExporter
+from ui.dataset_selector import load_selected_dataset
+from ui.model_selector import render_model_version_selector
 
 
 def render_download_page() -> None:
     """Render the model download page."""
     st.title("Download Trained Model")
 
-    if not BEST_MODEL_PATH.exists():
-        st.warning(
-            "No trained model found. Please train a model first using the ML page."
-        )
+    metadata = render_model_version_selector()
+    if metadata is None:
         st.stop()
 
+    with st.expander("Version details"):
+        st.json(metadata)
+
     try:
-        with open(BEST_MODEL_PATH, "rb") as f:
-            st.download_button("Download the Model", f, "trained_model.pkl")
-        st.success("Model is ready for download!")
+        model_path = ModelSerializer.download_path(
+            ModelRegistry().model_path(metadata["version"]),
+            metadata.get("serialization", {}).get("format", LEGACY_FORMAT),
+        )
+        with open(model_path, "rb") as f:
+            st.download_button(
+                "Download the Model", f, f"{metadata['version']}.pkl"
+            )
+        st.success(
+            f"Model is ready for download ({model_path.stat().st_size / 1e6:,.1f} MB)! "
+            "Load it with PyCaret's load_model or joblib.load."
+        )
     except Exception as e:
         st.error(f"Error loading model for download: {e}")
+
+    _render_onnx_export(metadata)
+
+
+def _render_onnx_export(metadata: dict) -> None:
+    """Offer the version's ONNX export, or export it on request."""
+    st.subheader("ONNX Export")
+    registry = ModelRegistry()
+    version = metadata["version"]
+
+    onnx_path = registry.onnx_path(version)
+    if onnx_path is not None:
+        with open(onnx_path, "rb") as f:
+            st.download_button("Download as ONNX", f, f"{version}.onnx")
+        st.caption(
+            "Scores with onnxruntime alone, without PyCaret. Predictions were "
+            "checked against PyCaret's."
+        )
+        return
+
+    status = registry.onnx_status(version)
+    if status is not None:
+        st.warning(f"This model could not be exported to ONNX: {status.get('error')}")
+        return
+    if not OnnxExporter.is_available():
+        st.info("Install the onnx extra (skl2onnx, onnxruntime) to export models to ONNX.")
+        return
+
+    if st.button("Export to ONNX"):
+        # The export needs rows with the training columns for its parity check
+        df = load_selected_dataset()
+        if df is None or not set(metadata["feature_schema"]) <= set(df.columns):
+            st.error("Select a dataset with the model's training columns to export it.")
+            return
+        with st.spinner("Exporting to ONNX and checking predictions..."):
+            status = MLPredictor.export_onnx(version, df)
+        if status["exported"]:
+            st.experimental_rerun()
+        else:
+            st.warning(f"This model could not be exported to ONNX: {status.get('error')}")
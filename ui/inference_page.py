@@ -7,35 +7,51 @@ import pandas as pd
 
 from backend.data_handler import DataHandler
 from backend.ml_predictor import MLPredictor
+from config import INFERENCE_CHUNK_SIZE, INFERENCE_STREAMING_THRESHOLD_BYTES
+from ui.model_selector import render_model_version_selector
 
 
 def render_inference_page() -> None:
     """Render the model inference page."""
     st.title("Upload Your Data for Predictions")
 
-    if not st.session_state.get("analysis_type"):
-        st.warning(
-            "No trained model found. Please train a model first using the ML page."
-        )
+    metadata = render_model_version_selector()
+    if metadata is None:
         st.stop()
+    analysis_type = metadata["analysis_type"]
+    version = metadata["version"]
 
     file = st.file_uploader("Upload a CSV file", type=["csv"])
 
     if file:
-        df_inference = pd.read_csv(file, index_col=False)
+        streaming = st.checkbox(
+            "Stream predictions in chunks (for large files)",
+            value=file.size > INFERENCE_STREAMING_THRESHOLD_BYTES,
+        )
+        if streaming:
+            chunk_size = st.number_input(
+                "Rows per chunk", min_value=1_000, value=INFERENCE_CHUNK_SIZE, step=1_000
+            )
+            _predict_streaming(file, int(chunk_size), analysis_type, version)
+            return
+
+        # Match the dtypes the model was trained on
+        df_inference = DataHandler.apply_schema(
+            DataHandler.import_csv(file), metadata.get("feature_schema", {})
+        )
         st.success("CSV file uploaded successfully for predictions!")
 
         predictor = MLPredictor()
         predictions = None
 
-        if st.session_state.analysis_type == "Regression":
-            predictions = _predict_regression(predictor, df_inference)
+        if analysis_type == "Regression":
+            predictions = _predict_regression(predictor, df_inference, version)
 
-        elif st.session_state.analysis_type == "Classification":
-            predictions = _predict_classification(predictor, df_inference)
+        elif analysis_type == "Classification":
+            predictions = _predict_classification(predictor, df_inference, version)
 
-        elif st.session_state.analysis_type == "Clustering":
-            predictions = _predict_clustering(predictor, df_inference)
+        elif analysis_type == "Clustering":
+            predictions = _predict_clustering(predictor, df_inference, version)
 
         if predictions is not None:
             st.subheader("Predictions:")
@@ -47,12 +63,49 @@ def render_inference_page() -> None:
                 st.error("Failed to save predictions.")
 
 
+def _predict_streaming(
+    file, chunk_size: int, analysis_type: str, version: str
+) -> None:
+    """Score the uploaded file chunk by chunk, showing progress and throughput."""
+    progress = st.progress(0.0, text="Scoring...")
+    preview = st.empty()
+
+    def on_chunk(rows_done: int, elapsed: float, predictions: pd.DataFrame) -> None:
+        fraction = min(file.tell() / file.size, 1.0) if file.size else 0.0
+        rate = rows_done / elapsed if elapsed > 0 else 0.0
+        progress.progress(
+            fraction, text=f"Scored {rows_done:,} rows ({rate:,.0f} rows/sec)"
+        )
+        if rows_done == len(predictions):
+            with preview.container():
+                st.subheader("Predictions (first chunk preview):")
+                st.write(predictions.head(100))
+
+    stats = MLPredictor.predict_stream(
+        analysis_type,
+        DataHandler.iter_csv_chunks(file, chunk_size),
+        on_chunk=on_chunk,
+        version=version,
+    )
+
+    if stats is None:
+        st.error("Failed to make streaming predictions. Check logs for details.")
+        return
+
+    progress.progress(1.0, text="Scoring complete")
+    st.success(
+        f"Scored {stats['rows']:,} rows in {stats['chunks']} chunks "
+        f"({stats['seconds']:.1f}s, {stats['rows_per_sec']:,.0f} rows/sec). "
+        "Predictions saved to data/predictions.csv"
+    )
+
+
 def _predict_regression(
-    predictor: MLPredictor, df: pd.DataFrame
+    predictor: MLPredictor, df: pd.DataFrame, version: str
 ) -> pd.DataFrame:
     """Make regression predictions."""
     st.success("Regression Best Model loaded successfully for predictions!")
-    predictions = predictor.predict_regression(df)
+    predictions = predictor.predict_regression(df, version)
 
     if predictions is None:
         st.error("Failed to make regression predictions. Check logs for details.")
@@ -61,11 +114,11 @@ def _predict_regression(
 
 
 def _predict_classification(
-    predictor: MLPredictor, df: pd.DataFrame
+    predictor: MLPredictor, df: pd.DataFrame, version: str
 ) -> pd.DataFrame:
     """Make classification predictions."""
     st.success("Classification Best Model loaded successfully for predictions!")
-    predictions = predictor.predict_classification(df)
+    predictions = predictor.predict_classification(df, version)
 
     if predictions is None:
         st.error("Failed to make classification predictions. Check logs for details.")
@@ -74,11 +127,11 @@ def _predict_classification(
 
 
 def _predict_clustering(
-    predictor: MLPredictor, df: pd.DataFrame
+    predictor: MLPredictor, df: pd.DataFrame, version: str
 ) -> pd.DataFrame:
     """Make clustering predictions."""
     st.success("Clustering Best Model loaded successfully for predictions!")
-    predictions = predictor.predict_clustering(df)
+    predictions = predictor.predict_clustering(df, version)
 
     if predictions is None:
         st.error("Failed to make clustering predictions. Check logs for details.")
@@ -2,11 +2,28 @@
 ML page UI component for AutoLearn.
 Handles ML model training interface.
 """
+import json
+import time
+from typing import List, Optional
+
 import streamlit as st
 import pandas as pd
 
-from backend.ml_trainer import MLTrainer
-from config import ANALYSIS_TYPES
+from backend.model_registry import ModelRegistry
+from backend.training_jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    TrainingJob,
+    get_job_manager,
+)
+from config import (
+    ANALYSIS_TYPES,
+    DEFAULT_TRAINING_PRESET,
+    TRAINING_POLL_INTERVAL_SECONDS,
+    TRAINING_PRESETS,
+    TUNING_STRATEGIES,
+)
 
 
 def render_ml_page(df: pd.DataFrame) -> None:
@@ -28,65 +45,208 @@ def render_ml_page(df: pd.DataFrame) -> None:
 
     st.session_state.analysis_type = st.radio("Select Analysis Type", ANALYSIS_TYPES)
 
-    if st.button("Run Model"):
-        trainer = MLTrainer()
-
-        if st.session_state.analysis_type == "Regression":
-            _train_regression(trainer, df, target)
-
-        elif st.session_state.analysis_type == "Classification":
-            _train_classification(trainer, df, target)
-
-        elif st.session_state.analysis_type == "Clustering":
-            _train_clustering(trainer, df)
-
-
-def _train_regression(trainer: MLTrainer, df: pd.DataFrame, target: str) -> None:
-    """Train regression model and display results."""
-    best_model, setup_df, compare_df = trainer.train_regression_model(df, target)
-
-    if best_model and setup_df is not None and compare_df is not None:
-        st.info("This is the ML Experiment Settings")
-        st.dataframe(setup_df)
-
-        st.info("This is the Model Comparison")
-        st.dataframe(compare_df)
+    options = _render_training_options()
 
-        st.success("Regression model trained and saved successfully!")
-    else:
-        st.error("Failed to train regression model. Check logs for details.")
+    manager = get_job_manager()
 
+    if st.button("Run Model"):
+        st.session_state.training_job_id = manager.submit(
+            st.session_state.analysis_type, df, target, options
+        )
+
+    job_id = st.session_state.get("training_job_id")
+    if job_id:
+        job = manager.get_job(job_id)
+        if job is None:
+            st.session_state.training_job_id = None
+        else:
+            _render_training_job(job)
+
+
+def _render_training_options() -> dict:
+    """Render preset selection and overrides, returning the training options."""
+    presets = list(TRAINING_PRESETS)
+    preset = st.selectbox(
+        "Training Preset (fast trades accuracy for speed)",
+        presets,
+        index=presets.index(DEFAULT_TRAINING_PRESET),
+    )
+    defaults = TRAINING_PRESETS[preset]
+
+    with st.expander("Advanced Training Options"):
+        fold = st.number_input(
+            "Cross-validation folds", min_value=2, max_value=20, value=defaults["fold"]
+        )
+        budget_time = st.number_input(
+            "Time budget per comparison in minutes (0 = unlimited)",
+            min_value=0.0,
+            value=float(defaults["budget_time"] or 0),
+        )
+        n_jobs = st.number_input(
+            "Parallel jobs (-1 = all cores)", min_value=-1, value=defaults["n_jobs"]
+        )
+        include = st.text_input("Only compare these model ids (comma separated)")
+        exclude = st.text_input("Skip these model ids (comma separated)")
+
+        strategies = list(TUNING_STRATEGIES)
+        tune = st.selectbox(
+            "Tuning strategy",
+            strategies,
+            index=strategies.index(defaults["tune"]),
+            help=(
+                "tpe-asha stops weak trials early only for models that support "
+                "partial_fit (e.g. sgd, mlp); otherwise it behaves like tpe."
+            ),
+        )
+        tune_n_iter = st.number_input(
+            "Tuning iterations", min_value=1, value=defaults["tune_n_iter"]
+        )
+        tune_budget_time = st.number_input(
+            "Tuning time budget in minutes (0 = unlimited)",
+            min_value=0.0,
+            value=float(defaults["tune_budget_time"] or 0),
+        )
+
+        sample_rows = st.number_input(
+            "Select models on a sample above this many rows (0 = use all rows)",
+            min_value=0,
+            value=defaults["sample_rows"] or 0,
+            step=10_000,
+        )
+        refit_full = st.checkbox(
+            "Refit the selected model on all rows", value=defaults["refit_full"]
+        )
+        export_onnx = st.checkbox(
+            "Also export to ONNX (numeric features only)",
+            value=defaults["export_onnx"],
+        )
+
+    return {
+        "preset": preset,
+        "fold": int(fold),
+        "budget_time": budget_time,
+        "n_jobs": int(n_jobs) or -1,
+        "include": _parse_model_ids(include),
+        "exclude": _parse_model_ids(exclude),
+        "tune": tune,
+        "tune_n_iter": int(tune_n_iter),
+        "tune_budget_time": tune_budget_time,
+        "sample_rows": int(sample_rows),
+        "refit_full": refit_full,
+        "export_onnx": export_onnx,
+    }
+
+
+def _parse_model_ids(text: str) -> Optional[List[str]]:
+    """Split a comma separated list of model ids, returning None when empty."""
+    model_ids = [model_id.strip() for model_id in text.split(",") if model_id.strip()]
+    return model_ids or None
+
+
+def _render_training_job(job: TrainingJob) -> None:
+    """Show the status of a background training job and its results when done."""
+    if not job.is_finished:
+        st.info(
+            f"Training {job.analysis_type.lower()} model in the background "
+            f"({job.status}, {job.elapsed_seconds:.0f}s elapsed)..."
+        )
+        if job.coalesced:
+            st.caption(
+                "An identical training request was already running, so this "
+                "page shares its result instead of training again."
+            )
+        if st.button("Cancel Training"):
+            get_job_manager().cancel(job.job_id)
+            st.experimental_rerun()
+
+        # Poll for completion; widget interactions interrupt the wait
+        time.sleep(TRAINING_POLL_INTERVAL_SECONDS)
+        st.experimental_rerun()
+
+    if job.status == JOB_CANCELLED:
+        st.warning(f"{job.analysis_type} training was cancelled.")
+
+    elif job.status == JOB_FAILED:
+        st.error(
+            f"Failed to train {job.analysis_type.lower()} model: {job.error}. "
+            "Check logs for details."
+        )
+
+    elif job.status == JOB_SUCCEEDED:
+        if job.analysis_type == "Regression":
+            _show_regression_results(*job.result)
+
+        elif job.analysis_type == "Classification":
+            _show_classification_results(*job.result)
+
+        elif job.analysis_type == "Clustering":
+            _show_clustering_results(*job.result)
+
+        _show_run_report(job.result[3])
+
+
+def _show_run_report(version: str) -> None:
+    """Display the per-stage timing breakdown recorded for a model version."""
+    metadata = ModelRegistry().get(version)
+    run_report = (metadata or {}).get("run_report")
+    if not run_report:
+        return
+
+    with st.expander(f"Timing Breakdown ({run_report['wall_seconds']:.1f}s total)"):
+        stages = pd.DataFrame(run_report["stages"]).set_index("stage")
+        st.bar_chart(stages["wall_seconds"])
+        st.dataframe(stages)
+
+        if run_report["candidates"]:
+            st.write("Per-candidate fit time")
+            candidates = pd.DataFrame(run_report["candidates"])
+            st.dataframe(candidates.sort_values("fit_seconds", ascending=False))
+
+        st.download_button(
+            "Download Run Report (JSON)",
+            json.dumps(run_report, indent=2),
+            f"{version}_run_report.json",
+            mime="application/json",
+        )
+
+
+def _show_regression_results(
+    best_model, setup_df: pd.DataFrame, compare_df: pd.DataFrame, version: str
+) -> None:
+    """Display regression training results."""
+    st.info("This is the ML Experiment Settings")
+    st.dataframe(setup_df)
+
+    st.info("This is the Model Comparison")
+    st.dataframe(compare_df)
+
+    st.success(f"Regression model trained and saved as version {version}!")
+
+
+def _show_classification_results(
+    tuned_model, setup_df: pd.DataFrame, compare_df: pd.DataFrame, version: str
+) -> None:
+    """Display classification training results."""
+    st.info("This is the ML Experiment Settings")
+    st.dataframe(setup_df)
+
+    st.info("This is the Model Comparison")
+    st.dataframe(compare_df)
 
-def _train_classification(trainer: MLTrainer, df: pd.DataFrame, target: str) -> None:
-    """Train classification model and display results."""
-    tuned_model, setup_df, compare_df = trainer.train_classification_model(df, target)
-
-    if tuned_model and setup_df is not None and compare_df is not None:
-        st.info("This is the ML Experiment Settings")
-        st.dataframe(setup_df)
-
-        st.info("This is the Model Comparison")
-        st.dataframe(compare_df)
-
-        st.info("Fine tuned the best model...")
-        st.write(tuned_model)
-
-        st.success("Classification model trained and saved successfully!")
-    else:
-        st.error("Failed to train classification model. Check logs for details.")
-
-
-def _train_clustering(trainer: MLTrainer, df: pd.DataFrame) -> None:
-    """Train clustering model and display results."""
-    best_model, setup_df, all_metrics_df = trainer.train_clustering_model(df)
-
-    if best_model and setup_df is not None and all_metrics_df is not None:
-        st.info("This is the Clustering Experiment Settings")
-        st.dataframe(setup_df)
+    st.info("Best model after tuning")
+    st.write(tuned_model)
 
-        st.info("This is the Model Comparison")
-        st.dataframe(all_metrics_df)
+    st.success(f"Classification model trained and saved as version {version}!")
+
+
+def _show_clustering_results(
+    best_model, setup_df: pd.DataFrame, all_metrics_df: pd.DataFrame, version: str
+) -> None:
+    """Display clustering training results."""
+    st.info("This is the Clustering Experiment Settings")
+    st.dataframe(setup_df)
+
+    st.info("This is the Model Comparison")
+    st.dataframe(all_metrics_df)
 
-        st.success("Clustering model trained and saved successfully!")
-    else:
-        st.error("Failed to train clustering model. Check logs for details.")
+    st.success(f"Clustering model trained and saved as version {version}!")
@@ -0,0 +1,37 @@
+"""
+Model version selector UI component for AutoLearn.
+"""
+import time
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+from backend.model_registry import ModelRegistry
+
+
+def _describe_version(metadata: Dict[str, Any]) -> str:
+    """Build a one-line label for a registered model version."""
+    created = time.strftime("%Y-%m-%d %H:%M", time.localtime(metadata["created_at"]))
+    target = f" -> {metadata['target']}" if metadata.get("target") else ""
+    size_mb = metadata["model_size_bytes"] / 1_000_000
+    return (
+        f"{metadata['version']} | {metadata['analysis_type']}{target} | "
+        f"{metadata['model_name']} | {created} | {size_mb:.1f} MB"
+    )
+
+
+def render_model_version_selector() -> Optional[Dict[str, Any]]:
+    """
+    Render a selectbox of registered model versions, newest first.
+
+    Returns:
+        Metadata of the selected version, or None if no model is registered.
+    """
+    versions = ModelRegistry().list_versions()
+    if not versions:
+        st.warning(
+            "No trained model found. Please train a model first using the ML page."
+        )
+        return None
+
+    return st.selectbox("Model version", versions, format_func=_describe_version)
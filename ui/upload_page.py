@@ -2,11 +2,15 @@
 Upload page UI component for AutoLearn.
 Handles data upload and profiling display.
 """
+from pathlib import Path
+from typing import Any, Dict, Optional
+
 import streamlit as st
 import pandas as pd
 
-from backend.data_handler import DataHandler
+from backend.data_handler import DataHandler, DatasetCatalog
 from backend.profiling import DataProfiler
+from config import PROFILE_MODES, PROFILE_SAMPLE_ROWS, PROFILE_SKIPPABLE_SECTIONS
 
 
 def render_upload_page(df: pd.DataFrame) -> pd.DataFrame:
@@ -14,33 +18,94 @@ def render_upload_page(df: pd.DataFrame) -> pd.DataFrame:
     Render the upload page with file upload and profiling.
 
     Args:
-        df: Current DataFrame (if any).
+        df: Currently selected dataset (if any).
 
     Returns:
         Updated DataFrame after upload (or existing df).
     """
     st.title("Upload Your Data for Modeling")
 
+    catalog = DatasetCatalog()
     file = st.file_uploader("Upload a CSV file", type=["csv"])
 
-    if file:
-        df = pd.read_csv(file, index_col=False)
-        if DataHandler.save_source_data(df):
-            st.success("Data uploaded successfully. Generating profiling report...")
-        # Invalidate cached profile when new data is uploaded
-        st.session_state.profile_report_html = None
+    # The uploader keeps its file across reruns, so only import a new upload once
+    if file and st.session_state.get("uploaded_file_key") != (file.name, file.size):
+        default_name = DatasetCatalog.normalize_name(Path(file.name).stem)
+        name = DatasetCatalog.normalize_name(
+            st.text_input("Dataset name", value=default_name)
+        )
+        append = catalog.latest(name) is not None and (
+            st.radio(
+                f"Dataset '{name}' exists",
+                ["Add as new version", "Append rows"],
+                horizontal=True,
+                help="Appending updates the column statistics from the new rows "
+                "only; the full profile report is then regenerated on request.",
+            )
+            == "Append rows"
+        )
+        if st.button("Save dataset"):
+            new_df, stats = DataHandler.optimize_dtypes(DataHandler.import_csv(file))
+            metadata = (
+                _append_rows(catalog, name, new_df)
+                if append
+                else catalog.add(name, new_df)
+            )
+            if metadata is not None:
+                st.session_state.dataset = metadata
+                df = catalog.load(metadata["name"], metadata["version"])
+                st.success(
+                    f"Saved {len(new_df):,} rows to dataset '{name}' "
+                    f"({len(df):,} rows in version {metadata['version']}; "
+                    f"{stats['bytes_before'] / 1e6:,.1f} MB in memory as parsed, "
+                    f"{stats['bytes_after'] / 1e6:,.1f} MB after dtype optimization)."
+                )
+            else:
+                st.error(
+                    "Could not save the dataset"
+                    + (": the columns must match the existing data." if append else ".")
+                )
+            st.session_state.uploaded_file_key = (file.name, file.size)
+            # After an append the full report waits until it is requested
+            if append and metadata is not None:
+                st.session_state.profile_report_deferred = metadata["version"]
+
+    selected = st.session_state.get("dataset")
+    if df is not None and selected:
+        data_path = catalog.data_path(selected["name"], selected["version"])
+        stats_path = catalog.stats_path(selected["name"], selected["version"])
+        with st.expander("Column Statistics", expanded=True):
+            st.dataframe(
+                DataProfiler.get_source_stats(df, data_path, stats_path).summary()
+            )
 
-    if df is not None:
-        # Generate the profile report only once per dataset version
-        if st.session_state.profile_report_html is None:
+        profile_options = _render_profile_options(df)
+        deferred = (
+            st.session_state.get("profile_report_deferred") == selected["version"]
+        )
+        if deferred and st.button("Generate full profile report"):
+            st.session_state.profile_report_deferred = deferred = None
+
+        # Reuse the on-disk cached report when this dataset was profiled before
+        report_key = (selected["version"], profile_options)
+        if not deferred and (
+            st.session_state.profile_report_html is None
+            or st.session_state.get("profile_report_options") != report_key
+        ):
             profiler = DataProfiler()
-            profile_report = profiler.generate_profile_report(df)
-            if profile_report:
-                st.session_state.profile_report_html = profiler.profile_to_html(
-                    profile_report
-                )
+            mode, skip_sections, stratify_by = profile_options
+            st.session_state.profile_report_html = profiler.get_profile_html(
+                df,
+                mode=mode,
+                skip_sections=list(skip_sections),
+                stratify_by=stratify_by,
+            )
+            st.session_state.profile_report_options = report_key
 
-        if st.session_state.profile_report_html:
+        if (
+            st.session_state.profile_report_html
+            and st.session_state.get("profile_report_options") == report_key
+        ):
             st.components.v1.html(
                 st.session_state.profile_report_html, height=800, scrolling=True
             )
@@ -48,3 +113,68 @@ def render_upload_page(df: pd.DataFrame) -> pd.DataFrame:
         st.info("Upload a CSV file to automatically generate a profile report.")
 
     return df
+
+
+def _append_rows(
+    catalog: DatasetCatalog, name: str, new_rows: pd.DataFrame
+) -> Optional[Dict[str, Any]]:
+    """
+    Append rows to a dataset and update its column statistics from the new rows.
+
+    Returns:
+        Metadata of the new dataset version, or None if the rows were rejected.
+    """
+    latest = catalog.latest(name)
+    previous = DataProfiler.load_source_stats(
+        catalog.data_path(name, latest["version"]),
+        catalog.stats_path(name, latest["version"]),
+    )
+    appended = catalog.append(name, new_rows)
+    if appended is None:
+        return None
+    metadata, combined = appended
+    DataProfiler.update_source_stats(
+        previous,
+        combined.tail(len(new_rows)),
+        combined,
+        data_path=catalog.data_path(name, metadata["version"]),
+        stats_path=catalog.stats_path(name, metadata["version"]),
+    )
+    return metadata
+
+
+def _render_profile_options(df: pd.DataFrame) -> tuple:
+    """
+    Render profiling mode controls and describe the mode that will be used.
+
+    Returns:
+        Tuple of (mode, skipped sections, stratify column).
+    """
+    auto_mode = DataProfiler.choose_profile_mode(df)
+    with st.expander("Profiling Options"):
+        choice = st.selectbox(
+            f"Profiling mode (auto selects '{auto_mode}' for this dataset)",
+            PROFILE_MODES,
+        )
+        mode = auto_mode if choice == "auto" else choice
+        skip_sections = st.multiselect(
+            "Skip expensive report sections",
+            list(PROFILE_SKIPPABLE_SECTIONS),
+            default=DataProfiler.default_skip_sections(mode),
+        )
+        stratify_by = None
+        if mode != "full" and len(df) > PROFILE_SAMPLE_ROWS:
+            stratify_by = st.selectbox(
+                "Stratify the sample by", [None] + list(df.columns)
+            )
+
+    description = f"Profiling mode: **{mode}**"
+    if mode != "full" and len(df) > PROFILE_SAMPLE_ROWS:
+        description += f" — sample of {PROFILE_SAMPLE_ROWS:,} of {len(df):,} rows"
+        if stratify_by is not None:
+            description += f", stratified by `{stratify_by}`"
+    if skip_sections:
+        description += f" — skipped: {', '.join(skip_sections)}"
+    st.info(description)
+
+    return mode, tuple(skip_sections), stratify_by